@@ -4,29 +4,52 @@ Run: streamlit run admin.py --server.port=8502
 """
 
 import os
-import json
+import hmac
+import hashlib
+import orjson
 import streamlit as st
 import pandas as pd
 from datetime import datetime
-from supabase import create_client
 
 from admin_helpers import (
-    load_companies_admin, create_company, update_company, delete_company,
+    create_admin_client,
+    load_companies_admin, get_company, create_company, update_company, delete_company,
     load_sectors_admin, get_sector_options, create_sector, update_sector, delete_sector,
     load_relationships_admin, create_relationship, delete_relationship,
     load_people_admin, create_person, delete_person,
     load_events_admin, create_event, update_event, delete_event,
     load_articles_admin, get_article_text, get_article_sources,
     load_extractions_admin, get_extraction_data,
-    load_review_queue_admin, approve_review, reject_review,
+    load_review_queue_admin, bulk_update_review,
     load_scraper_runs_admin,
-    load_pipeline_costs_admin, get_cost_summary,
-    get_overview_stats, get_company_options,
+    load_pipeline_costs_admin, load_costs_tab, summarize_costs,
+    load_overview_tab, get_company_options,
 )
 
 # ── Page config ──────────────────────────────────────────
 st.set_page_config(page_title="MIIM Admin", page_icon="⚙️", layout="wide")
 
+
+# ── Session state ────────────────────────────────────────
+def _init_session_state():
+    """Seed session keys owned by this page; never overwrites existing values."""
+    defaults = {
+        "admin_auth": False,
+        # Keyset pagination (see _paged_frame): one cursor per loaded page,
+        # plus the filters those cursors belong to
+        "art_cursors": [None],
+        "art_cursor_filters": None,
+        "runs_cursors": [None],
+        "runs_cursor_filters": None,
+        "costs_cursors": [None],
+        "costs_cursor_filters": None,
+    }
+    for k, v in defaults.items():
+        st.session_state.setdefault(k, v)
+
+
+_init_session_state()
+
 # ── Color palette (match app.py) ─────────────────────────
 NAVY = "#1B3A5C"
 TEAL = "#2A9D8F"
@@ -40,6 +63,10 @@ RELATIONSHIP_TYPES = ["partner", "client", "supplier", "subsidiary", "parent", "
 EVENT_TYPES = ["New Factory", "Partnership", "Investment", "Acquisition", "Export Milestone", "Expansion", "Closure", "IPO", "Other"]
 ROLE_TYPES = ["CEO", "CFO", "COO", "CTO", "Founder", "Director", "Board", "Manager", "Other"]
 
+ARTICLES_PAGE_SIZE = 50
+SCRAPER_RUNS_PAGE_SIZE = 50
+PIPELINE_COSTS_LIMIT = 100
+
 # ── Supabase client ──────────────────────────────────────
 SUPABASE_URL = os.environ.get("SUPABASE_URL", "https://rkqfjesnavbngtihffge.supabase.co")
 SUPABASE_ANON_KEY = os.environ.get(
@@ -50,14 +77,214 @@ SUPABASE_ANON_KEY = os.environ.get(
 
 @st.cache_resource
 def get_sb():
-    return create_client(SUPABASE_URL, SUPABASE_ANON_KEY)
+    return create_admin_client(SUPABASE_URL, SUPABASE_ANON_KEY)
 
 
 sb = get_sb()
 
+
+# ── Cached reads ─────────────────────────────────────────
+# Every widget interaction reruns the whole script, so read-only fetches are
+# memoized here; writes call _invalidate() before st.rerun(). Tables the
+# scraping pipeline writes to use shorter TTLs since admin writes never
+# invalidate them.
+@st.cache_data(ttl=15, show_spinner=False)
+def _overview_cached():
+    """Fetch the Overview tab's stats, runs and articles in one call."""
+    return load_overview_tab(get_sb(), limit=10)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _companies_cached(sector_id=None, ownership_type=None, tier_level=None, name_ilike=None):
+    return load_companies_admin(
+        get_sb(), sector_id=sector_id, ownership_type=ownership_type,
+        tier_level=tier_level, name_ilike=name_ilike,
+    )
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _company_cached(company_id):
+    return get_company(get_sb(), company_id)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _company_options_cached():
+    return get_company_options(get_sb())
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _sectors_cached():
+    return load_sectors_admin(get_sb())
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _sector_options_cached():
+    return get_sector_options(get_sb())
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _relationships_cached():
+    return load_relationships_admin(get_sb())
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _people_cached(company_id=None):
+    return load_people_admin(get_sb(), company_id=company_id)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _events_cached():
+    return load_events_admin(get_sb())
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _articles_cached(source_filter=None, status_filter=None, limit=200, title_ilike=None, after=None):
+    return load_articles_admin(
+        get_sb(), source_filter=source_filter, status_filter=status_filter,
+        limit=limit, title_ilike=title_ilike, after=after,
+    )
+
+
+# Article text and extraction payloads don't change once written; keep a bounded set
+@st.cache_data(ttl=600, max_entries=256, show_spinner=False)
+def _article_text_cached(article_id):
+    return get_article_text(get_sb(), article_id)
+
+
+@st.cache_data(ttl=600, max_entries=256, show_spinner=False)
+def _extraction_data_cached(extraction_id):
+    return get_extraction_data(get_sb(), extraction_id)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _article_sources_cached():
+    return get_article_sources(get_sb())
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _extractions_cached():
+    return load_extractions_admin(get_sb())
+
+
+def _safe_json_loads(value):
+    """Decode a JSON string; dicts and unparsable values pass through unchanged."""
+    if isinstance(value, str):
+        try:
+            return orjson.loads(value)
+        except ValueError:
+            return value
+    return value
+
+
+def _json_text(value):
+    """Serialize a decoded value to JSON text for st.json (None if empty).
+
+    st.json passes strings through untouched, so handing it orjson output
+    skips the slower json.dumps it would otherwise run on every render.
+    """
+    if not value:
+        return None
+    if isinstance(value, str):
+        return value
+    try:
+        return orjson.dumps(value).decode()
+    except TypeError:
+        return value
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _review_queue_cached(status="pending"):
+    df = load_review_queue_admin(get_sb(), status=status)
+    if "extracted_data" in df.columns:
+        # Normalize to JSON text once per fetch instead of once per expander on every rerun
+        df["extracted_data"] = df["extracted_data"].map(lambda v: _json_text(_safe_json_loads(v)))
+    return df
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _scraper_runs_cached(limit=SCRAPER_RUNS_PAGE_SIZE, after=None):
+    return load_scraper_runs_admin(get_sb(), limit=limit, after=after)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _costs_tab_cached():
+    """Cost summary and first page of costs, fetched together."""
+    return load_costs_tab(get_sb(), limit=PIPELINE_COSTS_LIMIT)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _pipeline_costs_cached(after=None):
+    if after is None:
+        return _costs_tab_cached()[1]
+    return load_pipeline_costs_admin(get_sb(), limit=PIPELINE_COSTS_LIMIT, after=after)
+
+
+def _to_record(row) -> dict:
+    """Flatten a DataFrame row into a plain dict, mapping NaN/NaT to None."""
+    return {k: (None if pd.api.types.is_scalar(v) and pd.isna(v) else v) for k, v in row.to_dict().items()}
+
+
+def _changed_fields(data: dict, original: dict) -> dict:
+    """Keep only the keys of an edit payload whose value differs from the loaded row."""
+    return {k: v for k, v in data.items() if (v or None) != (original.get(k) or None)}
+
+
+def _invalidate():
+    """Drop all cached reads so the next rerun reflects a write."""
+    st.cache_data.clear()
+
+
+def _refresh_button(key, *cached_fns):
+    """Render a small refresh button that clears the given cached loaders."""
+    if st.button("↻ Refresh", key=key):
+        for fn in cached_fns:
+            fn.clear()
+        st.rerun()
+
+
+def _filter_state(state_key, **defaults):
+    """The last submitted values of a filter form, kept in st.session_state[state_key].
+
+    Widget state is dropped while its section isn't rendered, so the form's
+    widgets are seeded from this dict and write it back on submit.
+    """
+    return st.session_state.setdefault(state_key, defaults)
+
+
+def _option_index(options, value):
+    """Position of value in options, or 0 ("All") if it is no longer offered."""
+    return options.index(value) if value in options else 0
+
+
+def _paged_frame(state_key, fetch, page_size, filters=()):
+    """Concatenate every loaded keyset page of fetch(after=cursor).
+
+    Cursors live in st.session_state[f"{state_key}_cursors"] and reset when
+    filters change. Returns (frame, last_page, has_more).
+    """
+    if st.session_state[f"{state_key}_cursor_filters"] != filters:
+        st.session_state[f"{state_key}_cursor_filters"] = filters
+        st.session_state[f"{state_key}_cursors"] = [None]
+    pages = [fetch(after=cursor) for cursor in st.session_state[f"{state_key}_cursors"]]
+    non_empty = [p for p in pages if not p.empty]
+    df = pd.concat(non_empty, ignore_index=True) if non_empty else pd.DataFrame()
+    return df, pages[-1], len(pages[-1]) == page_size
+
+
+def _load_more_button(state_key, last_page, sort_col):
+    """Append the cursor after last_page's final row and rerun."""
+    if st.button("⬇️ Load more", key=f"{state_key}_load_more"):
+        last = last_page.iloc[-1]
+        st.session_state[f"{state_key}_cursors"].append((last[sort_col], last["id"]))
+        st.rerun()
+
+
 # ── Auth ─────────────────────────────────────────────────
-if "admin_auth" not in st.session_state:
-    st.session_state.admin_auth = False
+@st.cache_resource
+def _admin_password_hash() -> bytes:
+    """SHA-256 of the admin password, read from the environment once per process."""
+    return hashlib.sha256(os.environ.get("MIIM_ADMIN_PASSWORD", "miim2026").encode()).digest()
+
 
 if not st.session_state.admin_auth:
     st.markdown(f"""
@@ -68,7 +295,7 @@ if not st.session_state.admin_auth:
     """, unsafe_allow_html=True)
     pwd = st.text_input("Password", type="password", key="admin_pwd")
     if st.button("Login", use_container_width=True):
-        if pwd == os.environ.get("MIIM_ADMIN_PASSWORD", "miim2026"):
+        if hmac.compare_digest(hashlib.sha256(pwd.encode()).digest(), _admin_password_hash()):
             st.session_state.admin_auth = True
             st.rerun()
         else:
@@ -102,17 +329,25 @@ st.markdown(f"""
 </div>
 """, unsafe_allow_html=True)
 
-# ── Tabs ─────────────────────────────────────────────────
-tab_overview, tab_companies, tab_sectors, tab_rels, tab_people, tab_events, tab_scraped = st.tabs(
-    ["📊 Overview", "🏢 Companies", "🏭 Sectors", "🔗 Relationships", "👔 People", "📅 Events", "📰 Scraped Data"]
-)
+# ── Shared dropdown options ──────────────────────────────
+# Fetched once per rerun and reused by every tab below.
+sectors_list = _sector_options_cached()
+sector_names_ordered = [s["sector_name"] for s in sectors_list]
+sector_name_to_id = {s["sector_name"]: s["sector_id"] for s in sectors_list}
+sector_name_to_pos = {name: i for i, name in enumerate(sector_names_ordered)}
+
+co_opts = _company_options_cached()
+co_labels = [c["company_name"] for c in co_opts]
+co_name_to_id = {c["company_name"]: c["company_id"] for c in co_opts}
+
 
 
 # ═══════════════════════════════════════════════════════════
 # TAB 1: Overview
 # ═══════════════════════════════════════════════════════════
-with tab_overview:
-    stats = get_overview_stats(sb)
+def _render_overview_tab():
+    _refresh_button("refresh_overview", _overview_cached)
+    stats, df_runs, df_art = _overview_cached()
     m1, m2, m3, m4 = st.columns(4)
     m1.metric("🏢 Companies", stats["total_companies"])
     m2.metric("📰 Articles Scraped", stats["total_articles"])
@@ -122,7 +357,6 @@ with tab_overview:
     col_l, col_r = st.columns(2)
     with col_l:
         st.markdown("##### 🔄 Recent Scraper Runs")
-        df_runs = load_scraper_runs_admin(sb, limit=10)
         if not df_runs.empty:
             st.dataframe(
                 df_runs[["source_name", "run_date", "articles_found", "articles_new", "status"]],
@@ -133,7 +367,6 @@ with tab_overview:
 
     with col_r:
         st.markdown("##### 📰 Recent Articles")
-        df_art = load_articles_admin(sb, limit=10)
         if not df_art.empty:
             st.dataframe(
                 df_art[["title", "source_name", "published_date", "processing_status"]],
@@ -146,30 +379,31 @@ with tab_overview:
 # ═══════════════════════════════════════════════════════════
 # TAB 2: Companies
 # ═══════════════════════════════════════════════════════════
-with tab_companies:
-    # Helpers for this tab
-    sectors_list = get_sector_options(sb)
-    sector_map = {s["sector_id"]: s["sector_name"] for s in sectors_list}
-    sector_names = ["All"] + [s["sector_name"] for s in sectors_list]
-
-    # ── Filters
-    fc1, fc2, fc3, fc4 = st.columns(4)
-    search = fc1.text_input("🔍 Search", placeholder="Company name…", key="co_search")
-    sec_filter = fc2.selectbox("Sector", sector_names, key="co_sec")
-    own_filter = fc3.selectbox("Ownership", ["All"] + OWNERSHIP_TYPES, key="co_own")
-    tier_filter = fc4.selectbox("Tier", ["All"] + TIER_LEVELS, key="co_tier")
-
-    df_co = load_companies_admin(sb)
+def _render_companies_tab():
+    _refresh_button("refresh_companies", _companies_cached, _sector_options_cached)
+
+    sector_names = ["All"] + sector_names_ordered
+
+    # ── Filters (submitted together, so typing doesn't rerun the script)
+    co_state = _filter_state("co_filter_state", search="", sector="All", ownership="All", tier="All")
+    own_options, tier_options = ["All"] + OWNERSHIP_TYPES, ["All"] + TIER_LEVELS
+    with st.form("co_filters"):
+        fc1, fc2, fc3, fc4 = st.columns(4)
+        search = fc1.text_input("🔍 Search", value=co_state["search"], placeholder="Company name…", key="co_search")
+        sec_filter = fc2.selectbox("Sector", sector_names, index=_option_index(sector_names, co_state["sector"]), key="co_sec")
+        own_filter = fc3.selectbox("Ownership", own_options, index=_option_index(own_options, co_state["ownership"]), key="co_own")
+        tier_filter = fc4.selectbox("Tier", tier_options, index=_option_index(tier_options, co_state["tier"]), key="co_tier")
+        if st.form_submit_button("Apply filters"):
+            co_state.update(search=search, sector=sec_filter, ownership=own_filter, tier=tier_filter)
+
+    # Filters are applied by PostgREST so only matching rows come over the wire
+    df_co = _companies_cached(
+        sector_id=sector_name_to_id.get(sec_filter),
+        ownership_type=own_filter if own_filter != "All" else None,
+        tier_level=tier_filter if tier_filter != "All" else None,
+        name_ilike=search.strip() or None,
+    )
     if not df_co.empty:
-        if search:
-            df_co = df_co[df_co["company_name"].str.contains(search, case=False, na=False)]
-        if sec_filter != "All":
-            df_co = df_co[df_co["sector_name"] == sec_filter]
-        if own_filter != "All":
-            df_co = df_co[df_co["ownership_type"] == own_filter]
-        if tier_filter != "All":
-            df_co = df_co[df_co["tier_level"] == tier_filter]
-
         st.caption(f"Showing {len(df_co)} companies")
 
         # ── Data table (read-only display)
@@ -182,10 +416,14 @@ with tab_companies:
         st.markdown("---")
         st.markdown("##### ✏️ Edit Company")
         co_names = df_co["company_name"].tolist()
+        co_id_by_name = dict(zip(co_names, df_co["company_id"].to_numpy()))
         sel_co = st.selectbox("Select company to edit", co_names, key="edit_co_select")
 
-        if sel_co:
-            row = df_co[df_co["company_name"] == sel_co].iloc[0]
+        # The table only carries display columns; load the full row for editing
+        row = _company_cached(co_id_by_name[sel_co]) if sel_co else {}
+        if sel_co and not row:
+            st.error("Could not load company details.")
+        if row:
             co_id = row["company_id"]
 
             with st.form(f"edit_co_{co_id}"):
@@ -195,16 +433,15 @@ with tab_companies:
 
                 e3, e4 = st.columns(2)
                 cur_sector = row.get("sector_name", "")
-                sec_idx = ([s["sector_name"] for s in sectors_list].index(cur_sector) if cur_sector in [s["sector_name"] for s in sectors_list] else 0)
-                sector_sel = e3.selectbox("Sector", [s["sector_name"] for s in sectors_list], index=sec_idx)
-                sector_id = next((s["sector_id"] for s in sectors_list if s["sector_name"] == sector_sel), None)
+                sector_sel = e3.selectbox("Sector", sector_names_ordered, index=sector_name_to_pos.get(cur_sector, 0))
+                sector_id = sector_name_to_id.get(sector_sel)
                 own = e4.selectbox("Ownership", OWNERSHIP_TYPES, index=OWNERSHIP_TYPES.index(row["ownership_type"]) if row.get("ownership_type") in OWNERSHIP_TYPES else 6)
 
                 e5, e6, e7, e8 = st.columns(4)
-                emp = e5.number_input("Employees", value=int(row["employee_count"]) if pd.notna(row.get("employee_count")) else 0, min_value=0)
-                rev = e6.number_input("Revenue (MAD)", value=float(row["annual_revenue_mad"]) if pd.notna(row.get("annual_revenue_mad")) else 0.0, min_value=0.0)
-                inv = e7.number_input("Investment (MAD)", value=float(row["investment_amount_mad"]) if pd.notna(row.get("investment_amount_mad")) else 0.0, min_value=0.0)
-                cap = e8.number_input("Capital (MAD)", value=float(row["capital_mad"]) if pd.notna(row.get("capital_mad")) else 0.0, min_value=0.0)
+                emp = e5.number_input("Employees", value=int(row.get("employee_count") or 0), min_value=0)
+                rev = e6.number_input("Revenue (MAD)", value=float(row.get("annual_revenue_mad") or 0.0), min_value=0.0)
+                inv = e7.number_input("Investment (MAD)", value=float(row.get("investment_amount_mad") or 0.0), min_value=0.0)
+                cap = e8.number_input("Capital (MAD)", value=float(row.get("capital_mad") or 0.0), min_value=0.0)
 
                 e9, e10 = st.columns(2)
                 tier = e9.selectbox("Tier", TIER_LEVELS, index=TIER_LEVELS.index(row["tier_level"]) if row.get("tier_level") in TIER_LEVELS else 4)
@@ -223,20 +460,24 @@ with tab_companies:
                 if del_check:
                     if delete_company(sb, co_id):
                         st.success(f"Deleted {sel_co}")
+                        _invalidate()
                         st.rerun()
                     else:
                         st.error("Delete failed.")
                 else:
-                    data = {
+                    data = _changed_fields({
                         "company_name": name, "sector_id": sector_id, "headquarters_city": city or None,
                         "ownership_type": own, "tier_level": tier, "employee_count": emp or None,
                         "annual_revenue_mad": rev or None, "investment_amount_mad": inv or None,
                         "capital_mad": cap or None, "website_url": website or None,
                         "description": desc or None, "activities": activities or None,
                         "parent_company": parent or None, "sub_sector": sub or None,
-                    }
-                    if update_company(sb, co_id, data):
+                    }, row)
+                    if not data:
+                        st.info("No changes to save.")
+                    elif update_company(sb, co_id, data):
                         st.success(f"Updated {name}")
+                        _invalidate()
                         st.rerun()
                     else:
                         st.error("Update failed.")
@@ -251,7 +492,7 @@ with tab_companies:
         new_name = a1.text_input("Company Name*", key="new_co_name")
         new_city = a2.text_input("City", key="new_co_city")
         a3, a4 = st.columns(2)
-        new_sec = a3.selectbox("Sector*", [s["sector_name"] for s in sectors_list], key="new_co_sec")
+        new_sec = a3.selectbox("Sector*", sector_names_ordered, key="new_co_sec")
         new_own = a4.selectbox("Ownership", OWNERSHIP_TYPES, key="new_co_own")
         a5, a6 = st.columns(2)
         new_emp = a5.number_input("Employees", min_value=0, value=0, key="new_co_emp")
@@ -261,7 +502,7 @@ with tab_companies:
             if not new_name.strip():
                 st.error("Company name is required.")
             else:
-                new_sec_id = next((s["sector_id"] for s in sectors_list if s["sector_name"] == new_sec), None)
+                new_sec_id = sector_name_to_id.get(new_sec)
                 result = create_company(sb, {
                     "company_name": new_name.strip(), "sector_id": new_sec_id,
                     "headquarters_city": new_city or None, "ownership_type": new_own,
@@ -269,6 +510,7 @@ with tab_companies:
                 })
                 if result:
                     st.success(f"Created {new_name}")
+                    _invalidate()
                     st.rerun()
                 else:
                     st.error("Failed to create company.")
@@ -277,8 +519,9 @@ with tab_companies:
 # ═══════════════════════════════════════════════════════════
 # TAB 3: Sectors
 # ═══════════════════════════════════════════════════════════
-with tab_sectors:
-    df_sec = load_sectors_admin(sb)
+def _render_sectors_tab():
+    _refresh_button("refresh_sectors", _sectors_cached)
+    df_sec = _sectors_cached()
     if not df_sec.empty:
         st.dataframe(
             df_sec[["sector_name", "target_integration_pct", "current_integration_pct", "government_strategy", "source_url"]],
@@ -287,18 +530,19 @@ with tab_sectors:
 
         st.markdown("---")
         st.markdown("##### ✏️ Edit Sector")
+        df_sec_indexed = df_sec.drop_duplicates("sector_name").set_index("sector_name", drop=False)
         sec_names = df_sec["sector_name"].tolist()
         sel_sec = st.selectbox("Select sector", sec_names, key="edit_sec")
 
         if sel_sec:
-            srow = df_sec[df_sec["sector_name"] == sel_sec].iloc[0]
+            srow = _to_record(df_sec_indexed.loc[sel_sec])
             sid = srow["sector_id"]
 
             with st.form(f"edit_sec_{sid}"):
                 sn = st.text_input("Sector Name", value=srow["sector_name"])
                 s1, s2 = st.columns(2)
-                tgt = s1.number_input("Target Integration %", value=float(srow["target_integration_pct"]) if pd.notna(srow.get("target_integration_pct")) else 0.0, min_value=0.0, max_value=100.0)
-                cur = s2.number_input("Current Integration %", value=float(srow["current_integration_pct"]) if pd.notna(srow.get("current_integration_pct")) else 0.0, min_value=0.0, max_value=100.0)
+                tgt = s1.number_input("Target Integration %", value=float(srow.get("target_integration_pct") or 0.0), min_value=0.0, max_value=100.0)
+                cur = s2.number_input("Current Integration %", value=float(srow.get("current_integration_pct") or 0.0), min_value=0.0, max_value=100.0)
                 strat = st.text_area("Government Strategy", value=srow.get("government_strategy", "") or "", height=80)
                 surl = st.text_input("Source URL", value=srow.get("source_url", "") or "")
                 sname_det = st.text_input("Source Name", value=srow.get("source_name_detail", "") or "")
@@ -311,16 +555,21 @@ with tab_sectors:
                 if del_sec:
                     if delete_sector(sb, sid):
                         st.success(f"Deleted {sel_sec}")
+                        _invalidate()
                         st.rerun()
                     else:
                         st.error("Delete failed.")
                 else:
-                    if update_sector(sb, sid, {
+                    sec_data = _changed_fields({
                         "sector_name": sn, "target_integration_pct": tgt,
                         "current_integration_pct": cur, "government_strategy": strat or None,
                         "source_url": surl or None, "source_name_detail": sname_det or None,
-                    }):
+                    }, srow)
+                    if not sec_data:
+                        st.info("No changes to save.")
+                    elif update_sector(sb, sid, sec_data):
                         st.success(f"Updated {sn}")
+                        _invalidate()
                         st.rerun()
                     else:
                         st.error("Update failed.")
@@ -342,6 +591,7 @@ with tab_sectors:
             else:
                 if create_sector(sb, {"sector_name": ns_name.strip(), "target_integration_pct": ns_tgt, "current_integration_pct": ns_cur}):
                     st.success(f"Created {ns_name}")
+                    _invalidate()
                     st.rerun()
                 else:
                     st.error("Failed.")
@@ -350,22 +600,29 @@ with tab_sectors:
 # ═══════════════════════════════════════════════════════════
 # TAB 4: Relationships
 # ═══════════════════════════════════════════════════════════
-with tab_rels:
-    df_rel = load_relationships_admin(sb)
+def _render_relationships_tab():
+    _refresh_button("refresh_rels", _relationships_cached, _company_options_cached)
+    df_rel = _relationships_cached()
     if not df_rel.empty:
-        display_rel = df_rel[["source_name", "target_name", "relationship_type", "confidence_score", "status", "description", "id"]].copy()
-        display_rel.columns = ["Source", "Target", "Type", "Confidence", "Status", "Description", "id"]
+        display_rel = df_rel[["source_name", "target_name", "relationship_type", "confidence_score", "status", "description", "id"]].rename(
+            columns={"source_name": "Source", "target_name": "Target", "relationship_type": "Type",
+                     "confidence_score": "Confidence", "status": "Status", "description": "Description"}
+        )
         st.dataframe(display_rel.drop(columns=["id"]), use_container_width=True, hide_index=True, height=350)
 
         # Delete
         st.markdown("##### 🗑️ Delete Relationship")
-        rel_labels = [f"{r['Source']} → {r['Target']} ({r['Type']})" for _, r in display_rel.iterrows()]
+        rel_labels = [
+            f"{src} → {tgt} ({rtype})"
+            for src, tgt, rtype in zip(display_rel["Source"].to_numpy(), display_rel["Target"].to_numpy(), display_rel["Type"].to_numpy())
+        ]
+        rel_label_to_id = dict(zip(rel_labels, display_rel["id"].to_numpy()))
         sel_rel = st.selectbox("Select", rel_labels, key="del_rel")
         if sel_rel and st.button("Delete Selected Relationship"):
-            idx = rel_labels.index(sel_rel)
-            rid = display_rel.iloc[idx]["id"]
+            rid = rel_label_to_id[sel_rel]
             if delete_relationship(sb, rid):
                 st.success("Deleted.")
+                _invalidate()
                 st.rerun()
     else:
         st.info("No relationships found.")
@@ -373,9 +630,6 @@ with tab_rels:
     # ── Add relationship
     st.markdown("---")
     st.markdown("##### ➕ Add Relationship")
-    co_opts = get_company_options(sb)
-    co_labels = [c["company_name"] for c in co_opts]
-
     with st.form("add_rel_form"):
         r1, r2 = st.columns(2)
         src_co = r1.selectbox("Source Company*", co_labels, key="rel_src")
@@ -387,8 +641,8 @@ with tab_rels:
         rel_url = st.text_input("Source URL", key="rel_url")
 
         if st.form_submit_button("➕ Add Relationship", type="primary"):
-            src_id = next((c["company_id"] for c in co_opts if c["company_name"] == src_co), None)
-            tgt_id = next((c["company_id"] for c in co_opts if c["company_name"] == tgt_co), None)
+            src_id = co_name_to_id.get(src_co)
+            tgt_id = co_name_to_id.get(tgt_co)
             if src_id == tgt_id:
                 st.error("Source and target must be different.")
             elif src_id and tgt_id:
@@ -399,6 +653,7 @@ with tab_rels:
                     "source_url": rel_url or None,
                 }):
                     st.success("Added relationship.")
+                    _invalidate()
                     st.rerun()
                 else:
                     st.error("Failed.")
@@ -407,29 +662,39 @@ with tab_rels:
 # ═══════════════════════════════════════════════════════════
 # TAB 5: People
 # ═══════════════════════════════════════════════════════════
-with tab_people:
-    co_opts_p = get_company_options(sb)
-    co_labels_p = ["All"] + [c["company_name"] for c in co_opts_p]
-    filter_co = st.selectbox("Filter by company", co_labels_p, key="ppl_filter")
+def _render_people_tab():
+    _refresh_button("refresh_people", _people_cached, _company_options_cached)
+    co_labels_p = ["All"] + co_labels
+    ppl_state = _filter_state("ppl_filter_state", company="All")
+    with st.form("ppl_filters"):
+        filter_co = st.selectbox(
+            "Filter by company", co_labels_p, index=_option_index(co_labels_p, ppl_state["company"]), key="ppl_filter"
+        )
+        if st.form_submit_button("Apply filter"):
+            ppl_state.update(company=filter_co)
 
     co_id_filter = None
     if filter_co != "All":
-        co_id_filter = next((c["company_id"] for c in co_opts_p if c["company_name"] == filter_co), None)
+        co_id_filter = co_name_to_id.get(filter_co)
 
-    df_ppl = load_people_admin(sb, company_id=co_id_filter)
+    df_ppl = _people_cached(company_id=co_id_filter)
     if not df_ppl.empty:
-        display_ppl = df_ppl[["person_name", "role_title", "role_type", "company_name", "id"]].copy()
+        display_ppl = df_ppl[["person_name", "role_title", "role_type", "company_name", "id"]]
         st.dataframe(display_ppl.drop(columns=["id"]), use_container_width=True, hide_index=True, height=350)
 
         # Delete
         st.markdown("##### 🗑️ Delete Person")
-        ppl_labels = [f"{r['person_name']} — {r['role_title']} ({r['company_name']})" for _, r in display_ppl.iterrows()]
+        ppl_labels = [
+            f"{name} — {title} ({co})"
+            for name, title, co in zip(display_ppl["person_name"].to_numpy(), display_ppl["role_title"].to_numpy(), display_ppl["company_name"].to_numpy())
+        ]
+        ppl_label_to_id = dict(zip(ppl_labels, display_ppl["id"].to_numpy()))
         sel_ppl = st.selectbox("Select", ppl_labels, key="del_ppl")
         if sel_ppl and st.button("Delete Selected Person"):
-            idx = ppl_labels.index(sel_ppl)
-            pid = display_ppl.iloc[idx]["id"]
+            pid = ppl_label_to_id[sel_ppl]
             if delete_person(sb, pid):
                 st.success("Deleted.")
+                _invalidate()
                 st.rerun()
     else:
         st.info("No people found.")
@@ -439,7 +704,7 @@ with tab_people:
     st.markdown("##### ➕ Add Person")
     with st.form("add_ppl_form"):
         p1, p2 = st.columns(2)
-        ppl_co = p1.selectbox("Company*", [c["company_name"] for c in co_opts_p], key="ppl_co")
+        ppl_co = p1.selectbox("Company*", co_labels, key="ppl_co")
         ppl_name = p2.text_input("Person Name*", key="ppl_name")
         p3, p4 = st.columns(2)
         ppl_title = p3.text_input("Role Title*", key="ppl_title")
@@ -449,12 +714,13 @@ with tab_people:
             if not ppl_name.strip():
                 st.error("Name required.")
             else:
-                co_id_ins = next((c["company_id"] for c in co_opts_p if c["company_name"] == ppl_co), None)
+                co_id_ins = co_name_to_id.get(ppl_co)
                 if co_id_ins and create_person(sb, {
                     "company_id": co_id_ins, "person_name": ppl_name.strip(),
                     "role_title": ppl_title.strip(), "role_type": ppl_type,
                 }):
                     st.success(f"Added {ppl_name}")
+                    _invalidate()
                     st.rerun()
                 else:
                     st.error("Failed.")
@@ -463,8 +729,9 @@ with tab_people:
 # ═══════════════════════════════════════════════════════════
 # TAB 6: Events
 # ═══════════════════════════════════════════════════════════
-with tab_events:
-    df_ev = load_events_admin(sb)
+def _render_events_tab():
+    _refresh_button("refresh_events", _events_cached, _company_options_cached)
+    df_ev = _events_cached()
     if not df_ev.empty:
         display_ev = ["company_name", "event_type", "title", "event_date", "city", "investment_amount_mad", "confidence_score"]
         available_ev = [c for c in display_ev if c in df_ev.columns]
@@ -473,12 +740,14 @@ with tab_events:
         # ── Edit event
         st.markdown("---")
         st.markdown("##### ✏️ Edit Event")
-        ev_labels = [f"{r.get('title', '?')} ({r.get('company_name', '?')})" for _, r in df_ev.iterrows()]
+        ev_titles = df_ev["title"].fillna("?").to_numpy()
+        ev_companies = df_ev["company_name"].fillna("?").to_numpy()
+        ev_labels = [f"{title} ({co})" for title, co in zip(ev_titles, ev_companies)]
+        ev_label_to_pos = dict(zip(ev_labels, range(len(ev_labels))))
         sel_ev = st.selectbox("Select event", ev_labels, key="edit_ev")
 
         if sel_ev:
-            ev_idx = ev_labels.index(sel_ev)
-            erow = df_ev.iloc[ev_idx]
+            erow = _to_record(df_ev.iloc[ev_label_to_pos[sel_ev]])
             eid = erow["event_id"]
 
             with st.form(f"edit_ev_{eid}"):
@@ -487,10 +756,10 @@ with tab_events:
                 ev_type = ev2.selectbox("Type", EVENT_TYPES, index=EVENT_TYPES.index(erow["event_type"]) if erow.get("event_type") in EVENT_TYPES else 8)
                 ev3, ev4 = st.columns(2)
                 ev_city = ev3.text_input("City", value=erow.get("city", "") or "")
-                ev_amt = ev4.number_input("Investment (MAD)", value=float(erow["investment_amount_mad"]) if pd.notna(erow.get("investment_amount_mad")) else 0.0, min_value=0.0)
+                ev_amt = ev4.number_input("Investment (MAD)", value=float(erow.get("investment_amount_mad") or 0.0), min_value=0.0)
                 ev_desc = st.text_area("Description", value=erow.get("description", "") or "", height=80)
                 ev_url = st.text_input("Source URL", value=erow.get("source_url", "") or "")
-                ev_conf = st.slider("Confidence", 0.0, 1.0, float(erow["confidence_score"]) if pd.notna(erow.get("confidence_score")) else 0.5)
+                ev_conf = st.slider("Confidence", 0.0, 1.0, float(erow["confidence_score"]) if erow.get("confidence_score") is not None else 0.5)
 
                 evc1, evc2 = st.columns(2)
                 save_ev = evc1.form_submit_button("💾 Save", type="primary")
@@ -500,14 +769,19 @@ with tab_events:
                 if del_ev:
                     if delete_event(sb, eid):
                         st.success("Deleted.")
+                        _invalidate()
                         st.rerun()
                 else:
-                    if update_event(sb, eid, {
+                    ev_data = _changed_fields({
                         "title": ev_title, "event_type": ev_type, "city": ev_city or None,
                         "investment_amount_mad": ev_amt or None, "description": ev_desc or None,
                         "source_url": ev_url or None, "confidence_score": ev_conf,
-                    }):
+                    }, erow)
+                    if not ev_data:
+                        st.info("No changes to save.")
+                    elif update_event(sb, eid, ev_data):
                         st.success("Updated.")
+                        _invalidate()
                         st.rerun()
     else:
         st.info("No events found.")
@@ -515,10 +789,9 @@ with tab_events:
     # ── Add event
     st.markdown("---")
     st.markdown("##### ➕ Add Event")
-    co_opts_ev = get_company_options(sb)
     with st.form("add_ev_form"):
         ne1, ne2 = st.columns(2)
-        ne_co = ne1.selectbox("Company*", [c["company_name"] for c in co_opts_ev], key="new_ev_co")
+        ne_co = ne1.selectbox("Company*", co_labels, key="new_ev_co")
         ne_type = ne2.selectbox("Event Type*", EVENT_TYPES, key="new_ev_type")
         ne_title = st.text_input("Title*", key="new_ev_title")
         ne3, ne4 = st.columns(2)
@@ -531,7 +804,7 @@ with tab_events:
             if not ne_title.strip():
                 st.error("Title required.")
             else:
-                co_id_ev = next((c["company_id"] for c in co_opts_ev if c["company_name"] == ne_co), None)
+                co_id_ev = co_name_to_id.get(ne_co)
                 if co_id_ev and create_event(sb, {
                     "company_id": co_id_ev, "event_type": ne_type, "title": ne_title.strip(),
                     "city": ne_city or None, "investment_amount_mad": ne_amt or None,
@@ -539,6 +812,7 @@ with tab_events:
                     "confidence_score": 1.0,
                 }):
                     st.success(f"Created event: {ne_title}")
+                    _invalidate()
                     st.rerun()
                 else:
                     st.error("Failed.")
@@ -547,33 +821,60 @@ with tab_events:
 # ═══════════════════════════════════════════════════════════
 # TAB 7: Scraped Data
 # ═══════════════════════════════════════════════════════════
-with tab_scraped:
+def _render_scraped_tab():
+    _refresh_button(
+        "refresh_scraped", _articles_cached, _article_sources_cached, _extractions_cached,
+        _review_queue_cached, _scraper_runs_cached, _pipeline_costs_cached, _costs_tab_cached,
+    )
     sub_articles, sub_extractions, sub_review, sub_runs, sub_costs = st.tabs(
         ["📰 Articles", "🔍 Extractions", "✅ Review Queue", "🔄 Scraper Runs", "💰 Pipeline Costs"]
     )
 
     # ── Articles ──────────────────────────────────────────
     with sub_articles:
-        ac1, ac2 = st.columns(2)
-        sources = get_article_sources(sb)
-        art_src = ac1.selectbox("Source", ["All"] + sources, key="art_src")
-        art_status = ac2.selectbox("Status", ["All", "pending", "extracted", "reviewed", "failed", "skipped"], key="art_status")
-
-        df_articles = load_articles_admin(sb, source_filter=art_src if art_src != "All" else None, status_filter=art_status if art_status != "All" else None)
+        sources = _article_sources_cached()
+        art_state = _filter_state("art_filter_state", search="", source="All", status="All")
+        src_options = ["All"] + sources
+        status_options = ["All", "pending", "extracted", "reviewed", "failed", "skipped"]
+        with st.form("art_filters"):
+            ac1, ac2, ac3 = st.columns(3)
+            art_search = ac1.text_input("🔍 Search", value=art_state["search"], placeholder="Article title…", key="art_search")
+            art_src = ac2.selectbox("Source", src_options, index=_option_index(src_options, art_state["source"]), key="art_src")
+            art_status = ac3.selectbox(
+                "Status", status_options, index=_option_index(status_options, art_state["status"]), key="art_status"
+            )
+            if st.form_submit_button("Apply filters"):
+                art_state.update(search=art_search, source=art_src, status=art_status)
+
+        # Keyset pagination: each loaded page is cached under its own cursor
+        df_articles, art_last_page, art_has_more = _paged_frame(
+            "art",
+            lambda after: _articles_cached(
+                source_filter=art_src if art_src != "All" else None,
+                status_filter=art_status if art_status != "All" else None,
+                title_ilike=art_search.strip() or None,
+                limit=ARTICLES_PAGE_SIZE, after=after,
+            ),
+            ARTICLES_PAGE_SIZE,
+            filters=(art_src, art_status, art_search.strip()),
+        )
         if not df_articles.empty:
             st.caption(f"{len(df_articles)} articles")
             st.dataframe(
                 df_articles[["title", "source_name", "published_date", "processing_status", "language"]],
                 use_container_width=True, hide_index=True, height=400,
             )
+            if art_has_more:
+                _load_more_button("art", art_last_page, "scraped_date")
 
             # Expand to view full text
             st.markdown("##### 📖 View Article Text")
             art_titles = df_articles["title"].tolist()
+            art_title_to_id = dict(zip(art_titles, df_articles["id"].to_numpy()))
             sel_art = st.selectbox("Select article", art_titles, key="view_art")
             if sel_art:
-                art_id = df_articles[df_articles["title"] == sel_art].iloc[0]["id"]
-                text = get_article_text(sb, art_id)
+                art_id = art_title_to_id[sel_art]
+                text = _article_text_cached(art_id)
                 if text:
                     st.text_area("Full Text", value=text, height=300, disabled=True, key="art_text_view")
                 else:
@@ -583,7 +884,7 @@ with tab_scraped:
 
     # ── Extractions ───────────────────────────────────────
     with sub_extractions:
-        df_ext = load_extractions_admin(sb)
+        df_ext = _extractions_cached()
         if not df_ext.empty:
             display_ext = ["article_title", "source_name", "model_used", "confidence_score", "input_tokens", "output_tokens", "created_at"]
             available_ext = [c for c in display_ext if c in df_ext.columns]
@@ -591,14 +892,17 @@ with tab_scraped:
 
             # View extraction JSON
             st.markdown("##### 🔍 View Extraction Data")
-            ext_labels = [f"{r.get('article_title', '?')[:50]} (conf: {r.get('confidence_score', 0):.2f})" for _, r in df_ext.iterrows()]
+            ext_labels = [
+                f"{title[:50]} (conf: {conf:.2f})"
+                for title, conf in zip(df_ext["article_title"].to_numpy(), df_ext["confidence_score"].to_numpy())
+            ]
+            ext_label_to_id = dict(zip(ext_labels, df_ext["id"].to_numpy()))
             sel_ext = st.selectbox("Select extraction", ext_labels, key="view_ext")
             if sel_ext:
-                ext_idx = ext_labels.index(sel_ext)
-                ext_id = df_ext.iloc[ext_idx]["id"]
-                ext_data = get_extraction_data(sb, ext_id)
+                ext_id = ext_label_to_id[sel_ext]
+                ext_data = _extraction_data_cached(ext_id)
                 if ext_data:
-                    st.json(ext_data)
+                    st.json(_json_text(ext_data))
                 else:
                     st.info("No extraction data.")
         else:
@@ -607,59 +911,92 @@ with tab_scraped:
     # ── Review Queue ──────────────────────────────────────
     with sub_review:
         rq_status = st.selectbox("Status", ["pending", "approved", "rejected"], key="rq_status")
-        df_rq = load_review_queue_admin(sb, status=rq_status)
+        df_rq = _review_queue_cached(status=rq_status)
 
         if not df_rq.empty:
-            st.caption(f"{len(df_rq)} items ({rq_status})")
-
-            for idx, rq_row in df_rq.iterrows():
-                with st.expander(f"📄 {rq_row.get('article_title', 'Unknown')} — conf: {rq_row.get('confidence_score', 0):.2f}"):
+            page_size = 20
+            total_pages = max(1, (len(df_rq) + page_size - 1) // page_size)
+            page = st.number_input("Page", min_value=1, max_value=total_pages, value=1, step=1, key="rq_page") if total_pages > 1 else 1
+            start = (page - 1) * page_size
+            st.caption(f"{len(df_rq)} items ({rq_status})  |  Page {page} of {total_pages}")
+
+            selected_ids = []
+            for rq_row in df_rq.iloc[start:start + page_size].to_dict("records"):
+                if rq_status == "pending":
+                    sel_col, item_col = st.columns([1, 24])
+                    if sel_col.checkbox("Select", key=f"rq_sel_{rq_row['id']}", label_visibility="collapsed"):
+                        selected_ids.append(rq_row["id"])
+                else:
+                    item_col = st.container()
+                with item_col.expander(f"📄 {rq_row.get('article_title', 'Unknown')} — conf: {rq_row.get('confidence_score', 0):.2f}"):
                     st.markdown(f"**Source**: {rq_row.get('source_name', '?')} | **Reason**: {rq_row.get('reason_flagged', '?')}")
 
-                    # Show extracted data
+                    # Show extracted data (already JSON text from _review_queue_cached)
                     ext = rq_row.get("extracted_data")
                     if ext:
-                        if isinstance(ext, str):
-                            try:
-                                ext = json.loads(ext)
-                            except Exception:
-                                pass
                         st.json(ext)
 
-                    if rq_status == "pending":
-                        bc1, bc2 = st.columns(2)
-                        with bc1:
-                            if st.button("✅ Approve", key=f"approve_{rq_row['id']}"):
-                                if approve_review(sb, rq_row["id"]):
-                                    st.success("Approved!")
-                                    st.rerun()
-                        with bc2:
-                            if st.button("❌ Reject", key=f"reject_{rq_row['id']}"):
-                                if reject_review(sb, rq_row["id"]):
-                                    st.success("Rejected.")
-                                    st.rerun()
+            # One UPDATE for the whole selection instead of one per item
+            if rq_status == "pending":
+                bc1, bc2 = st.columns(2)
+                if bc1.button(f"✅ Approve selected ({len(selected_ids)})", disabled=not selected_ids, key="rq_approve_sel"):
+                    if bulk_update_review(sb, selected_ids, "approved"):
+                        st.success(f"Approved {len(selected_ids)} item(s).")
+                        _invalidate()
+                        st.rerun()
+                if bc2.button(f"❌ Reject selected ({len(selected_ids)})", disabled=not selected_ids, key="rq_reject_sel"):
+                    if bulk_update_review(sb, selected_ids, "rejected"):
+                        st.success(f"Rejected {len(selected_ids)} item(s).")
+                        _invalidate()
+                        st.rerun()
         else:
             st.info(f"No {rq_status} items in the review queue.")
 
     # ── Scraper Runs ──────────────────────────────────────
     with sub_runs:
-        df_sr = load_scraper_runs_admin(sb)
+        df_sr, sr_last_page, sr_has_more = _paged_frame("runs", _scraper_runs_cached, SCRAPER_RUNS_PAGE_SIZE)
         if not df_sr.empty:
-            st.dataframe(df_sr, use_container_width=True, hide_index=True, height=400)
+            st.dataframe(df_sr.drop(columns=["id"]), use_container_width=True, hide_index=True, height=400)
+            if sr_has_more:
+                _load_more_button("runs", sr_last_page, "run_date")
         else:
             st.info("No scraper runs yet.")
 
     # ── Pipeline Costs ────────────────────────────────────
     with sub_costs:
-        cost_stats = get_cost_summary(sb)
+        df_costs, costs_last_page, costs_has_more = _paged_frame("costs", _pipeline_costs_cached, PIPELINE_COSTS_LIMIT)
+        # Once every row is loaded, sum those instead of scanning the table again
+        cost_stats = _costs_tab_cached()[0] if costs_has_more else summarize_costs(df_costs)
         cm1, cm2, cm3, cm4 = st.columns(4)
         cm1.metric("💵 Total Cost", f"${cost_stats['total_cost_usd']:.4f}")
         cm2.metric("📥 Input Tokens", f"{cost_stats['total_input_tokens']:,}")
         cm3.metric("📤 Output Tokens", f"{cost_stats['total_output_tokens']:,}")
         cm4.metric("🔢 API Calls", cost_stats["total_calls"])
 
-        df_costs = load_pipeline_costs_admin(sb)
         if not df_costs.empty:
-            st.dataframe(df_costs, use_container_width=True, hide_index=True, height=350)
+            st.dataframe(df_costs.drop(columns=["id"]), use_container_width=True, hide_index=True, height=350)
+            if costs_has_more:
+                _load_more_button("costs", costs_last_page, "logged_at")
         else:
             st.info("No cost data yet.")
+
+
+# ═══════════════════════════════════════════════════════════
+# Section navigation
+# ═══════════════════════════════════════════════════════════
+# st.tabs runs every tab body on each rerun, so sections are picked with a
+# radio instead and only the active one is rendered (and queried). Widgets
+# of hidden sections lose their state, so anything that must survive a
+# section switch (the filter forms' *_filter_state, paging cursors) lives
+# in plain session_state keys instead.
+SECTIONS = {
+    "📊 Overview": _render_overview_tab,
+    "🏢 Companies": _render_companies_tab,
+    "🏭 Sectors": _render_sectors_tab,
+    "🔗 Relationships": _render_relationships_tab,
+    "👔 People": _render_people_tab,
+    "📅 Events": _render_events_tab,
+    "📰 Scraped Data": _render_scraped_tab,
+}
+active_section = st.radio("Section", list(SECTIONS), horizontal=True, label_visibility="collapsed", key="admin_section")
+SECTIONS[active_section]()
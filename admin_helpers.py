@@ -3,36 +3,177 @@ MIIM Admin Dashboard — Database CRUD Helpers
 All direct Supabase operations for the admin interface.
 """
 
+import importlib.util
 import logging
+import httpx
 import pandas as pd
-from datetime import datetime
+import pyarrow as pa
+import pyarrow.compute as pc
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from typing import Optional
+from supabase import ClientOptions, create_client
+from postgrest.types import ReturnMethod
 
 logger = logging.getLogger("miim.admin")
 
+# Shared pool for fanning out independent Supabase reads
+_executor = ThreadPoolExecutor(max_workers=4)
+
+
+# ─── Client ───────────────────────────────────────────────
+
+# httpx only negotiates HTTP/2 when the optional h2 package is present
+_HAS_H2 = importlib.util.find_spec("h2") is not None
+
+
+def create_admin_client(url: str, key: str):
+    """Create a Supabase client on a pooled keep-alive httpx transport.
+
+    Create it once per process (admin.py wraps this in st.cache_resource) so
+    every query reuses open connections instead of redoing TLS handshakes.
+    With h2 installed (httpx[http2]) the concurrent loaders share one
+    multiplexed HTTP/2 connection; httpx already asks for gzip responses.
+    """
+    http = httpx.Client(
+        http2=_HAS_H2,
+        timeout=120,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=50, keepalive_expiry=30),
+    )
+    try:
+        return create_client(url, key, options=ClientOptions(httpx_client=http))
+    except TypeError as e:
+        # Older supabase-py releases don't accept a custom httpx client
+        logger.warning(f"create_admin_client: using default transport ({e})")
+        http.close()
+        return create_client(url, key)
+
+
+# Ids per .in_() request, keeping the query string well under URL length limits
+IN_BATCH_SIZE = 100
+
+
+def _select_in(sb, table: str, columns: str, key: str, ids: list) -> list[dict]:
+    """Select rows whose key is in ids, one request per IN_BATCH_SIZE distinct ids."""
+    unique_ids = list(dict.fromkeys(i for i in ids if i))
+    rows = []
+    for start in range(0, len(unique_ids), IN_BATCH_SIZE):
+        chunk = unique_ids[start:start + IN_BATCH_SIZE]
+        rows.extend(sb.table(table).select(columns).in_(key, chunk).execute().data or [])
+    return rows
+
+
+def _after_cursor(q, sort_col: str, after: Optional[tuple]):
+    """Apply a keyset cursor for (sort_col desc, id desc) ordering.
+
+    after is the (sort value, id) of the last row already shown; rows strictly
+    after it are kept, with id breaking ties between equal sort values.
+    """
+    if not after:
+        return q
+    last_value, last_id = after
+    return q.or_(f'{sort_col}.lt."{last_value}",and({sort_col}.eq."{last_value}",id.lt."{last_id}")')
+
+
+# Rows per bulk insert/upsert request
+WRITE_BATCH_SIZE = 1000
+
+
+def _write_bulk(sb, table: str, rows: list[dict], id_col: str, on_conflict: str = None) -> list[str]:
+    """Insert (or upsert on on_conflict) rows in WRITE_BATCH_SIZE chunks; returns the new ids."""
+    ids = []
+    for start in range(0, len(rows), WRITE_BATCH_SIZE):
+        chunk = rows[start:start + WRITE_BATCH_SIZE]
+        if on_conflict:
+            resp = sb.table(table).upsert(chunk, on_conflict=on_conflict).execute()
+        else:
+            resp = sb.table(table).insert(chunk).execute()
+        ids.extend(r[id_col] for r in resp.data or [])
+    return ids
+
+
+def _frame_with_embed(rows: list, embed: str, fields: dict) -> pd.DataFrame:
+    """Build a DataFrame from PostgREST rows, lifting fields of one embedded
+    resource into flat columns ({embedded_field: column_name}, "" if missing)."""
+    if not rows:
+        return pd.DataFrame()
+    return _lift_embed(pd.DataFrame(rows), embed, fields)
+
+
+def _lift_embed(df: pd.DataFrame, embed: str, fields: dict, default: str = "") -> pd.DataFrame:
+    """Replace an embedded-resource column of df with flat columns, in place."""
+    nested = df.pop(embed) if embed in df.columns else pd.Series([None] * len(df), index=df.index, dtype=object)
+    for field, column in fields.items():
+        df[column] = nested.str.get(field).fillna(default)
+    return df
+
+
+def _arrow_frame(rows: list, embed: str = None, fields: dict = None) -> pd.DataFrame:
+    """Build a pyarrow-backed DataFrame, optionally lifting embedded fields
+    like _frame_with_embed. st.dataframe ships Arrow to the browser anyway,
+    so this skips building object-dtype columns first."""
+    if not rows:
+        return pd.DataFrame()
+    try:
+        table = pa.Table.from_pylist(rows)
+    except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+        logger.warning(f"_arrow_frame: falling back to object columns ({e})")
+        return _frame_with_embed(rows, embed, fields) if embed else pd.DataFrame(rows)
+    if embed:
+        nested = table.column(embed) if embed in table.column_names else None
+        if nested is not None:
+            table = table.drop_columns([embed])
+        for field, column in fields.items():
+            if nested is not None and pa.types.is_struct(nested.type) and nested.type.get_field_index(field) >= 0:
+                values = pc.fill_null(pc.struct_field(nested, field).cast(pa.string()), "")
+            else:
+                values = pa.array([""] * table.num_rows, type=pa.string())
+            table = table.append_column(column, values)
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
 
 # ─── Companies ────────────────────────────────────────────
 
-def load_companies_admin(sb) -> pd.DataFrame:
-    """Load all companies with sector names for admin table."""
+# Columns shown in the admin companies table; the edit form fetches the full row
+COMPANY_LIST_COLUMNS = "company_id, company_name, headquarters_city, employee_count, ownership_type, tier_level, data_confidence"
+
+
+def load_companies_admin(sb, sector_id: str = None, ownership_type: str = None,
+                         tier_level: str = None, name_ilike: str = None,
+                         columns: str = COMPANY_LIST_COLUMNS) -> pd.DataFrame:
+    """Load companies with sector names for admin table, filtered server-side."""
     try:
-        resp = (
-            sb.table("companies")
-            .select("*, sectors(sector_name)")
-            .order("company_name")
-            .execute()
-        )
-        rows = []
-        for r in resp.data or []:
-            sector = r.pop("sectors", None) or {}
-            r["sector_name"] = sector.get("sector_name", "")
-            rows.append(r)
-        return pd.DataFrame(rows) if rows else pd.DataFrame()
+        q = sb.table("companies").select(f"{columns}, sectors(sector_name)")
+        if sector_id:
+            q = q.eq("sector_id", sector_id)
+        if ownership_type:
+            q = q.eq("ownership_type", ownership_type)
+        if tier_level:
+            q = q.eq("tier_level", tier_level)
+        if name_ilike:
+            q = q.ilike("company_name", f"%{name_ilike}%")
+        resp = q.order("company_name").execute()
+        return _frame_with_embed(resp.data, "sectors", {"sector_name": "sector_name"})
     except Exception as e:
         logger.error(f"load_companies_admin: {e}")
         return pd.DataFrame()
 
 
+def get_company(sb, company_id: str) -> dict:
+    """Load every column of a single company (with sector name) for editing."""
+    try:
+        resp = sb.table("companies").select("*, sectors(sector_name)").eq("company_id", company_id).limit(1).execute()
+        if not resp.data:
+            return {}
+        row = resp.data[0]
+        sector = row.pop("sectors", None) or {}
+        row["sector_name"] = sector.get("sector_name", "")
+        return row
+    except Exception as e:
+        logger.error(f"get_company: {e}")
+        return {}
+
+
 def create_company(sb, data: dict) -> Optional[str]:
     """Insert a new company. Returns company_id or None."""
     try:
@@ -43,10 +184,28 @@ def create_company(sb, data: dict) -> Optional[str]:
         return None
 
 
+def create_companies_bulk(sb, rows: list[dict]) -> list[str]:
+    """Insert many companies in as few requests as possible. Returns their company_ids."""
+    try:
+        return _write_bulk(sb, "companies", rows, "company_id")
+    except Exception as e:
+        logger.error(f"create_companies_bulk: {e}")
+        return []
+
+
+def upsert_companies_bulk(sb, rows: list[dict]) -> list[str]:
+    """Insert or update many companies keyed on company_id. Returns their company_ids."""
+    try:
+        return _write_bulk(sb, "companies", rows, "company_id", on_conflict="company_id")
+    except Exception as e:
+        logger.error(f"upsert_companies_bulk: {e}")
+        return []
+
+
 def update_company(sb, company_id: str, data: dict) -> bool:
     """Update a company by ID."""
     try:
-        sb.table("companies").update(data).eq("company_id", company_id).execute()
+        sb.table("companies").update(data, returning=ReturnMethod.minimal).eq("company_id", company_id).execute()
         return True
     except Exception as e:
         logger.error(f"update_company: {e}")
@@ -56,7 +215,7 @@ def update_company(sb, company_id: str, data: dict) -> bool:
 def delete_company(sb, company_id: str) -> bool:
     """Delete a company by ID."""
     try:
-        sb.table("companies").delete().eq("company_id", company_id).execute()
+        sb.table("companies").delete(returning=ReturnMethod.minimal).eq("company_id", company_id).execute()
         return True
     except Exception as e:
         logger.error(f"delete_company: {e}")
@@ -93,9 +252,17 @@ def create_sector(sb, data: dict) -> Optional[str]:
         return None
 
 
+def create_sectors_bulk(sb, rows: list[dict]) -> list[str]:
+    try:
+        return _write_bulk(sb, "sectors", rows, "sector_id")
+    except Exception as e:
+        logger.error(f"create_sectors_bulk: {e}")
+        return []
+
+
 def update_sector(sb, sector_id: str, data: dict) -> bool:
     try:
-        sb.table("sectors").update(data).eq("sector_id", sector_id).execute()
+        sb.table("sectors").update(data, returning=ReturnMethod.minimal).eq("sector_id", sector_id).execute()
         return True
     except Exception as e:
         logger.error(f"update_sector: {e}")
@@ -104,7 +271,7 @@ def update_sector(sb, sector_id: str, data: dict) -> bool:
 
 def delete_sector(sb, sector_id: str) -> bool:
     try:
-        sb.table("sectors").delete().eq("sector_id", sector_id).execute()
+        sb.table("sectors").delete(returning=ReturnMethod.minimal).eq("sector_id", sector_id).execute()
         return True
     except Exception as e:
         logger.error(f"delete_sector: {e}")
@@ -122,14 +289,10 @@ def load_relationships_admin(sb) -> pd.DataFrame:
             .order("created_at", desc=True)
             .execute()
         )
-        rows = []
-        for r in resp.data or []:
-            src = r.pop("source", None) or {}
-            tgt = r.pop("target", None) or {}
-            r["source_name"] = src.get("company_name", "?")
-            r["target_name"] = tgt.get("company_name", "?")
-            rows.append(r)
-        return pd.DataFrame(rows) if rows else pd.DataFrame()
+        if not resp.data:
+            return pd.DataFrame()
+        df = _lift_embed(pd.DataFrame(resp.data), "source", {"company_name": "source_name"}, default="?")
+        return _lift_embed(df, "target", {"company_name": "target_name"}, default="?")
     except Exception as e:
         logger.error(f"load_relationships_admin: {e}")
         return pd.DataFrame()
@@ -144,9 +307,17 @@ def create_relationship(sb, data: dict) -> Optional[str]:
         return None
 
 
+def create_relationships_bulk(sb, rows: list[dict]) -> list[str]:
+    try:
+        return _write_bulk(sb, "company_relationships", rows, "id")
+    except Exception as e:
+        logger.error(f"create_relationships_bulk: {e}")
+        return []
+
+
 def delete_relationship(sb, rel_id: str) -> bool:
     try:
-        sb.table("company_relationships").delete().eq("id", rel_id).execute()
+        sb.table("company_relationships").delete(returning=ReturnMethod.minimal).eq("id", rel_id).execute()
         return True
     except Exception as e:
         logger.error(f"delete_relationship: {e}")
@@ -155,18 +326,17 @@ def delete_relationship(sb, rel_id: str) -> bool:
 
 # ─── People ───────────────────────────────────────────────
 
+# What the People tab shows; company_people_person_name_idx covers it
+PEOPLE_COLUMNS = "id, company_id, person_name, role_title, role_type, companies(company_name)"
+
+
 def load_people_admin(sb, company_id: str = None) -> pd.DataFrame:
     try:
-        q = sb.table("company_people").select("*, companies(company_name)")
+        q = sb.table("company_people").select(PEOPLE_COLUMNS)
         if company_id:
             q = q.eq("company_id", company_id)
         resp = q.order("person_name").execute()
-        rows = []
-        for r in resp.data or []:
-            co = r.pop("companies", None) or {}
-            r["company_name"] = co.get("company_name", "")
-            rows.append(r)
-        return pd.DataFrame(rows) if rows else pd.DataFrame()
+        return _frame_with_embed(resp.data, "companies", {"company_name": "company_name"})
     except Exception as e:
         logger.error(f"load_people_admin: {e}")
         return pd.DataFrame()
@@ -181,9 +351,17 @@ def create_person(sb, data: dict) -> Optional[str]:
         return None
 
 
+def create_people_bulk(sb, rows: list[dict]) -> list[str]:
+    try:
+        return _write_bulk(sb, "company_people", rows, "id")
+    except Exception as e:
+        logger.error(f"create_people_bulk: {e}")
+        return []
+
+
 def delete_person(sb, person_id: str) -> bool:
     try:
-        sb.table("company_people").delete().eq("id", person_id).execute()
+        sb.table("company_people").delete(returning=ReturnMethod.minimal).eq("id", person_id).execute()
         return True
     except Exception as e:
         logger.error(f"delete_person: {e}")
@@ -200,12 +378,7 @@ def load_events_admin(sb) -> pd.DataFrame:
             .order("event_date", desc=True)
             .execute()
         )
-        rows = []
-        for r in resp.data or []:
-            co = r.pop("companies", None) or {}
-            r["company_name"] = co.get("company_name", "")
-            rows.append(r)
-        return pd.DataFrame(rows) if rows else pd.DataFrame()
+        return _frame_with_embed(resp.data, "companies", {"company_name": "company_name"})
     except Exception as e:
         logger.error(f"load_events_admin: {e}")
         return pd.DataFrame()
@@ -220,9 +393,17 @@ def create_event(sb, data: dict) -> Optional[str]:
         return None
 
 
+def create_events_bulk(sb, rows: list[dict]) -> list[str]:
+    try:
+        return _write_bulk(sb, "events", rows, "event_id")
+    except Exception as e:
+        logger.error(f"create_events_bulk: {e}")
+        return []
+
+
 def update_event(sb, event_id: str, data: dict) -> bool:
     try:
-        sb.table("events").update(data).eq("event_id", event_id).execute()
+        sb.table("events").update(data, returning=ReturnMethod.minimal).eq("event_id", event_id).execute()
         return True
     except Exception as e:
         logger.error(f"update_event: {e}")
@@ -231,7 +412,7 @@ def update_event(sb, event_id: str, data: dict) -> bool:
 
 def delete_event(sb, event_id: str) -> bool:
     try:
-        sb.table("events").delete().eq("event_id", event_id).execute()
+        sb.table("events").delete(returning=ReturnMethod.minimal).eq("event_id", event_id).execute()
         return True
     except Exception as e:
         logger.error(f"delete_event: {e}")
@@ -240,31 +421,46 @@ def delete_event(sb, event_id: str) -> bool:
 
 # ─── Articles ─────────────────────────────────────────────
 
-def load_articles_admin(sb, source_filter: str = None, status_filter: str = None, limit: int = 200) -> pd.DataFrame:
+def load_articles_admin(sb, source_filter: str = None, status_filter: str = None, limit: int = 200,
+                        title_ilike: str = None, after: Optional[tuple] = None) -> pd.DataFrame:
+    """Load one page of articles, newest first (after: see _after_cursor)."""
     try:
         q = sb.table("articles").select("id, source_name, source_url, title, published_date, language, processing_status, scraped_date")
         if source_filter and source_filter != "All":
             q = q.eq("source_name", source_filter)
         if status_filter and status_filter != "All":
             q = q.eq("processing_status", status_filter)
-        resp = q.order("scraped_date", desc=True).limit(limit).execute()
-        return pd.DataFrame(resp.data) if resp.data else pd.DataFrame()
+        if title_ilike:
+            q = q.ilike("title", f"%{title_ilike}%")
+        q = _after_cursor(q, "scraped_date", after)
+        resp = q.order("scraped_date", desc=True).order("id", desc=True).limit(limit).execute()
+        return _arrow_frame(resp.data)
     except Exception as e:
         logger.error(f"load_articles_admin: {e}")
         return pd.DataFrame()
 
 
 def get_article_text(sb, article_id: str) -> str:
+    return get_article_texts(sb, [article_id]).get(article_id, "")
+
+
+def get_article_texts(sb, article_ids: list[str]) -> dict[str, str]:
+    """Fetch article_text for many articles at once, keyed by article id."""
     try:
-        resp = sb.table("articles").select("article_text").eq("id", article_id).single().execute()
-        return resp.data.get("article_text", "") if resp.data else ""
+        rows = _select_in(sb, "articles", "id, article_text", "id", article_ids)
+        return {r["id"]: r.get("article_text") or "" for r in rows}
     except Exception as e:
-        logger.error(f"get_article_text: {e}")
-        return ""
+        logger.error(f"get_article_texts: {e}")
+        return {}
 
 
 def get_article_sources(sb) -> list[str]:
-    """Get distinct source names."""
+    """Get distinct source names (list_article_sources RPC, falling back to a client-side dedupe)."""
+    try:
+        resp = sb.rpc("list_article_sources").execute()
+        return [r["source_name"] for r in resp.data or []]
+    except Exception as e:
+        logger.warning(f"list_article_sources RPC failed, deduplicating client-side: {e}")
     try:
         resp = sb.table("articles").select("source_name").execute()
         return sorted(set(r["source_name"] for r in (resp.data or []) if r.get("source_name")))
@@ -284,13 +480,7 @@ def load_extractions_admin(sb, limit: int = 100) -> pd.DataFrame:
             .limit(limit)
             .execute()
         )
-        rows = []
-        for r in resp.data or []:
-            art = r.pop("articles", None) or {}
-            r["article_title"] = art.get("title", "")
-            r["source_name"] = art.get("source_name", "")
-            rows.append(r)
-        return pd.DataFrame(rows) if rows else pd.DataFrame()
+        return _arrow_frame(resp.data, "articles", {"title": "article_title", "source_name": "source_name"})
     except Exception as e:
         logger.error(f"load_extractions_admin: {e}")
         return pd.DataFrame()
@@ -298,11 +488,16 @@ def load_extractions_admin(sb, limit: int = 100) -> pd.DataFrame:
 
 def get_extraction_data(sb, extraction_id: str) -> dict:
     """Get the full extraction_data JSONB for one result."""
+    return get_extraction_data_many(sb, [extraction_id]).get(extraction_id, {})
+
+
+def get_extraction_data_many(sb, extraction_ids: list[str]) -> dict[str, dict]:
+    """Fetch extraction_data for many results at once, keyed by extraction id."""
     try:
-        resp = sb.table("extraction_results").select("extraction_data").eq("id", extraction_id).single().execute()
-        return resp.data.get("extraction_data", {}) if resp.data else {}
+        rows = _select_in(sb, "extraction_results", "id, extraction_data", "id", extraction_ids)
+        return {r["id"]: r.get("extraction_data") or {} for r in rows}
     except Exception as e:
-        logger.error(f"get_extraction_data: {e}")
+        logger.error(f"get_extraction_data_many: {e}")
         return {}
 
 
@@ -318,57 +513,58 @@ def load_review_queue_admin(sb, status: str = "pending", limit: int = 100) -> pd
             .limit(limit)
             .execute()
         )
-        rows = []
-        for r in resp.data or []:
-            art = r.pop("articles", None) or {}
-            r["article_title"] = art.get("title", "")
-            r["source_name"] = art.get("source_name", "")
-            r["article_url"] = art.get("source_url", "")
-            rows.append(r)
-        return pd.DataFrame(rows) if rows else pd.DataFrame()
+        return _frame_with_embed(
+            resp.data, "articles",
+            {"title": "article_title", "source_name": "source_name", "source_url": "article_url"},
+        )
     except Exception as e:
         logger.error(f"load_review_queue_admin: {e}")
         return pd.DataFrame()
 
 
-def approve_review(sb, review_id: str) -> bool:
-    """Quick approve — update status to approved."""
+def bulk_update_review(sb, review_ids: list[str], status: str) -> bool:
+    """Set the status of many review items in a single UPDATE."""
+    if not review_ids:
+        return True
     try:
         sb.table("review_queue").update({
-            "status": "approved",
-            "reviewed_at": datetime.utcnow().isoformat(),
-        }).eq("id", review_id).execute()
+            "status": status,
+            "reviewed_at": datetime.now(timezone.utc).isoformat(),
+        }, returning=ReturnMethod.minimal).in_("id", list(review_ids)).execute()
         return True
     except Exception as e:
-        logger.error(f"approve_review: {e}")
+        logger.error(f"bulk_update_review: {e}")
         return False
 
 
+def approve_review(sb, review_id: str) -> bool:
+    """Quick approve — update status to approved."""
+    return bulk_update_review(sb, [review_id], "approved")
+
+
 def reject_review(sb, review_id: str) -> bool:
     """Quick reject — update status to rejected."""
-    try:
-        sb.table("review_queue").update({
-            "status": "rejected",
-            "reviewed_at": datetime.utcnow().isoformat(),
-        }).eq("id", review_id).execute()
-        return True
-    except Exception as e:
-        logger.error(f"reject_review: {e}")
-        return False
+    return bulk_update_review(sb, [review_id], "rejected")
 
 
 # ─── Scraper Runs ─────────────────────────────────────────
 
-def load_scraper_runs_admin(sb, limit: int = 50) -> pd.DataFrame:
+SCRAPER_RUN_COLUMNS = ("id, source_name, run_date, articles_found, articles_new, articles_duplicate, "
+                       "processing_time_seconds, status, error_message")
+
+
+def load_scraper_runs_admin(sb, limit: int = 50, after: Optional[tuple] = None) -> pd.DataFrame:
+    """Load one page of scraper runs, newest first (after: see _after_cursor)."""
     try:
+        q = sb.table("scraper_runs").select(SCRAPER_RUN_COLUMNS)
         resp = (
-            sb.table("scraper_runs")
-            .select("*")
+            _after_cursor(q, "run_date", after)
             .order("run_date", desc=True)
+            .order("id", desc=True)
             .limit(limit)
             .execute()
         )
-        return pd.DataFrame(resp.data) if resp.data else pd.DataFrame()
+        return _arrow_frame(resp.data)
     except Exception as e:
         logger.error(f"load_scraper_runs_admin: {e}")
         return pd.DataFrame()
@@ -376,23 +572,75 @@ def load_scraper_runs_admin(sb, limit: int = 50) -> pd.DataFrame:
 
 # ─── Pipeline Costs ───────────────────────────────────────
 
-def load_pipeline_costs_admin(sb, limit: int = 100) -> pd.DataFrame:
+PIPELINE_COST_COLUMNS = "id, logged_at, model, input_tokens, output_tokens, cost_usd, article_id, extraction_result_id"
+
+
+def load_pipeline_costs_admin(sb, limit: int = 100, after: Optional[tuple] = None) -> pd.DataFrame:
+    """Load one page of cost rows, newest first (after: see _after_cursor)."""
     try:
+        q = sb.table("pipeline_costs").select(PIPELINE_COST_COLUMNS)
         resp = (
-            sb.table("pipeline_costs")
-            .select("*")
+            _after_cursor(q, "logged_at", after)
             .order("logged_at", desc=True)
+            .order("id", desc=True)
             .limit(limit)
             .execute()
         )
-        return pd.DataFrame(resp.data) if resp.data else pd.DataFrame()
+        return _arrow_frame(resp.data)
     except Exception as e:
         logger.error(f"load_pipeline_costs_admin: {e}")
         return pd.DataFrame()
 
 
+def summarize_costs(df: pd.DataFrame) -> dict:
+    """Cost summary (same keys as get_cost_summary) computed from already-loaded pipeline_costs rows."""
+    if df.empty:
+        return {"total_cost_usd": 0, "total_input_tokens": 0, "total_output_tokens": 0, "total_calls": 0}
+    totals = df.reindex(columns=["cost_usd", "input_tokens", "output_tokens"]).fillna(0).sum()
+    return {
+        "total_cost_usd": round(float(totals["cost_usd"]), 4),
+        "total_input_tokens": int(totals["input_tokens"]),
+        "total_output_tokens": int(totals["output_tokens"]),
+        "total_calls": len(df),
+    }
+
+
+def _cost_summary_from_row(row: dict) -> dict:
+    return {
+        "total_cost_usd": round(float(row.get("total_cost_usd") or 0), 4),
+        "total_input_tokens": int(row.get("total_input_tokens") or 0),
+        "total_output_tokens": int(row.get("total_output_tokens") or 0),
+        "total_calls": int(row.get("total_calls") or 0),
+    }
+
+
+def load_costs_tab(sb, limit: int = 100) -> tuple[dict, pd.DataFrame]:
+    """Cost summary and the first page of cost rows in one round-trip.
+
+    Uses the costs_tab RPC (supabase/migrations); if it is not deployed, the
+    summary and the page are fetched as two concurrent queries.
+    """
+    try:
+        resp = sb.rpc("costs_tab", {"limit_n": limit}).execute()
+        data = resp.data or {}
+        return _cost_summary_from_row(data.get("summary") or {}), _arrow_frame(data.get("rows") or [])
+    except Exception as e:
+        logger.warning(f"costs_tab RPC failed, falling back to separate queries: {e}")
+    f_rows = _executor.submit(load_pipeline_costs_admin, sb, limit=limit)
+    return get_cost_summary(sb), f_rows.result()
+
+
 def get_cost_summary(sb) -> dict:
-    """Get total costs and token usage."""
+    """Get total costs and token usage.
+
+    Uses the get_cost_summary RPC (supabase/migrations) and falls back to
+    summing rows client-side if the function is not deployed.
+    """
+    try:
+        resp = sb.rpc("get_cost_summary").execute()
+        return _cost_summary_from_row(resp.data[0] if resp.data else {})
+    except Exception as e:
+        logger.warning(f"get_cost_summary RPC failed, summing client-side: {e}")
     try:
         resp = sb.table("pipeline_costs").select("cost_usd, input_tokens, output_tokens").execute()
         data = resp.data or []
@@ -412,22 +660,71 @@ def get_cost_summary(sb) -> dict:
 
 # ─── Overview Stats ───────────────────────────────────────
 
-def get_overview_stats(sb) -> dict:
-    """Get all overview metrics in one call."""
+def _overview_from_row(row: dict) -> dict:
+    return {
+        "total_companies": int(row.get("total_companies") or 0),
+        "total_articles": int(row.get("total_articles") or 0),
+        "pending_reviews": int(row.get("pending_reviews") or 0),
+        "total_cost_usd": round(float(row.get("total_cost_usd") or 0), 4),
+    }
+
+
+def load_overview_tab(sb, limit: int = 10) -> tuple[dict, pd.DataFrame, pd.DataFrame]:
+    """Overview stats plus the latest scraper runs and articles in one round-trip.
+
+    Uses the overview_tab RPC (supabase/migrations); if it is not deployed,
+    the three fetches run concurrently instead.
+    """
     try:
-        companies = sb.table("companies").select("company_id", count="exact").execute()
-        articles = sb.table("articles").select("id", count="exact").execute()
-        pending = sb.table("review_queue").select("id", count="exact").eq("status", "pending").execute()
-        costs = get_cost_summary(sb)
-        return {
-            "total_companies": companies.count or 0,
-            "total_articles": articles.count or 0,
-            "pending_reviews": pending.count or 0,
-            "total_cost_usd": costs["total_cost_usd"],
-        }
+        resp = sb.rpc("overview_tab", {"limit_n": limit}).execute()
+        data = resp.data or {}
+        return (
+            _overview_from_row(data.get("stats") or {}),
+            _arrow_frame(data.get("runs") or []),
+            _arrow_frame(data.get("articles") or []),
+        )
     except Exception as e:
-        logger.error(f"get_overview_stats: {e}")
-        return {"total_companies": 0, "total_articles": 0, "pending_reviews": 0, "total_cost_usd": 0}
+        logger.warning(f"overview_tab RPC failed, falling back to separate queries: {e}")
+    # get_overview_stats may itself fan out on _executor, so it runs on this thread
+    f_runs = _executor.submit(load_scraper_runs_admin, sb, limit=limit)
+    f_art = _executor.submit(load_articles_admin, sb, limit=limit)
+    return get_overview_stats(sb), f_runs.result(), f_art.result()
+
+
+def get_overview_stats(sb) -> dict:
+    """Get all overview metrics in one call.
+
+    The get_overview_stats RPC reads the precomputed overview_counters view;
+    if it is not deployed, the counts are taken per table.
+    """
+    try:
+        resp = sb.rpc("get_overview_stats").execute()
+        return _overview_from_row(resp.data[0] if resp.data else {})
+    except Exception as e:
+        logger.warning(f"get_overview_stats RPC failed, counting per table: {e}")
+    # Independent queries: run them concurrently so latency is the slowest one, not the sum
+    futures = {
+        "total_companies": _executor.submit(
+            _exact_count, "companies", sb.table("companies").select("company_id", count="exact", head=True)
+        ),
+        "total_articles": _executor.submit(_exact_count, "articles", sb.table("articles").select("id", count="exact", head=True)),
+        "pending_reviews": _executor.submit(
+            _exact_count, "review_queue", sb.table("review_queue").select("id", count="exact", head=True).eq("status", "pending")
+        ),
+        "costs": _executor.submit(get_cost_summary, sb),
+    }
+    stats = {key: fut.result() for key, fut in futures.items()}
+    stats["total_cost_usd"] = stats.pop("costs")["total_cost_usd"]
+    return stats
+
+
+def _exact_count(table: str, query) -> int:
+    """Execute a count="exact" HEAD query on table and return its count (0 on failure)."""
+    try:
+        return query.execute().count or 0
+    except Exception as e:
+        logger.error(f"_exact_count({table}): {e}")
+        return 0
 
 
 # ─── Company Options Helper ──────────────────────────────
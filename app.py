@@ -10,19 +10,34 @@ Requires:
 """
 
 import os
+import glob
+import html
 import json
+import time
+import functools
+import importlib.util
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import httpx
 import streamlit as st
 import pandas as pd
+import numpy as np
+import pyarrow as pa
 import plotly.express as px
 import plotly.graph_objects as go
-import folium
-from streamlit_folium import st_folium
+import pydeck as pdk
 import networkx as nx
 from datetime import datetime
 import streamlit.components.v1 as components
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+# Arrow-backed string columns (the default from pandas 3): loaders build
+# them straight from the JSON rows and st.dataframe ships them without a
+# numpy→Arrow conversion. Categoricals already travel as Arrow dictionaries.
+pd.set_option("future.infer_string", True)
 
 # ── Supabase client ──────────────────────────────────────
-from supabase import create_client
+from supabase import ClientOptions, create_client
 
 SUPABASE_URL = os.environ.get(
     "SUPABASE_URL", "https://rkqfjesnavbngtihffge.supabase.co"
@@ -35,7 +50,19 @@ SUPABASE_ANON_KEY = os.environ.get(
 
 @st.cache_resource
 def get_supabase_client():
-    return create_client(SUPABASE_URL, SUPABASE_ANON_KEY)
+    """One client per process on a pooled keep-alive transport (HTTP/2 when h2 is installed)."""
+    http = httpx.Client(
+        http2=importlib.util.find_spec("h2") is not None,
+        timeout=120,
+        # Idle connections outlive the once-a-minute data_version() poll, so it reuses a TLS session
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=300),
+    )
+    try:
+        return create_client(SUPABASE_URL, SUPABASE_ANON_KEY, options=ClientOptions(httpx_client=http))
+    except TypeError:
+        # Older supabase-py releases don't accept a custom httpx client
+        http.close()
+        return create_client(SUPABASE_URL, SUPABASE_ANON_KEY)
 
 
 # ── Color palette ────────────────────────────────────────
@@ -93,6 +120,17 @@ RELATIONSHIP_COLORS = {
     "competitor": "#E76F51",
 }
 
+EVENT_ICONS = {
+    "New Factory": "🏗️", "new_factory": "🏗️",
+    "Partnership": "🤝", "partnership": "🤝",
+    "Investment": "💰", "investment": "💰",
+    "Acquisition": "🔄", "acquisition": "🔄",
+    "Export Milestone": "📦", "export_milestone": "📦",
+    "Expansion": "📈", "expansion": "📈",
+    "hiring": "👥", "product_launch": "🚀",
+    "certification": "✅", "other": "📌",
+}
+
 # ── Moroccan city coordinates ────────────────────────────
 CITY_COORDS = {
     "Tanger": (35.7595, -5.8340),
@@ -124,37 +162,278 @@ CITY_COORDS = {
     "Taza": (34.2133, -4.0103),
     "Berrechid": (33.2654, -7.5876),
 }
+CITY_COORDS_DF = pd.DataFrame(
+    [(city, lat, lon) for city, (lat, lon) in CITY_COORDS.items()], columns=["headquarters_city", "lat", "lon"]
+)
 
 
 # ══════════════════════════════════════════════════════════
 #  DATA LOADING (cached)
 # ══════════════════════════════════════════════════════════
 
+# ── Disk cache ───────────────────────────────────────────
+# st.cache_data lives in one process, so every new worker or cold container
+# would re-fetch everything. Loaders decorated with disk_cached also keep a
+# zstd parquet copy that any process can serve: fresh copies are returned as-is,
+# stale ones are returned immediately while a background thread refetches.
+DISK_CACHE_DIR = os.environ.get("MIIM_CACHE_DIR", "/tmp/miim_cache")
+# Bump when a cached loader's output columns change, so old copies aren't served
+DISK_CACHE_VERSION = 6
+_revalidating = set()
+_revalidating_lock = threading.Lock()
+
+
+def _disk_cache_parts(name):
+    parts = glob.glob(os.path.join(DISK_CACHE_DIR, f"{name}-v{DISK_CACHE_VERSION}.*.parquet"))
+    return sorted(parts, key=lambda path: int(path.rsplit(".", 2)[-2]))
+
+
+def _disk_cache_version_path(name):
+    return os.path.join(DISK_CACHE_DIR, f"{name}-v{DISK_CACHE_VERSION}.version")
+
+
+def _write_disk_cache(name, result, version=None):
+    frames = result if isinstance(result, tuple) else (result,)
+    try:
+        os.makedirs(DISK_CACHE_DIR, exist_ok=True)
+        for i, df in enumerate(frames):
+            path = os.path.join(DISK_CACHE_DIR, f"{name}-v{DISK_CACHE_VERSION}.{i}.parquet")
+            tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            df.to_parquet(tmp, engine="pyarrow", compression="zstd", index=False)
+            os.replace(tmp, path)
+        # A result with fewer frames than the last one mustn't be served with its leftovers
+        for path in _disk_cache_parts(name)[len(frames):]:
+            os.remove(path)
+        with open(_disk_cache_version_path(name), "w") as f:
+            f.write(repr(version))
+    except Exception:
+        # Columns pyarrow can't serialize just mean this loader isn't disk-cached
+        pass
+
+
+def _disk_cache_matches(name, version):
+    if version is None:
+        return True
+    try:
+        with open(_disk_cache_version_path(name)) as f:
+            return f.read() == repr(version)
+    except OSError:
+        return False
+
+
+def _revalidate(name, fetch_fn, version):
+    try:
+        _write_disk_cache(name, fetch_fn(version), version)
+    except Exception:
+        pass
+    finally:
+        with _revalidating_lock:
+            _revalidating.discard(name)
+
+
+def disk_cached(name, ttl=300):
+    """Serve a loader's DataFrame (or tuple of DataFrames) from DISK_CACHE_DIR, stale-while-revalidate.
+
+    Copies older than ttl are served while a background thread refetches;
+    copies written for a different data version are never served.
+    """
+    def decorator(fetch_fn):
+        @functools.wraps(fetch_fn)
+        def wrapper(version=None):
+            parts = _disk_cache_parts(name)
+            if parts and _disk_cache_matches(name, version):
+                try:
+                    frames = tuple(pd.read_parquet(path, engine="pyarrow") for path in parts)
+                    age = time.time() - os.path.getmtime(parts[0])
+                except Exception:
+                    frames = None
+                if frames is not None:
+                    if age > ttl:
+                        with _revalidating_lock:
+                            start = name not in _revalidating
+                            _revalidating.add(name)
+                        if start:
+                            threading.Thread(target=_revalidate, args=(name, fetch_fn, version), daemon=True).start()
+                    return frames if len(frames) > 1 else frames[0]
+            result = fetch_fn(version)
+            _write_disk_cache(name, result, version)
+            return result
+        return wrapper
+    return decorator
+
+
+def clear_disk_cache():
+    for path in glob.glob(os.path.join(DISK_CACHE_DIR, "*.parquet")) + glob.glob(os.path.join(DISK_CACHE_DIR, "*.version")):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+# ── Parallel loads ───────────────────────────────────────
+@st.cache_resource
+def _loader_pool():
+    return ThreadPoolExecutor(max_workers=8, thread_name_prefix="miim-load")
+
+
+def run_parallel(*loaders):
+    """Call independent IO-bound loaders concurrently; returns their results in order.
+
+    Workers get this script run's context so st.cache_data behaves as it
+    does on the main thread.
+    """
+    ctx = get_script_run_ctx(suppress_warning=True)
+
+    def call(loader):
+        if ctx is not None:
+            add_script_run_ctx(threading.current_thread(), ctx)
+        return loader()
+
+    futures = [_loader_pool().submit(call, loader) for loader in loaders]
+    return [f.result() for f in futures]
+
+
+# ── Data version ─────────────────────────────────────────
+# Loaders are cached for a day and keyed on data_version(), a counter that
+# triggers bump on every write to the dashboard tables (supabase/migrations),
+# so a write shows up within a minute and unchanged data is never refetched.
+DATA_TTL = 24 * 60 * 60
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def data_version():
+    """Current dashboard data version; a 5-minute time bucket if the RPC isn't deployed."""
+    try:
+        return get_supabase_client().rpc("dashboard_data_version").execute().data
+    except Exception:
+        return f"t{int(time.time() // 300)}"
+
+
+def _optional(loader, version):
+    """Call an optional loader, showing a failure as an empty table (uncached, so it's retried)."""
+    try:
+        return loader(version)
+    except Exception:
+        return pd.DataFrame()
+
+
+# Company columns the dashboard reads (profile, cards, charts, map); keep in sync
+# with the companies projection in load_dashboard_bootstrap()
+COMPANY_COLUMNS = (
+    "id, company_id, company_name, sector_id, sub_sector, headquarters_city, ownership_type, tier_level, "
+    "employee_count, revenue_mad, capital_mad, investment_amount_mad, local_integration_pct, "
+    "website_url, parent_company, description, activities"
+)
+
+
+# Numeric company columns, cast to float32 once at load so display code needn't coerce
+COMPANY_NUMBER_COLUMNS = (
+    "employee_count", "revenue_mad", "capital_mad", "investment_amount_mad", "local_integration_pct",
+    "sector_target_pct", "sector_current_pct",
+)
+
+
+def _lift_embed(df, embed, fields):
+    """Replace a PostgREST embedded-object column with flat columns, column-wise.
+
+    fields maps each embedded key to (column, default); rows whose embed is
+    null (no related row) get the default, null values inside it stay null.
+    """
+    objs = df.pop(embed) if embed in df.columns else pd.Series(None, index=df.index, dtype=object)
+    present = objs.map(lambda o: isinstance(o, dict)).to_numpy(dtype=bool)
+    embedded = pd.DataFrame(objs[present].tolist(), index=df.index[present])
+    for key, (column, default) in fields.items():
+        col = embedded[key] if key in embedded.columns else pd.Series(None, index=embedded.index, dtype=object)
+        df[column] = col.reindex(df.index) if default is None else col.reindex(df.index, fill_value=default)
+    return df
+
+
+def _categorize(df, cols, shared=False):
+    """Cast low-cardinality label columns to category.
+
+    shared=True gives the columns one ordered dtype over their sorted values,
+    so they can be compared (and min/max'ed) against each other.
+    """
+    cols = [col for col in cols if col in df.columns]
+    if shared:
+        values = pd.concat([df[col] for col in cols]).dropna() if cols else pd.Series()
+        dtype = pd.CategoricalDtype(sorted(pd.unique(values)), ordered=True)
+    else:
+        dtype = "category"
+    for col in cols:
+        df[col] = df[col].astype(dtype)
+    return df
+
+
+def _format_mad(amounts):
+    """Amounts as "4.5B MAD" / "120M MAD" / "85,000 MAD" (None when missing or zero), column-wise."""
+    amt = pd.to_numeric(amounts, errors="coerce").astype("float64")
+    labels = np.select(
+        [amt >= 1e9, amt >= 1e6, amt.notna() & (amt != 0)],
+        [
+            (amt / 1e9).map("{:.1f}B MAD".format, na_action="ignore").to_numpy(dtype=object),
+            (amt / 1e6).map("{:.0f}M MAD".format, na_action="ignore").to_numpy(dtype=object),
+            amt.map("{:,.0f} MAD".format, na_action="ignore").to_numpy(dtype=object),
+        ],
+        default=None,
+    )
+    return pd.Series(labels, index=amt.index, dtype=object)
+
+
+# Profile metric labels precomputed at load: amount column -> its "…M MAD" label column
+COMPANY_MAD_LABELS = {"revenue_mad": "revenue_str", "investment_amount_mad": "investment_str", "capital_mad": "capital_str"}
+
+
+def _type_company_columns(df):
+    """Cast company columns once at load: float32 numbers and categorical low-cardinality labels."""
+    for col in COMPANY_NUMBER_COLUMNS:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors="coerce").astype("float32")
+    for col, label in COMPANY_MAD_LABELS.items():
+        if col in df.columns:
+            df[label] = _format_mad(df[col])
+    return _categorize(df, ("sector_name", "headquarters_city", "ownership_type", "tier_level", "sub_sector"))
+
 
-@st.cache_data(ttl=300)
-def load_companies():
-    """Load companies joined with sector names."""
+PARTNERSHIP_LABEL_COLUMNS = ("company_a_tier", "company_b_tier", "partnership_type")
+
+
+def _fill_unknown(s):
+    """s with missing values as "Unknown"; categoricals keep only the values actually present."""
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        s = s.cat.remove_unused_categories()
+        if s.hasnans and "Unknown" not in s.cat.categories:
+            s = s.cat.add_categories("Unknown")
+    return s.fillna("Unknown")
+
+
+@st.cache_data(ttl=DATA_TTL)
+def load_companies(version=None):
+    """Load companies joined with sector names (version only keys the cache)."""
     sb = get_supabase_client()
     resp = (
         sb.table("companies")
-        .select("*, sectors(sector_name, target_integration_pct, current_integration_pct, government_strategy, source_url, source_name_detail)")
+        .select(f"{COMPANY_COLUMNS}, sectors(sector_name, target_integration_pct, current_integration_pct, government_strategy, source_url, source_name_detail)")
         .order("company_name")
+        .order("id")
         .execute()
     )
-    rows = resp.data
-    for r in rows:
-        sector_info = r.pop("sectors", None) or {}
-        r["sector_name"] = sector_info.get("sector_name", "Unknown")
-        r["sector_target_pct"] = sector_info.get("target_integration_pct")
-        r["sector_current_pct"] = sector_info.get("current_integration_pct")
-        r["sector_source_url"] = sector_info.get("source_url")
-        r["sector_source_name"] = sector_info.get("source_name_detail")
-        r["sector_strategy"] = sector_info.get("government_strategy")
-    return pd.DataFrame(rows)
-
-
-@st.cache_data(ttl=300)
-def load_partnerships():
+    df = pd.DataFrame(resp.data)
+    if df.empty:
+        return df
+    df = _lift_embed(df, "sectors", {
+        "sector_name": ("sector_name", "Unknown"),
+        "target_integration_pct": ("sector_target_pct", None),
+        "current_integration_pct": ("sector_current_pct", None),
+        "source_url": ("sector_source_url", None),
+        "source_name_detail": ("sector_source_name", None),
+        "government_strategy": ("sector_strategy", None),
+    })
+    return _type_company_columns(df)
+
+
+@st.cache_data(ttl=DATA_TTL)
+def load_partnerships(version=None):
     """Load partnerships with company names resolved."""
     sb = get_supabase_client()
     resp = (
@@ -166,19 +445,29 @@ def load_partnerships():
         .eq("status", "Active")
         .execute()
     )
-    rows = resp.data
-    for r in rows:
-        a = r.pop("company_a", {}) or {}
-        b = r.pop("company_b", {}) or {}
-        r["company_a_name"] = a.get("company_name", "?")
-        r["company_a_tier"] = a.get("tier_level", "Unknown")
-        r["company_b_name"] = b.get("company_name", "?")
-        r["company_b_tier"] = b.get("tier_level", "Unknown")
-    return pd.DataFrame(rows)
-
-
-@st.cache_data(ttl=300)
-def load_events():
+    df = pd.DataFrame(resp.data)
+    if df.empty:
+        return df
+    df = _lift_embed(df, "company_a", {"company_name": ("company_a_name", "?"), "tier_level": ("company_a_tier", "Unknown")})
+    df = _lift_embed(df, "company_b", {"company_name": ("company_b_name", "?"), "tier_level": ("company_b_tier", "Unknown")})
+    return _categorize(df, PARTNERSHIP_LABEL_COLUMNS)
+
+
+def _add_event_labels(df):
+    """Precompute the Events tab's " — 4.5B MAD" / " — 120M MAD" amount suffix (blank under 1M)."""
+    if df.empty:
+        return df
+    amt = pd.to_numeric(df["investment_amount_mad"], errors="coerce").fillna(0)
+    df["amt_str"] = np.select(
+        [amt >= 1_000_000_000, amt >= 1_000_000],
+        [" — " + (amt / 1_000_000_000).map("{:.1f}".format) + "B MAD", " — " + (amt / 1_000_000).map("{:.0f}".format) + "M MAD"],
+        default="",
+    )
+    return df
+
+
+@st.cache_data(ttl=DATA_TTL)
+def load_events(version=None):
     sb = get_supabase_client()
     resp = (
         sb.table("events")
@@ -186,88 +475,119 @@ def load_events():
         .order("event_date", desc=True)
         .execute()
     )
-    rows = resp.data
-    for r in rows:
-        co = r.pop("companies", {}) or {}
-        r["company_name"] = co.get("company_name", "?")
-    return pd.DataFrame(rows)
-
-
-@st.cache_data(ttl=300)
-def load_relationships():
-    """Load company relationships (v2 unified table)."""
+    df = pd.DataFrame(resp.data)
+    if df.empty:
+        return df
+    return _add_event_labels(_lift_embed(df, "companies", {"company_name": ("company_name", "?")}))
+
+
+@st.cache_data(ttl=DATA_TTL)
+@disk_cached("bootstrap")
+def load_bootstrap(version=None):
+    """Load every dashboard table in one round-trip.
+
+    Uses the load_dashboard_bootstrap RPC (supabase/migrations), which returns
+    the rows already flattened: companies, partnerships, events, then the
+    relationships, people and article mentions. Falls back to the per-table
+    loaders for companies, partnerships and events only if the function is
+    not deployed; without the optional three (an older deployment) the
+    caller loads them separately, so their failures are never cached here.
+    """
     sb = get_supabase_client()
     try:
-        resp = (
-            sb.table("company_relationships")
-            .select(
-                "*, source:companies!source_company_id(id, company_name, headquarters_city, sector_id), "
-                "target:companies!target_company_id(id, company_name, headquarters_city, sector_id)"
-            )
-            .execute()
-        )
-        rows = resp.data or []
-        for r in rows:
-            src = r.pop("source", {}) or {}
-            tgt = r.pop("target", {}) or {}
-            r["source_name"] = src.get("company_name", "?")
-            r["source_city"] = src.get("headquarters_city")
-            r["target_name"] = tgt.get("company_name", "?")
-            r["target_city"] = tgt.get("headquarters_city")
-        return pd.DataFrame(rows)
+        payload = sb.rpc("load_dashboard_bootstrap").execute().data or {}
     except Exception:
-        return pd.DataFrame()
+        return tuple(run_parallel(
+            functools.partial(load_companies, version),
+            functools.partial(load_partnerships, version),
+            functools.partial(load_events, version),
+        ))
+    frames = (
+        _type_company_columns(pd.DataFrame(payload.get("companies") or [])),
+        _categorize(pd.DataFrame(payload.get("partnerships") or []), PARTNERSHIP_LABEL_COLUMNS),
+        _add_event_labels(pd.DataFrame(payload.get("events") or [])),
+    )
+    if "relationships" not in payload:
+        return frames
+    return frames + (
+        _type_relationship_columns(pd.DataFrame(payload.get("relationships") or [])),
+        pd.DataFrame(payload.get("people") or []),
+        pd.DataFrame(payload.get("articles") or []),
+    )
 
 
-@st.cache_data(ttl=300)
-def load_company_people():
-    """Load company people / management."""
-    sb = get_supabase_client()
-    try:
-        resp = (
-            sb.table("company_people")
-            .select("*, companies(company_name)")
-            .execute()
-        )
-        rows = resp.data or []
-        for r in rows:
-            co = r.pop("companies", {}) or {}
-            r["company_name"] = co.get("company_name", "?")
-        return pd.DataFrame(rows)
-    except Exception:
-        return pd.DataFrame()
+def _type_relationship_columns(df):
+    """Cast relationship labels to categoricals."""
+    # The map compares and min/max's the two city columns, hence one shared ordered dtype
+    return _categorize(_categorize(df, ("relationship_type",)), ("source_city", "target_city"), shared=True)
 
 
-@st.cache_data(ttl=300)
-def load_company_articles():
-    """Load company-article links."""
+@st.cache_data(ttl=DATA_TTL)
+@disk_cached("relationships")
+def load_relationships(version=None):
+    """Load company relationships (v2 unified table). Optional: call via _optional."""
     sb = get_supabase_client()
-    try:
-        resp = (
-            sb.table("company_articles")
-            .select("*, companies(company_name), articles(title, source_url, source_name, published_date)")
-            .execute()
+    resp = (
+        sb.table("company_relationships")
+        .select(
+            "*, source:companies!source_company_id(id, company_name, headquarters_city, sector_id), "
+            "target:companies!target_company_id(id, company_name, headquarters_city, sector_id)"
         )
-        rows = resp.data or []
-        for r in rows:
-            co = r.pop("companies", {}) or {}
-            art = r.pop("articles", {}) or {}
-            r["company_name"] = co.get("company_name", "?")
-            r["article_title"] = art.get("title", "?")
-            r["article_url"] = art.get("source_url", "")
-            r["article_source"] = art.get("source_name", "")
-            r["article_date"] = art.get("published_date", "")
-        return pd.DataFrame(rows)
-    except Exception:
-        return pd.DataFrame()
+        .order("id")
+        .execute()
+    )
+    df = pd.DataFrame(resp.data or [])
+    if df.empty:
+        return df
+    df = _lift_embed(df, "source", {"company_name": ("source_name", "?"), "headquarters_city": ("source_city", None)})
+    df = _lift_embed(df, "target", {"company_name": ("target_name", "?"), "headquarters_city": ("target_city", None)})
+    return _type_relationship_columns(df)
+
+
+@st.cache_data(ttl=DATA_TTL)
+@disk_cached("company_people")
+def load_company_people(version=None):
+    """Load company people / management. Optional: call via _optional."""
+    sb = get_supabase_client()
+    resp = (
+        sb.table("company_people")
+        .select("*, companies(company_name)")
+        .order("id")
+        .execute()
+    )
+    df = pd.DataFrame(resp.data or [])
+    if df.empty:
+        return df
+    return _lift_embed(df, "companies", {"company_name": ("company_name", "?")})
 
 
-@st.cache_data(ttl=300)
-def load_sectors():
-    """Load sectors table."""
+@st.cache_data(ttl=DATA_TTL)
+@disk_cached("company_articles")
+def load_company_articles(version=None):
+    """Load company-article links. Optional: call via _optional."""
     sb = get_supabase_client()
-    resp = sb.table("sectors").select("*").execute()
-    return pd.DataFrame(resp.data or [])
+    resp = (
+        sb.table("company_articles")
+        .select("*, companies(company_name), articles(title, source_url, source_name, published_date)")
+        .order("id")
+        .execute()
+    )
+    df = pd.DataFrame(resp.data or [])
+    if df.empty:
+        return df
+    df = _lift_embed(df, "companies", {"company_name": ("company_name", "?")})
+    return _lift_embed(df, "articles", {
+        "title": ("article_title", "?"),
+        "source_url": ("article_url", ""),
+        "source_name": ("article_source", ""),
+        "published_date": ("article_date", ""),
+    })
+
+
+@st.cache_data(ttl=DATA_TTL, show_spinner=False)
+def last_refreshed(version=None):
+    """Wall-clock time the loaders were last filled for this data version."""
+    return datetime.now().strftime("%H:%M:%S")
 
 
 # ══════════════════════════════════════════════════════════
@@ -282,8 +602,10 @@ st.set_page_config(
 )
 
 # ── Custom CSS ───────────────────────────────────────────
-st.markdown(
-    f"""
+@st.cache_resource
+def _app_css():
+    """The page stylesheet, interpolated from the palette once per process rather than every rerun."""
+    return f"""
     <style>
         /* ── Global resets ── */
         .block-container {{
@@ -467,9 +789,10 @@ st.markdown(
             line-height: 1.6;
         }}
     </style>
-    """,
-    unsafe_allow_html=True,
-)
+    """
+
+
+st.markdown(_app_css(), unsafe_allow_html=True)
 
 # ── Header ───────────────────────────────────────────────
 st.markdown(
@@ -488,13 +811,17 @@ st.markdown(
 # ══════════════════════════════════════════════════════════
 
 try:
-    df_companies = load_companies()
-    df_partnerships = load_partnerships()
-    df_events = load_events()
-    df_relationships = load_relationships()
-    df_people = load_company_people()
-    df_articles = load_company_articles()
-    df_sectors = load_sectors()
+    version = data_version()
+    bundle = load_bootstrap(version)
+    df_companies, df_partnerships, df_events = bundle[:3]
+    if len(bundle) > 3:
+        df_relationships, df_people, df_articles = bundle[3:]
+    else:
+        df_relationships, df_people, df_articles = run_parallel(
+            functools.partial(_optional, load_relationships, version),
+            functools.partial(_optional, load_company_people, version),
+            functools.partial(_optional, load_company_articles, version),
+        )
     data_loaded = True
 except Exception as e:
     st.error(f"Could not connect to database: {e}")
@@ -505,23 +832,72 @@ if not data_loaded or df_companies.empty:
     st.stop()
 
 
+@st.cache_resource(ttl=DATA_TTL, show_spinner=False)
+def _company_row_positions(version, table, n_rows, _df, key):
+    """Row positions of _df per company id column, so the profile slices instead of scanning.
+
+    Keyed on the data version (plus the row count, in case an optional table
+    failed and then loaded within one version) rather than on the frame:
+    cache_resource hands back the shared dict without hashing or unpickling.
+    The loaders order these tables by id, so refetches of one version line up.
+    """
+    if _df.empty or key not in _df.columns:
+        return {}
+    return _df.groupby(key, sort=False).indices
+
+
+def _company_rows(df, positions, company_id):
+    """df's rows for one company, or an empty frame."""
+    rows = positions.get(company_id)
+    return df.iloc[rows] if rows is not None else _NO_ROWS
+
+
+_NO_ROWS = pd.DataFrame()
+people_by_company = _company_row_positions(version, "company_people", len(df_people), df_people, "company_id")
+articles_by_company = _company_row_positions(version, "company_articles", len(df_articles), df_articles, "company_id")
+rels_by_source = _company_row_positions(version, "relationships", len(df_relationships), df_relationships, "source_company_id")
+rels_by_target = _company_row_positions(version, "relationships", len(df_relationships), df_relationships, "target_company_id")
+
+
 # ══════════════════════════════════════════════════════════
 #  SIDEBAR FILTERS
 # ══════════════════════════════════════════════════════════
 
+FILTER_COLUMNS = ("sector_name", "headquarters_city", "ownership_type", "tier_level")
+
+
+@st.cache_resource(ttl=DATA_TTL, show_spinner=False)
+def _prepare_filter_codes(version, n_rows, _df):
+    """Integer category codes per filter column (-1 = missing) and Arrow-backed lowercased names for search.
+
+    The categories are each column's sorted distinct values, so they double
+    as the sidebar's option lists. Keyed on the data version like
+    _company_row_positions, so a rerun neither hashes the companies frame
+    nor unpickles the codes.
+    """
+    codes = {}
+    for col in FILTER_COLUMNS:
+        cat = pd.Categorical(_df[col])
+        codes[col] = (cat.codes, cat.categories)
+    names = _df["company_name"].fillna("").astype(pd.ArrowDtype(pa.string())).str.lower()
+    return codes, names
+
+
+filter_codes, search_names = _prepare_filter_codes(version, len(df_companies), df_companies)
+
 with st.sidebar:
     st.markdown("### 🔎 Filters")
 
-    all_sectors = sorted(df_companies["sector_name"].dropna().unique().tolist())
+    all_sectors = filter_codes["sector_name"][1].tolist()
     selected_sectors = st.multiselect("Sector", options=all_sectors, default=[], placeholder="All sectors")
 
-    all_cities = sorted(df_companies["headquarters_city"].dropna().unique().tolist())
+    all_cities = filter_codes["headquarters_city"][1].tolist()
     selected_cities = st.multiselect("City", options=all_cities, default=[], placeholder="All cities")
 
-    all_ownership = sorted(df_companies["ownership_type"].dropna().unique().tolist())
+    all_ownership = filter_codes["ownership_type"][1].tolist()
     selected_ownership = st.multiselect("Ownership Type", options=all_ownership, default=[], placeholder="All types")
 
-    all_tiers = sorted(df_companies["tier_level"].dropna().unique().tolist())
+    all_tiers = filter_codes["tier_level"][1].tolist()
     selected_tiers = st.multiselect("Tier Level", options=all_tiers, default=[], placeholder="All tiers")
 
     st.markdown("---")
@@ -530,48 +906,55 @@ with st.sidebar:
     st.markdown("---")
     st.markdown(
         f'<p style="color:{NAVY}; font-size:0.8rem;">'
-        f"Last refreshed: {datetime.now().strftime('%H:%M:%S')}<br>"
-        f"Data cached for 5 min"
+        f"Last refreshed: {last_refreshed(version)}<br>"
+        f"Updates within a minute of a data change"
         f"</p>",
         unsafe_allow_html=True,
     )
     if st.button("🔄 Refresh data"):
         st.cache_data.clear()
+        # Refetched frames can differ under the same version; drop positions into them too
+        _company_row_positions.clear()
+        _prepare_filter_codes.clear()
+        clear_disk_cache()
         st.rerun()
 
 # ── Apply filters ────────────────────────────────────────
-mask = pd.Series(True, index=df_companies.index)
-
-if selected_sectors:
-    mask = mask & (df_companies["sector_name"].isin(selected_sectors) | df_companies["sector_name"].isna())
-
-if selected_cities:
-    mask = mask & (df_companies["headquarters_city"].isin(selected_cities) | df_companies["headquarters_city"].isna())
-
-if selected_ownership:
-    mask = mask & (df_companies["ownership_type"].isin(selected_ownership) | df_companies["ownership_type"].isna())
-
-if selected_tiers:
-    mask = mask & (df_companies["tier_level"].isin(selected_tiers) | df_companies["tier_level"].isna())
-
+checks = []
+for col, selected in zip(FILTER_COLUMNS, (selected_sectors, selected_cities, selected_ownership, selected_tiers)):
+    col_codes, cats = filter_codes[col]
+    # Picking every option keeps every row (missing values always pass), so it's no filter
+    if selected and len(selected) < len(cats):
+        # Rows with no value stay visible under any filter, hence the extra -1
+        wanted = np.append(cats.get_indexer(selected), -1).astype(col_codes.dtype)
+        checks.append(np.isin(col_codes, wanted))
 if search_query:
-    mask = mask & df_companies["company_name"].str.contains(search_query, case=False, na=False)
+    # Fixed-string match runs as one pyarrow compute kernel over the cached lowercase names
+    checks.append(search_names.str.contains(search_query.lower(), regex=False).to_numpy(dtype=bool))
 
-df_filtered = df_companies[mask].copy()
+# No active filter is the common case: reuse the frame (st.cache_data already
+# handed this run its own copy) instead of masking and copying every row
+df_filtered = df_companies.iloc[np.logical_and.reduce(checks)] if checks else df_companies
 
 
 # ══════════════════════════════════════════════════════════
 #  KPI METRICS ROW
 # ══════════════════════════════════════════════════════════
 
+# One aggregation pass over the filtered frame feeds every company KPI
+n_companies = len(df_filtered)
+if n_companies:
+    kpi_stats = df_filtered.agg({"sector_name": "nunique", "employee_count": "sum"})
+    n_sectors, total_employees = int(kpi_stats["sector_name"]), float(kpi_stats["employee_count"])
+else:
+    n_sectors = total_employees = 0
+
 col1, col2, col3, col4, col5 = st.columns(5)
 with col1:
-    st.metric("🏢 Companies", len(df_filtered))
+    st.metric("🏢 Companies", n_companies)
 with col2:
-    n_sectors = df_filtered["sector_name"].nunique() if not df_filtered.empty else 0
     st.metric("🏭 Sectors", n_sectors)
 with col3:
-    total_employees = df_filtered["employee_count"].astype(float).sum() if not df_filtered.empty else 0
     st.metric("👥 Employees", f"{total_employees:,.0f}")
 with col4:
     n_rels = len(df_relationships) if not df_relationships.empty else 0
@@ -589,17 +972,76 @@ with col5:
 def _build_sector_stats(df):
     agg_dict = {
         "company_count": ("company_name", "count"),
-        "total_employees": ("employee_count", lambda x: x.astype(float).sum()),
-        "cities": ("headquarters_city", lambda x: x.dropna().nunique()),
+        "total_employees": ("employee_count", "sum"),
+        "cities": ("headquarters_city", "nunique"),
     }
     if "investment_amount_mad" in df.columns:
-        agg_dict["total_investment"] = ("investment_amount_mad", lambda x: x.astype(float).sum())
-    stats = df.groupby("sector_name").agg(**agg_dict).reset_index().sort_values("company_count", ascending=False)
+        agg_dict["total_investment"] = ("investment_amount_mad", "sum")
+    stats = df.groupby("sector_name", observed=True).agg(**agg_dict).reset_index().sort_values("company_count", ascending=False)
     if "total_investment" not in stats.columns:
         stats["total_investment"] = 0
+    stats["investment_str"] = _format_mad(stats["total_investment"].where(stats["total_investment"] > 0))
     return stats
 
 
+# ── Helpers: Sectors tab charts ─────────────────────────
+# Built from the small aggregated frames and cached on them, so a rerun
+# that leaves the filters alone reuses the figures instead of rebuilding them
+@st.cache_data(ttl=DATA_TTL, show_spinner=False)
+def _sector_bar_figure(sector_counts):
+    sector_counts = sector_counts.sort_values("company_count", ascending=True)
+    fig = px.bar(
+        sector_counts, x="company_count", y="sector_name", orientation="h",
+        text="company_count",
+        labels={"company_count": "Companies", "sector_name": ""},
+    )
+    # One trace coloured per bar rather than a trace per sector
+    fig.update_traces(
+        textposition="outside",
+        marker_color=[SECTOR_COLORS.get(sector, SECTOR_COLORS["Other"]) for sector in sector_counts["sector_name"]],
+    )
+    fig.update_layout(
+        showlegend=False, plot_bgcolor="white", paper_bgcolor="white",
+        margin=dict(l=20, r=80, t=20, b=40), height=350,
+        font=dict(family="Arial", color=NAVY),
+    )
+    return fig
+
+
+@st.cache_data(ttl=DATA_TTL, show_spinner=False)
+def _ownership_pie_figure(ownership_counts):
+    fig = px.pie(
+        ownership_counts, names="ownership_type", values="count", hole=0.4,
+        color_discrete_sequence=[TEAL, NAVY, SAND, CORAL, GOLD, "#AAAAAA", "#7FB3D8"],
+    )
+    fig.update_layout(
+        margin=dict(l=20, r=20, t=20, b=20), height=350,
+        font=dict(family="Arial", color=NAVY), paper_bgcolor="white",
+    )
+    fig.update_traces(textinfo="label+percent", textposition="outside")
+    return fig
+
+
+@st.cache_data(ttl=DATA_TTL, show_spinner=False)
+def _integration_target_figure(sector_targets):
+    fig = px.bar(
+        sector_targets, x="target_pct", y="sector_name", orientation="h",
+        text=sector_targets["target_pct"].map("{:.0f}%".format),
+        labels={"target_pct": "Integration Target (%)", "sector_name": ""},
+        color="target_pct",
+        color_continuous_scale=[[0, CORAL], [0.5, SAND], [1, TEAL]],
+    )
+    fig.update_traces(textposition="outside")
+    fig.update_layout(
+        showlegend=False, coloraxis_showscale=False,
+        plot_bgcolor="white", paper_bgcolor="white",
+        xaxis=dict(range=[0, 100], gridcolor="#E8E8E8"),
+        margin=dict(l=20, r=60, t=20, b=40), height=300,
+        font=dict(family="Arial", color=NAVY),
+    )
+    return fig
+
+
 # ── Helper: render company profile ───────────────────────
 def _render_company_profile(co, co_id):
     """Render a full company profile inside any container."""
@@ -653,30 +1095,10 @@ def _render_company_profile(co, co_id):
     with m1:
         emp = co.get("employee_count")
         st.metric("👥 Employees", f"{float(emp):,.0f}" if emp and pd.notna(emp) else "N/A")
-    with m2:
-        rev = co.get("revenue_mad")
-        if rev and pd.notna(rev):
-            rev_f = float(rev)
-            rev_str = f"{rev_f/1e6:.0f}M MAD" if rev_f >= 1e6 else f"{rev_f:,.0f} MAD"
-        else:
-            rev_str = "N/A"
-        st.metric("💰 Revenue", rev_str)
-    with m3:
-        inv = co.get("investment_amount_mad")
-        if inv and pd.notna(inv):
-            inv_f = float(inv)
-            inv_str = f"{inv_f/1e6:.0f}M MAD" if inv_f >= 1e6 else f"{inv_f:,.0f} MAD"
-        else:
-            inv_str = "N/A"
-        st.metric("📈 Investment", inv_str)
-    with m4:
-        cap = co.get("capital_mad")
-        if cap and pd.notna(cap):
-            cap_f = float(cap)
-            cap_str = f"{cap_f/1e6:.0f}M MAD" if cap_f >= 1e6 else f"{cap_f:,.0f} MAD"
-        else:
-            cap_str = "N/A"
-        st.metric("🏦 Capital", cap_str)
+    for col, (label, key) in zip((m2, m3, m4), (("💰 Revenue", "revenue_str"), ("📈 Investment", "investment_str"), ("🏦 Capital", "capital_str"))):
+        with col:
+            value = co.get(key)
+            st.metric(label, value if pd.notna(value) else "N/A")
 
     col_l, col_r = st.columns(2)
     with col_l:
@@ -700,48 +1122,56 @@ def _render_company_profile(co, co_id):
             st.markdown(f"**🎯 Tier Level**: {tier}")
 
     if not df_people.empty and co_id:
-        co_people = df_people[df_people["company_id"] == co_id]
+        co_people = _company_rows(df_people, people_by_company, co_id)
         if not co_people.empty:
             st.markdown("---")
             st.markdown("**👔 Management Team**")
-            for _, p in co_people.iterrows():
-                role = p.get("role_title", "")
-                name = p.get("person_name", "")
-                st.markdown(f"- **{name}** — {role}")
+            st.markdown("\n".join(
+                f"- **{name}** — {role}"
+                for name, role in zip(
+                    co_people.get("person_name", pd.Series("", index=co_people.index)),
+                    co_people.get("role_title", pd.Series("", index=co_people.index)),
+                )
+            ))
 
+    # Shared by the Relationships table and the mini network below
+    co_rels_out = co_rels_in = _NO_ROWS
     if not df_relationships.empty and co_id:
-        co_rels_out = df_relationships[df_relationships["source_company_id"] == co_id] if "source_company_id" in df_relationships.columns else pd.DataFrame()
-        co_rels_in = df_relationships[df_relationships["target_company_id"] == co_id] if "target_company_id" in df_relationships.columns else pd.DataFrame()
-        all_rels = []
-        for _, r in co_rels_out.iterrows():
-            all_rels.append({"Company": r.get("target_name", "?"), "Type": r.get("relationship_type", ""), "Description": r.get("description", ""), "Direction": "outgoing"})
-        for _, r in co_rels_in.iterrows():
-            all_rels.append({"Company": r.get("source_name", "?"), "Type": r.get("relationship_type", ""), "Description": r.get("description", ""), "Direction": "incoming"})
-        if all_rels:
+        co_rels_out = _company_rows(df_relationships, rels_by_source, co_id)
+        co_rels_in = _company_rows(df_relationships, rels_by_target, co_id)
+    if not co_rels_out.empty or not co_rels_in.empty:
+        rel_labels = {"relationship_type": "Type", "description": "Description"}
+        all_rels = pd.concat([
+            co_rels_out.reindex(columns=["target_name", *rel_labels])
+            .rename(columns={"target_name": "Company", **rel_labels}).assign(Direction="outgoing"),
+            co_rels_in.reindex(columns=["source_name", *rel_labels])
+            .rename(columns={"source_name": "Company", **rel_labels}).assign(Direction="incoming"),
+        ], ignore_index=True)
+        if not all_rels.empty:
             st.markdown("---")
             st.markdown("**🔗 Relationships**")
-            st.dataframe(pd.DataFrame(all_rels), use_container_width=True, hide_index=True)
+            st.dataframe(all_rels, use_container_width=True, hide_index=True)
 
     if not df_articles.empty and co_id:
-        co_arts = df_articles[df_articles["company_id"] == co_id]
+        co_arts = _company_rows(df_articles, articles_by_company, co_id)
         if not co_arts.empty:
             st.markdown("---")
             st.markdown("**📰 Media Mentions**")
-            for _, a in co_arts.head(10).iterrows():
+            mentions = []
+            for a in co_arts.head(10).to_dict("records"):
                 title = a.get("article_title", "Article")
                 url = a.get("article_url", "")
                 source = a.get("article_source", "")
                 date = str(a.get("article_date", ""))[:10]
                 mention = a.get("mention_type", "")
                 if url:
-                    st.markdown(f"- [{title}]({url}) — {source} ({date}) *[{mention}]*")
+                    mentions.append(f"- [{title}]({url}) — {source} ({date}) *[{mention}]*")
                 else:
-                    st.markdown(f"- {title} — {source} ({date}) *[{mention}]*")
+                    mentions.append(f"- {title} — {source} ({date}) *[{mention}]*")
+            st.markdown("\n".join(mentions))
 
     # Mini network for this company
-    if not df_relationships.empty and co_id:
-        co_rels_out = df_relationships[df_relationships["source_company_id"] == co_id] if "source_company_id" in df_relationships.columns else pd.DataFrame()
-        co_rels_in = df_relationships[df_relationships["target_company_id"] == co_id] if "target_company_id" in df_relationships.columns else pd.DataFrame()
+    if not co_rels_out.empty or not co_rels_in.empty:
         mini_nodes = {}
         mini_edges = []
 
@@ -753,19 +1183,24 @@ def _render_company_profile(co, co_id):
             "font": {"size": 14, "bold": True},
         }
 
-        for _, r in co_rels_out.iterrows():
-            tgt = r.get("target_name", "")
-            if tgt and tgt not in mini_nodes:
-                mini_nodes[tgt] = {"id": tgt, "label": tgt, "color": "#B0C4D8", "size": 18, "title": f"<b>{tgt}</b>"}
-            if tgt:
-                mini_edges.append({"from": company_name, "to": tgt, "label": r.get("relationship_type", ""), "color": {"color": RELATIONSHIP_COLORS.get(r.get("relationship_type", ""), "#B0C4D8")}, "width": 2})
-
-        for _, r in co_rels_in.iterrows():
-            src = r.get("source_name", "")
-            if src and src not in mini_nodes:
-                mini_nodes[src] = {"id": src, "label": src, "color": "#B0C4D8", "size": 18, "title": f"<b>{src}</b>"}
-            if src:
-                mini_edges.append({"from": src, "to": company_name, "label": r.get("relationship_type", ""), "color": {"color": RELATIONSHIP_COLORS.get(r.get("relationship_type", ""), "#B0C4D8")}, "width": 2})
+        # (other company, edge from, edge to, type) per relationship touching this company
+        # reindex: a direction with no links is the column-less _NO_ROWS
+        rels_out = co_rels_out.reindex(columns=["target_name", "relationship_type"])
+        rels_in = co_rels_in.reindex(columns=["source_name", "relationship_type"])
+        mini_rels = [
+            *((tgt, company_name, tgt, rel_type) for tgt, rel_type in zip(
+                rels_out["target_name"].to_numpy(), rels_out["relationship_type"].to_numpy(),
+            )),
+            *((src, src, company_name, rel_type) for src, rel_type in zip(
+                rels_in["source_name"].to_numpy(), rels_in["relationship_type"].to_numpy(),
+            )),
+        ]
+        for other, frm, to, rel_type in mini_rels:
+            if not other:
+                continue
+            if other not in mini_nodes:
+                mini_nodes[other] = {"id": other, "label": other, "color": "#B0C4D8", "size": 18, "title": f"<b>{other}</b>"}
+            mini_edges.append({"from": frm, "to": to, "label": rel_type, "color": {"color": RELATIONSHIP_COLORS.get(rel_type, "#B0C4D8")}, "width": 2})
 
         if mini_edges:
             st.markdown("---")
@@ -868,7 +1303,7 @@ def show_sector_dialog(sector_name):
             return
 
         # Header
-        total_emp = sector_df["employee_count"].astype(float).sum()
+        total_emp = sector_df["employee_count"].sum()
         n_companies = len(sector_df)
         n_cities = sector_df["headquarters_city"].dropna().nunique()
 
@@ -949,23 +1384,22 @@ def show_sector_dialog(sector_name):
         top_companies = sector_df.sort_values("employee_count", ascending=False).head(15)
         display_cols = ["company_name", "headquarters_city", "ownership_type", "employee_count", "website_url", "parent_company"]
         display_cols = [c for c in display_cols if c in top_companies.columns]
-        top_display = top_companies[display_cols].copy()
         col_rename = {"company_name": "Company", "headquarters_city": "City", "ownership_type": "Ownership", "employee_count": "Employees", "website_url": "🌐 Website", "parent_company": "Parent"}
-        top_display.columns = [col_rename.get(c, c) for c in top_display.columns]
-        if "Employees" in top_display.columns:
-            top_display["Employees"] = top_display["Employees"].astype(float).map(lambda x: f"{x:,.0f}" if pd.notna(x) else "—")
-        if "🌐 Website" in top_display.columns:
-            top_display["🌐 Website"] = top_display["🌐 Website"].fillna("—")
+        top_display = top_companies[display_cols].rename(columns=col_rename)
+        # Numbers and links are formatted by the frontend, so the columns ship to it as-is
         st.dataframe(
             top_display, use_container_width=True, hide_index=True,
-            column_config={"🌐 Website": st.column_config.LinkColumn("🌐 Website", display_text="Visit")} if "🌐 Website" in top_display.columns else None,
+            column_config={
+                "Employees": st.column_config.NumberColumn("Employees", format="localized"),
+                "🌐 Website": st.column_config.LinkColumn("🌐 Website", display_text="Visit"),
+            },
         )
 
         # City breakdown
         col_chart, col_ownership = st.columns(2)
         with col_chart:
             st.markdown("##### 📍 Companies by City")
-            city_counts = sector_df["headquarters_city"].fillna("Unknown").value_counts().reset_index()
+            city_counts = _fill_unknown(sector_df["headquarters_city"]).value_counts().reset_index()
             city_counts.columns = ["City", "Count"]
             if not city_counts.empty:
                 fig_city = px.bar(
@@ -982,7 +1416,7 @@ def show_sector_dialog(sector_name):
 
         with col_ownership:
             st.markdown("##### 🏛️ Ownership Breakdown")
-            own_counts = sector_df["ownership_type"].fillna("Unknown").value_counts().reset_index()
+            own_counts = _fill_unknown(sector_df["ownership_type"]).value_counts().reset_index()
             own_counts.columns = ["Ownership", "Count"]
             if not own_counts.empty:
                 fig_own = px.pie(
@@ -1041,7 +1475,9 @@ tab_sectors, tab_directory, tab_network, tab_map, tab_events, tab_review = st.ta
 
 
 # ─── TAB 1: Sectors Overview ─────────────────────────────
-with tab_sectors:
+@st.fragment
+def render_sectors_tab():
+    """Sector cards and charts; card clicks and chart selections rerun only this tab."""
     st.markdown("#### 🏭 Sector Overview")
     st.caption("Click any sector card to see the full breakdown — biggest players, network map, and more.")
 
@@ -1050,25 +1486,15 @@ with tab_sectors:
 
         # Grid of clickable sector cards
         cols = st.columns(3)
-        for idx, (_, row) in enumerate(sector_stats.iterrows()):
-            sector_name = row["sector_name"]
-            color = SECTOR_COLORS.get(sector_name, TEAL)
-            emp = row["total_employees"]
-            inv = row["total_investment"]
-
-            inv_str = ""
-            if inv and inv > 0:
-                if inv >= 1e9:
-                    inv_str = f"{inv/1e9:.1f}B MAD"
-                elif inv >= 1e6:
-                    inv_str = f"{inv/1e6:.0f}M MAD"
-                else:
-                    inv_str = f"{inv:,.0f} MAD"
+        for idx, row in enumerate(sector_stats.itertuples(index=False)):
+            sector_name = row.sector_name
+            emp = row.total_employees
+            inv_str = row.investment_str
 
             with cols[idx % 3]:
                 icon = SECTOR_ICONS.get(sector_name, "📦")
                 inv_line = f"💰 **{inv_str}** invested  \n" if inv_str else ""
-                card_label = f"{icon} **{sector_name}**  \n🏢 {int(row['company_count'])} companies · 👥 {emp:,.0f} employees  \n{inv_line}📍 {int(row['cities'])} cities"
+                card_label = f"{icon} **{sector_name}**  \n🏢 {int(row.company_count)} companies · 👥 {emp:,.0f} employees  \n{inv_line}📍 {int(row.cities)} cities"
                 if st.button(card_label, key=f"sector_btn_{idx}", use_container_width=True):
                     show_sector_dialog(sector_name)
 
@@ -1079,20 +1505,7 @@ with tab_sectors:
 
         with col_left:
             st.markdown("##### 📊 Companies per Sector")
-            sector_counts = sector_stats.sort_values("company_count", ascending=True)
-            fig_bar = px.bar(
-                sector_counts, x="company_count", y="sector_name", orientation="h",
-                text="company_count",
-                labels={"company_count": "Companies", "sector_name": ""},
-                color="sector_name",
-                color_discrete_map=SECTOR_COLORS,
-            )
-            fig_bar.update_traces(textposition="outside")
-            fig_bar.update_layout(
-                showlegend=False, plot_bgcolor="white", paper_bgcolor="white",
-                margin=dict(l=20, r=80, t=20, b=40), height=350,
-                font=dict(family="Arial", color=NAVY),
-            )
+            fig_bar = _sector_bar_figure(sector_stats[["sector_name", "company_count"]])
             event_bar = st.plotly_chart(fig_bar, use_container_width=True, on_select="rerun", key="chart_sector_bar")
             if event_bar.selection.points:
                 _sel = event_bar.selection.points[0].get("y", "")
@@ -1105,20 +1518,12 @@ with tab_sectors:
         with col_right:
             st.markdown("##### 🏛️ Companies by Ownership Type")
             ownership_counts = (
-                df_filtered["ownership_type"].fillna("Unknown").value_counts()
+                _fill_unknown(df_filtered["ownership_type"]).value_counts()
                 .reset_index()
                 .rename(columns={"index": "ownership_type", "count": "count"})
             )
             if "ownership_type" in ownership_counts.columns and "count" in ownership_counts.columns:
-                fig_pie = px.pie(
-                    ownership_counts, names="ownership_type", values="count", hole=0.4,
-                    color_discrete_sequence=[TEAL, NAVY, SAND, CORAL, GOLD, "#AAAAAA", "#7FB3D8"],
-                )
-                fig_pie.update_layout(
-                    margin=dict(l=20, r=20, t=20, b=20), height=350,
-                    font=dict(family="Arial", color=NAVY), paper_bgcolor="white",
-                )
-                fig_pie.update_traces(textinfo="label+percent", textposition="outside")
+                fig_pie = _ownership_pie_figure(ownership_counts)
                 event_pie = st.plotly_chart(fig_pie, use_container_width=True, on_select="rerun", key="chart_own_pie")
                 if event_pie.selection.points:
                     _pt = event_pie.selection.points[0]
@@ -1131,7 +1536,7 @@ with tab_sectors:
                 # Show companies for the selected ownership type
                 if "_active_ownership" in st.session_state:
                     _own = st.session_state["_active_ownership"]
-                    matching = df_filtered[df_filtered["ownership_type"].fillna("Unknown") == _own]
+                    matching = df_filtered[_fill_unknown(df_filtered["ownership_type"]) == _own]
                     if not matching.empty:
                         st.caption(f"🏛️ **{_own}** — {len(matching)} companies:")
                         co_cols = st.columns(2)
@@ -1144,7 +1549,7 @@ with tab_sectors:
         # Sector integration targets
         if "sector_target_pct" in df_filtered.columns:
             sector_targets = (
-                df_filtered.groupby("sector_name")
+                df_filtered.groupby("sector_name", observed=True)
                 .agg(target_pct=("sector_target_pct", "first"))
                 .reset_index()
                 .dropna(subset=["target_pct"])
@@ -1153,22 +1558,7 @@ with tab_sectors:
             if not sector_targets.empty:
                 st.markdown("##### 🎯 Government Integration Targets by Sector")
                 st.caption("Target local integration rates set by Morocco's industrial strategy.")
-                sector_targets["target_pct"] = sector_targets["target_pct"].astype(float)
-                fig_target = px.bar(
-                    sector_targets, x="target_pct", y="sector_name", orientation="h",
-                    text=sector_targets["target_pct"].map(lambda x: f"{x:.0f}%"),
-                    labels={"target_pct": "Integration Target (%)", "sector_name": ""},
-                    color="target_pct",
-                    color_continuous_scale=[[0, CORAL], [0.5, SAND], [1, TEAL]],
-                )
-                fig_target.update_traces(textposition="outside")
-                fig_target.update_layout(
-                    showlegend=False, coloraxis_showscale=False,
-                    plot_bgcolor="white", paper_bgcolor="white",
-                    xaxis=dict(range=[0, 100], gridcolor="#E8E8E8"),
-                    margin=dict(l=20, r=60, t=20, b=40), height=300,
-                    font=dict(family="Arial", color=NAVY),
-                )
+                fig_target = _integration_target_figure(sector_targets)
                 event_tgt = st.plotly_chart(fig_target, use_container_width=True, on_select="rerun", key="chart_integ_tgt")
                 if event_tgt.selection.points:
                     _tsel = event_tgt.selection.points[0].get("y", "")
@@ -1180,7 +1570,7 @@ with tab_sectors:
 
                 # Source citations for integration targets
                 source_rows = (
-                    df_filtered.groupby("sector_name")
+                    df_filtered.groupby("sector_name", observed=True)
                     .agg(
                         strategy=("sector_strategy", "first"),
                         src_url=("sector_source_url", "first"),
@@ -1197,8 +1587,14 @@ with tab_sectors:
         st.info("No data matches the current filters.")
 
 
+with tab_sectors:
+    render_sectors_tab()
+
+
 # ─── TAB 2: Company Directory ────────────────────────────
-with tab_directory:
+@st.fragment
+def render_directory_tab():
+    """Paged company cards; paging and card clicks rerun only this tab."""
     st.markdown(f"#### Company Directory ({len(df_filtered)} results)")
     st.caption("Click any company to view its full profile with relationships, management, media mentions, and network map.")
 
@@ -1215,97 +1611,117 @@ with tab_directory:
         if total_pages > 1:
             st.caption(f"Showing {start + 1}–{min(end, len(company_list))} of {len(company_list)} companies  |  Page {page} of {total_pages}")
 
-        cols = st.columns(3)
-        for idx, (_, co) in enumerate(page_df.iterrows()):
-            sector = co.get("sector_name", "Unknown")
-            city = co.get("headquarters_city", "")
-            color = SECTOR_COLORS.get(sector, "#AAAAAA")
-            emp = co.get("employee_count")
-            try:
-                emp_val = float(emp) if emp and pd.notna(emp) else 0
-                emp_str = f"{emp_val:,.0f}" if emp_val > 0 else "—"
-            except (TypeError, ValueError):
-                emp_str = "—"
+        # employee_count is float32 from load, so the page's labels format column-wise
+        emp = page_df["employee_count"]
+        emp_strs = emp.where(emp > 0).map("{:,.0f}".format, na_action="ignore").fillna("—")
 
+        cols = st.columns(3)
+        for idx, (name, sector, city, emp_str) in enumerate(
+            zip(page_df["company_name"], page_df["sector_name"], page_df["headquarters_city"], emp_strs)
+        ):
             with cols[idx % 3]:
                 sector_icon = SECTOR_ICONS.get(sector, "📦")
-                card_label = f"🏢 **{co['company_name']}**  \n{sector_icon} {sector}  \n📍 {city if city else '—'} · 👥 {emp_str} employees"
+                card_label = f"🏢 **{name}**  \n{sector_icon} {sector}  \n📍 {city if city else '—'} · 👥 {emp_str} employees"
                 if st.button(card_label, key=f"co_btn_{start}_{idx}", use_container_width=True):
-                    show_company_dialog(co["company_name"])
+                    show_company_dialog(name)
     else:
         st.info("No data matches the current filters.")
 
 
+with tab_directory:
+    render_directory_tab()
+
+
 # ─── TAB 4: Interactive Network Map (vis.js) ─────────────
-with tab_network:
-    st.markdown("#### 🕸️ Industry Network Map")
-    st.caption("Interactive visualization of company relationships. Drag nodes, zoom, and click to highlight connections.")
+# Above this many edges the map switches to vis.js's cheaper rendering options
+NETWORK_LARGE_EDGES = 500
 
-    # Build network data
-    nodes = {}
-    edges = []
 
-    for _, co in df_filtered.iterrows():
-        name = co["company_name"]
-        sector = co.get("sector_name", "Unknown")
-        city = co.get("headquarters_city", "")
-        emp = co.get("employee_count", 0)
-        try:
-            emp = float(emp) if emp and pd.notna(emp) else 0
-        except (TypeError, ValueError):
-            emp = 0
+@st.cache_data(ttl=300, show_spinner=False)
+def compute_layout(node_names: tuple, edge_pairs: tuple) -> dict:
+    """Spring layout in vis.js pixel coordinates, cached per graph so reruns skip the simulation."""
+    G = nx.Graph()
+    G.add_nodes_from(node_names)
+    G.add_edges_from(edge_pairs)
+    pos = nx.spring_layout(G, seed=42, k=2)
+    scale = 150 * max(1.0, len(node_names) ** 0.5)
+    return {n: (round(float(x) * scale, 1), round(float(y) * scale, 1)) for n, (x, y) in pos.items()}
 
-        color = SECTOR_COLORS.get(sector, "#AAAAAA")
-        size = max(15, min(50, 15 + (emp / 500)))
 
-        nodes[name] = {
-            "id": name, "label": name, "color": color, "size": size,
+with tab_network:
+    st.markdown("#### 🕸️ Industry Network Map")
+    st.caption("Interactive visualization of company relationships. Drag nodes, zoom, and click to highlight connections.")
+
+    # Build network data (column arrays zipped row-wise; no per-row Series)
+    emp_arr = pd.to_numeric(df_filtered["employee_count"], errors="coerce").fillna(0)
+    size_arr = (15 + emp_arr / 500).clip(15, 50)
+    nodes = {
+        name: {
+            "id": name, "label": name, "color": SECTOR_COLORS.get(sector, "#AAAAAA"), "size": float(size),
             "title": f"<b>{name}</b><br>Sector: {sector}<br>City: {city}<br>Employees: {emp:,.0f}",
             "sector": sector,
         }
+        for name, sector, city, emp, size in zip(
+            df_filtered["company_name"].to_numpy(), df_filtered["sector_name"].to_numpy(),
+            df_filtered["headquarters_city"].to_numpy(), emp_arr.to_numpy(), size_arr.to_numpy(),
+        )
+    }
+    edges = []
+    edge_pairs = set()
+
+    def _add_missing_nodes(names):
+        for n in names:
+            if n not in nodes:
+                nodes[n] = {"id": n, "label": n, "color": "#AAAAAA", "size": 15, "title": f"<b>{n}</b>", "sector": "Unknown"}
 
     # Edges from company_relationships
     if not df_relationships.empty:
-        for _, r in df_relationships.iterrows():
-            src = r.get("source_name", "")
-            tgt = r.get("target_name", "")
-            rel_type = r.get("relationship_type", "partner")
-            desc = r.get("description", "")
-
-            if src and tgt:
-                for n in [src, tgt]:
-                    if n not in nodes:
-                        nodes[n] = {"id": n, "label": n, "color": "#AAAAAA", "size": 15, "title": f"<b>{n}</b>", "sector": "Unknown"}
-
-                edge_color = RELATIONSHIP_COLORS.get(rel_type, "#B0C4D8")
+        rel_rows = [
+            (src, tgt, rel_type, desc)
+            for src, tgt, rel_type, desc in zip(
+                df_relationships["source_name"].to_numpy(), df_relationships["target_name"].to_numpy(),
+                df_relationships["relationship_type"].to_numpy(), df_relationships["description"].to_numpy(),
+            )
+            if src and tgt
+        ]
+        _add_missing_nodes(n for src, tgt, _, _ in rel_rows for n in (src, tgt))
+        for src, tgt, rel_type, desc in rel_rows:
+            edges.append({
+                "from": src, "to": tgt, "label": rel_type,
+                "color": {"color": RELATIONSHIP_COLORS.get(rel_type, "#B0C4D8"), "opacity": 0.7},
+                "title": f"{src} → {tgt}<br>Type: {rel_type}<br>{desc}", "width": 2,
+            })
+            edge_pairs.add((src, tgt))
+
+    # Edges from partnerships (skipping pairs already linked in either direction)
+    if not df_partnerships.empty:
+        partner_color = RELATIONSHIP_COLORS.get("partner", "#B0C4D8")
+        for a, b, ptype in zip(
+            df_partnerships["company_a_name"].to_numpy(), df_partnerships["company_b_name"].to_numpy(),
+            df_partnerships["partnership_type"].to_numpy(),
+        ):
+            if not (a and b):
+                continue
+            _add_missing_nodes((a, b))
+            if (a, b) not in edge_pairs and (b, a) not in edge_pairs:
                 edges.append({
-                    "from": src, "to": tgt, "label": rel_type,
-                    "color": {"color": edge_color, "opacity": 0.7},
-                    "title": f"{src} → {tgt}<br>Type: {rel_type}<br>{desc}", "width": 2,
+                    "from": a, "to": b, "label": ptype,
+                    "color": {"color": partner_color, "opacity": 0.7},
+                    "title": f"{a} ↔ {b}<br>Type: {ptype}", "width": 2,
                 })
-
-    # Edges from partnerships
-    if not df_partnerships.empty:
-        for _, row in df_partnerships.iterrows():
-            a = row.get("company_a_name", "")
-            b = row.get("company_b_name", "")
-            ptype = row.get("partnership_type", "partner")
-
-            if a and b:
-                for n in [a, b]:
-                    if n not in nodes:
-                        nodes[n] = {"id": n, "label": n, "color": "#AAAAAA", "size": 15, "title": f"<b>{n}</b>", "sector": "Unknown"}
-                existing = {(e["from"], e["to"]) for e in edges}
-                if (a, b) not in existing and (b, a) not in existing:
-                    edges.append({
-                        "from": a, "to": b, "label": ptype,
-                        "color": {"color": RELATIONSHIP_COLORS.get("partner", "#B0C4D8"), "opacity": 0.7},
-                        "title": f"{a} ↔ {b}<br>Type: {ptype}", "width": 2,
-                    })
+                edge_pairs.add((a, b))
 
     if nodes and edges:
+        # Positions come from the cached layout, so the browser doesn't run a physics simulation on every mount
+        layout = compute_layout(tuple(nodes), tuple(sorted((e["from"], e["to"]) for e in edges)))
+        for name, node in nodes.items():
+            node["x"], node["y"] = layout[name]
         nodes_json = json.dumps(list(nodes.values()))
         edges_json = json.dumps(edges)
+        # Dense graphs: straight edges and no edge redraw while panning/zooming keep the canvas responsive
+        large_graph = len(edges) > NETWORK_LARGE_EDGES
+        edge_smooth = "false" if large_graph else "{ type: 'continuous' }"
+        hide_edges_on_move = "true" if large_graph else "false"
 
         # Legend
         rel_types_used = set(e.get("label", "") for e in edges if e.get("label"))
@@ -1343,17 +1759,7 @@ with tab_network:
                 var container = document.getElementById('network');
                 var data = {{ nodes: nodes, edges: edges }};
                 var options = {{
-                    physics: {{
-                        forceAtlas2Based: {{
-                            gravitationalConstant: -40,
-                            centralGravity: 0.005,
-                            springLength: 150,
-                            springConstant: 0.08,
-                            damping: 0.4
-                        }},
-                        solver: 'forceAtlas2Based',
-                        stabilization: {{ iterations: 150 }}
-                    }},
+                    physics: {{ enabled: false }},
                     nodes: {{
                         shape: 'dot',
                         font: {{ size: 12, color: '{NAVY}', face: 'Arial' }},
@@ -1361,7 +1767,7 @@ with tab_network:
                         borderWidthSelected: 3
                     }},
                     edges: {{
-                        smooth: {{ type: 'continuous' }},
+                        smooth: {edge_smooth},
                         font: {{ size: 9, color: '#888', align: 'middle' }},
                         arrows: {{ to: {{ enabled: true, scaleFactor: 0.5 }} }}
                     }},
@@ -1369,7 +1775,9 @@ with tab_network:
                         hover: true,
                         tooltipDelay: 200,
                         navigationButtons: true,
-                        keyboard: true
+                        keyboard: true,
+                        hideEdgesOnDrag: {hide_edges_on_move},
+                        hideEdgesOnZoom: {hide_edges_on_move}
                     }}
                 }};
                 var network = new vis.Network(container, data, options);
@@ -1398,71 +1806,72 @@ with tab_network:
 # ─── TAB 5: Map of Morocco ──────────────────────────────
 with tab_map:
     st.markdown("#### 🗺️ Industrial Map of Morocco")
-    st.caption("Dot size proportional to employee count. Click markers for details.")
+    st.caption("Dot size proportional to employee count. Hover markers for details.")
 
     if not df_filtered.empty:
         city_data = (
-            df_filtered.groupby("headquarters_city")
+            df_filtered.groupby("headquarters_city", sort=False, observed=True)
             .agg(
-                total_employees=("employee_count", lambda x: x.astype(float).sum()),
-                company_count=("company_name", "count"),
-                companies_list=("company_name", lambda x: ", ".join(x.tolist())),
+                total_employees=("employee_count", "sum"),
+                company_count=("company_name", "size"),
+                companies_list=("company_name", ", ".join),
             )
             .reset_index()
         )
 
-        m = folium.Map(location=[31.5, -7.0], zoom_start=6, tiles=None)
-        folium.TileLayer(
-            tiles="https://server.arcgisonline.com/ArcGIS/rest/services/Canvas/World_Light_Gray_Base/MapServer/tile/{z}/{y}/{x}",
-            attr="Esri, HERE, Garmin",
-            name="Esri Light Gray",
-        ).add_to(m)
-
-        for _, row in city_data.iterrows():
-            city = row["headquarters_city"]
-            coords = CITY_COORDS.get(city)
-            if not coords:
-                continue
-
-            max_emp = city_data["total_employees"].max() if city_data["total_employees"].max() > 0 else 1
-            radius = 8 + (row["total_employees"] / max_emp) * 32
-
-            popup_html = f"""
-            <div style="font-family:Arial; width:220px;">
-                <h4 style="color:{NAVY}; margin:0 0 8px 0;">{city}</h4>
-                <b>Companies:</b> {row['company_count']}<br>
-                <b>Employees:</b> {row['total_employees']:,.0f}<br>
-                <hr style="margin:6px 0;">
-                <small>{row['companies_list']}</small>
-            </div>
-            """
-
-            folium.CircleMarker(
-                location=coords, radius=radius, color=NAVY,
-                fill=True, fill_color=TEAL, fill_opacity=0.7, weight=2,
-                popup=folium.Popup(popup_html, max_width=250),
-                tooltip=f"{city}: {row['company_count']} companies, {row['total_employees']:,.0f} employees",
-            ).add_to(m)
+        # Columnar marker data: deck.gl draws every city in one WebGL pass
+        max_emp = city_data["total_employees"].max() if city_data["total_employees"].max() > 0 else 1
+        city_data = city_data.merge(CITY_COORDS_DF, on="headquarters_city", how="inner")
+        city_data["radius"] = 8 + (city_data["total_employees"] / max_emp) * 32
+        city_data["employees_label"] = city_data["total_employees"].map("{:,.0f}".format)
+
+        layers = [
+            pdk.Layer(
+                "ScatterplotLayer", data=city_data, get_position="[lon, lat]", get_radius="radius",
+                radius_units="pixels", get_fill_color=[42, 157, 143, 179], get_line_color=[27, 58, 92],
+                stroked=True, line_width_units="pixels", get_line_width=2, pickable=True,
+            )
+        ]
 
         # Relationship lines between cities
         if not df_relationships.empty:
-            drawn_pairs = set()
-            for _, r in df_relationships.iterrows():
-                src_city = r.get("source_city")
-                tgt_city = r.get("target_city")
-                if src_city and tgt_city and src_city != tgt_city:
-                    pair = tuple(sorted([src_city, tgt_city]))
-                    if pair not in drawn_pairs:
-                        src_coords = CITY_COORDS.get(src_city)
-                        tgt_coords = CITY_COORDS.get(tgt_city)
-                        if src_coords and tgt_coords:
-                            folium.PolyLine(
-                                [src_coords, tgt_coords],
-                                color=TEAL, weight=1.5, opacity=0.4, dash_array="5 5",
-                            ).add_to(m)
-                            drawn_pairs.add(pair)
-
-        st_folium(m, use_container_width=True, height=550)
+            pairs = df_relationships[["source_city", "target_city"]].dropna()
+            pairs = pairs[pairs["source_city"] != pairs["target_city"]]
+            pairs = pairs.assign(
+                a=pairs[["source_city", "target_city"]].min(axis=1),
+                b=pairs[["source_city", "target_city"]].max(axis=1),
+            ).drop_duplicates(["a", "b"])
+            lines = (
+                pairs.merge(CITY_COORDS_DF.add_prefix("src_"), left_on="source_city", right_on="src_headquarters_city")
+                .merge(CITY_COORDS_DF.add_prefix("tgt_"), left_on="target_city", right_on="tgt_headquarters_city")
+            )
+            lines = pd.DataFrame({
+                "source": lines[["src_lon", "src_lat"]].to_numpy().tolist(),
+                "target": lines[["tgt_lon", "tgt_lat"]].to_numpy().tolist(),
+            })
+            if not lines.empty:
+                layers.insert(0, pdk.Layer(
+                    "LineLayer", data=lines, get_source_position="source", get_target_position="target",
+                    get_color=[42, 157, 143, 102], get_width=1.5,
+                ))
+
+        st.pydeck_chart(
+            pdk.Deck(
+                map_style="light",
+                initial_view_state=pdk.ViewState(latitude=31.5, longitude=-7.0, zoom=5),
+                layers=layers,
+                tooltip={
+                    "html": (
+                        f'<div style="font-family:Arial; max-width:240px;"><b style="color:{NAVY};">{{headquarters_city}}</b><br>'
+                        "<b>Companies:</b> {company_count}<br><b>Employees:</b> {employees_label}<br>"
+                        "<small>{companies_list}</small></div>"
+                    ),
+                    "style": {"backgroundColor": "white", "color": "#333"},
+                },
+            ),
+            use_container_width=True,
+            height=550,
+        )
     else:
         st.info("No data matches the current filters.")
 
@@ -1472,68 +1881,187 @@ with tab_events:
     st.markdown("#### 📅 Recent Industrial Events")
 
     if not df_events.empty:
-        for _, ev in df_events.head(15).iterrows():
-            event_icon = {
-                "New Factory": "🏗️", "new_factory": "🏗️",
-                "Partnership": "🤝", "partnership": "🤝",
-                "Investment": "💰", "investment": "💰",
-                "Acquisition": "🔄", "acquisition": "🔄",
-                "Export Milestone": "📦", "export_milestone": "📦",
-                "Expansion": "📈", "expansion": "📈",
-                "hiring": "👥", "product_launch": "🚀",
-                "certification": "✅", "other": "📌",
-            }.get(ev.get("event_type", ""), "📌")
-
-            amt_str = ""
-            if ev.get("investment_amount_mad") and pd.notna(ev["investment_amount_mad"]):
-                amt = float(ev["investment_amount_mad"])
-                if amt >= 1_000_000_000:
-                    amt_str = f" — {amt / 1_000_000_000:.1f}B MAD"
-                elif amt >= 1_000_000:
-                    amt_str = f" — {amt / 1_000_000:.0f}M MAD"
-
-            date_str = ev.get("event_date", "")
-            if date_str:
-                try:
-                    date_str = pd.to_datetime(date_str).strftime("%b %d, %Y")
-                except Exception:
-                    pass
-
-            st.markdown(
-                f"""
-                <div style="background:white; padding:1.5rem; border-radius:14px;
-                            border-left:4px solid {TEAL}; margin-bottom:1rem; box-shadow: 0 1px 4px rgba(0,0,0,0.04);">
-                    <div style="display:flex; justify-content:space-between; align-items:center;">
-                        <span style="font-size:1.1rem; font-weight:600; color:{NAVY};">
-                            {event_icon} {ev.get('title', 'Event')}
-                        </span>
-                        <span style="color:#888; font-size:0.85rem;">{date_str}</span>
-                    </div>
-                    <p style="margin:0.4rem 0 0 0; color:#555; font-size:0.9rem;">
-                        <b>{ev.get('company_name', '')}</b>{amt_str}
-                        {' — ' + ev.get('city', '') if ev.get('city') else ''}
-                    </p>
-                    <p style="margin:0.3rem 0 0 0; color:#666; font-size:0.85rem;">
-                        {ev.get('description', '')}
-                    </p>
-                </div>
-                """,
-                unsafe_allow_html=True,
+        ev_df = df_events.head(15)
+        icons = ev_df["event_type"].map(EVENT_ICONS).fillna("📌")
+        raw_dates = ev_df["event_date"].fillna("").astype(str)
+        date_strs = pd.to_datetime(ev_df["event_date"], errors="coerce", format="mixed").dt.strftime("%b %d, %Y").fillna(raw_dates)
+
+        # One markdown message for all cards; fields come from scraped articles, so escape them
+        cards = []
+        for icon, title, date_str, company, amt_str, city, desc in zip(
+            icons, ev_df["title"], date_strs, ev_df["company_name"], ev_df["amt_str"], ev_df["city"], ev_df["description"],
+        ):
+            title = html.escape(str(title)) if pd.notna(title) else "Event"
+            city_str = f" — {html.escape(str(city))}" if pd.notna(city) and city else ""
+            desc = html.escape(str(desc)) if pd.notna(desc) else ""
+            cards.append(
+                f'<div style="background:white; padding:1.5rem; border-radius:14px; '
+                f'border-left:4px solid {TEAL}; margin-bottom:1rem; box-shadow: 0 1px 4px rgba(0,0,0,0.04);">'
+                f'<div style="display:flex; justify-content:space-between; align-items:center;">'
+                f'<span style="font-size:1.1rem; font-weight:600; color:{NAVY};">{icon} {title}</span>'
+                f'<span style="color:#888; font-size:0.85rem;">{date_str}</span></div>'
+                f'<p style="margin:0.4rem 0 0 0; color:#555; font-size:0.9rem;">'
+                f"<b>{html.escape(str(company))}</b>{amt_str}{city_str}</p>"
+                f'<p style="margin:0.3rem 0 0 0; color:#666; font-size:0.85rem;">{desc}</p>'
+                f"</div>"
             )
+        st.markdown("\n".join(cards), unsafe_allow_html=True)
     else:
         st.info("No events recorded yet.")
 
 
 # ─── TAB 7: Review Queue ─────────────────────────────────
-with tab_review:
-    from review_ui.review_helpers import load_review_items, get_review_stats, approve_item, reject_item, get_pipeline_stats
+# Pending items per page; the bootstrap RPC returns the first page with the stats
+REVIEW_PAGE_SIZE = 20
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_review_dashboard():
+    """Stats, recent runs and pending items for the Review tab.
+
+    Cleared whenever a batch is applied, so the TTL only bounds how long
+    changes made elsewhere (pipeline runs, other reviewers) take to show.
+    """
+    from review_ui.review_helpers import RECENT_RUN_COLUMNS, get_review_dashboard
+
+    dashboard = get_review_dashboard(get_supabase_client(), limit=REVIEW_PAGE_SIZE)
+    # Build the recent-runs table here so reruns reuse it instead of re-inferring
+    # dtypes; the runs arrive projected to RECENT_RUN_COLUMNS (jsonb drops key order)
+    runs = dashboard["pipeline_stats"]["recent_runs"]
+    runs_df = pd.DataFrame(runs, columns=RECENT_RUN_COLUMNS).set_index("source_name") if runs else pd.DataFrame()
+    if not runs_df.empty:
+        runs_df["run_date"] = pd.to_datetime(runs_df["run_date"], utc=True, errors="coerce", format="ISO8601")
+        # Nullable ints, so a missing count doesn't turn the column into 10.0-style floats
+        counts = ["articles_found", "articles_new", "articles_duplicate"]
+        runs_df[counts] = runs_df[counts].apply(pd.to_numeric, errors="coerce").astype("Int64")
+    dashboard["runs_df"] = runs_df
+    return dashboard
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_review_page(page):
+    """Pending items for pages after the first (the first comes with load_review_dashboard)."""
+    from review_ui.review_helpers import load_review_items
+
+    return load_review_items(get_supabase_client(), status="pending", limit=REVIEW_PAGE_SIZE, offset=(page - 1) * REVIEW_PAGE_SIZE)
+
+
+# Approve/Reject clicks are queued in st.session_state["review_actions"] and written in one batch
+def _queue_review_action(action, review_id):
+    entry = {"action": action, "id": review_id}
+    if action == "reject":
+        entry["notes"] = st.session_state.get(f"reject_notes_{review_id}", "")
+    st.session_state["review_actions"].append(entry)
+
+
+def _unqueue_review_action(review_id):
+    st.session_state["review_actions"] = [a for a in st.session_state["review_actions"] if a["id"] != review_id]
+
+
+def _review_action_bar():
+    """Queued-action count with Apply/Discard; renders nothing while the queue is empty."""
+    from review_ui.review_helpers import apply_review_actions
+
+    review_actions = st.session_state["review_actions"]
+    if not review_actions:
+        return
+    n_queued = len(review_actions)
+    n_approve = sum(a["action"] == "approve" for a in review_actions)
+    q1, q2, q3 = st.columns([3, 1, 1])
+    with q1:
+        st.markdown(f"**{n_queued}** queued — {n_approve} to approve, {n_queued - n_approve} to reject")
+    with q2:
+        apply_clicked = st.button(f"Apply {n_queued} action{'s' if n_queued > 1 else ''}", key="apply_review_actions", type="primary")
+    with q3:
+        st.button("Discard", key="discard_review_actions", on_click=review_actions.clear)
+    if apply_clicked:
+        failed = apply_review_actions(get_supabase_client(), review_actions)
+        review_actions.clear()
+        load_review_dashboard.clear()
+        load_review_page.clear()
+        if failed:
+            st.session_state["review_toast"] = (f"{len(failed)} of {n_queued} actions failed and are still pending. Check logs.", "⚠️")
+        else:
+            st.session_state["review_toast"] = (f"Applied {n_queued} review action{'s' if n_queued > 1 else ''}.", "✅")
+        # Queue clicks only rerun the review tab; applying a batch reruns the
+        # whole app so every view picks up the written rows
+        st.rerun()
+
+
+def _review_card(item, expanded):
+    """One pending item; its Approve/Reject/Undo buttons rerun the review tab fragment, action bar included."""
+    ext = item["extracted_data"] if isinstance(item["extracted_data"], dict) else {}
+    conf_pct = f"{item['confidence_score']:.0%}" if item["confidence_score"] else "N/A"
+    company = ext.get("company_name", "Unknown Company")
+    queued = next((a for a in st.session_state["review_actions"] if a["id"] == item["id"]), None)
+
+    with st.expander(
+        f"[{conf_pct}] **{company}** — {item['source_name']} ({item.get('published_date', '')[:10]})",
+        expanded=expanded,
+    ):
+        if queued:
+            u1, u2 = st.columns([3, 1])
+            with u1:
+                st.markdown(f"Queued to **{queued['action']}**; apply the batch above to write it.")
+            with u2:
+                st.button("↩️ Undo", key=f"undo_{item['id']}", on_click=_unqueue_review_action, args=(item["id"],))
+            return
 
+        col_left, col_right = st.columns([3, 1])
+        with col_left:
+            st.markdown(f"**Article**: {item['article_title']}")
+            if item["source_url"]:
+                st.markdown(f"**Source**: [{item['source_name']}]({item['source_url']})")
+            snippet = (item.get("article_text") or "")[:500]
+            if snippet:
+                st.text_area("Article Preview", value=snippet + "...", height=120, disabled=True, key=f"preview_{item['id']}")
+        with col_right:
+            st.metric("Confidence", conf_pct)
+            st.markdown(f"**Flagged**: {item['reason_flagged']}")
+
+        st.markdown("**Extracted Data:**")
+        d1, d2 = st.columns(2)
+        with d1:
+            st.markdown(f"- **Company**: {ext.get('company_name', 'N/A')}")
+            st.markdown(f"- **Sector**: {ext.get('sector', 'N/A')}")
+            st.markdown(f"- **City**: {ext.get('city', 'N/A')}")
+            st.markdown(f"- **Sub-sector**: {ext.get('sub_sector', 'N/A')}")
+        with d2:
+            st.markdown(f"- **Event**: {ext.get('event_type', 'N/A')}")
+            amt = ext.get("investment_amount_mad")
+            st.markdown(f"- **Investment (MAD)**: {f'{amt:,.0f}' if amt else 'N/A'}")
+            partners = ext.get("partner_companies", [])
+            st.markdown(f"- **Partners**: {', '.join(partners) if partners else 'None'}")
+            st.markdown(f"- **Summary**: {ext.get('source_summary', ext.get('article_summary', 'N/A'))}")
+
+        a1, a2, a3 = st.columns(3)
+        with a1:
+            st.button("✅ Approve", key=f"approve_{item['id']}", on_click=_queue_review_action, args=("approve", item["id"]))
+        with a2:
+            # A form, so typing the reason doesn't rerun anything until Reject is pressed
+            with st.form(f"reject_form_{item['id']}", clear_on_submit=True, border=False):
+                st.text_input("Rejection reason", key=f"reject_notes_{item['id']}", placeholder="Optional...")
+                st.form_submit_button("❌ Reject", on_click=_queue_review_action, args=("reject", item["id"]))
+        with a3:
+            st.markdown("*Edit & Approve coming soon*")
+
+
+@st.fragment
+def render_review_tab():
+    """Review queue: stats, the pending-action bar and the item cards; card clicks rerun only this tab."""
     st.markdown("#### ✅ Human-in-the-Loop Review Queue")
     st.markdown("Review and approve low-confidence extractions before they enter the database.")
 
-    sb = get_supabase_client()
+    st.session_state.setdefault("review_actions", [])
+    # Shown after the rerun that follows an applied batch; a toast doesn't shift the layout
+    toast = st.session_state.pop("review_toast", None)
+    if toast:
+        st.toast(toast[0], icon=toast[1])
+    _review_action_bar()
+
+    review_dashboard = load_review_dashboard()
 
-    p_stats = get_pipeline_stats(sb)
+    p_stats = review_dashboard["pipeline_stats"]
     pcol1, pcol2, pcol3, pcol4 = st.columns(4)
     with pcol1:
         st.metric("Total Articles Scraped", p_stats["total_articles"])
@@ -1546,7 +2074,7 @@ with tab_review:
 
     st.divider()
 
-    r_stats = get_review_stats(sb)
+    r_stats = review_dashboard["review_stats"]
     rcol1, rcol2, rcol3, rcol4 = st.columns(4)
     with rcol1:
         st.metric("Pending Review", r_stats["pending"])
@@ -1559,88 +2087,47 @@ with tab_review:
 
     st.divider()
 
-    review_items = load_review_items(sb, status="pending", limit=20)
+    review_items = review_dashboard["items"]
 
     if not review_items:
         st.success("No items pending review. The pipeline is running smoothly.")
     else:
-        st.info(f"**{len(review_items)}** items awaiting your review")
+        n_pending = max(r_stats["pending"], len(review_items))
+        total_pages = max(1, (n_pending + REVIEW_PAGE_SIZE - 1) // REVIEW_PAGE_SIZE)
+        st.info(f"**{n_pending}** items awaiting your review")
+        page = st.number_input("Page", min_value=1, max_value=total_pages, value=1, step=1, key="review_page", label_visibility="collapsed") if total_pages > 1 else 1
+        if page > 1:
+            review_items = load_review_page(page)
+        if total_pages > 1:
+            start = (page - 1) * REVIEW_PAGE_SIZE
+            st.caption(f"Showing {start + 1}–{start + len(review_items)} of {n_pending}  |  Page {page} of {total_pages}")
 
         for idx, item in enumerate(review_items):
-            ext = item["extracted_data"] if isinstance(item["extracted_data"], dict) else {}
-            conf_pct = f"{item['confidence_score']:.0%}" if item["confidence_score"] else "N/A"
-            company = ext.get("company_name", "Unknown Company")
-
-            with st.expander(
-                f"[{conf_pct}] **{company}** — {item['source_name']} ({item.get('published_date', '')[:10]})",
-                expanded=(idx == 0),
-            ):
-                col_left, col_right = st.columns([3, 1])
-                with col_left:
-                    st.markdown(f"**Article**: {item['article_title']}")
-                    if item["source_url"]:
-                        st.markdown(f"**Source**: [{item['source_name']}]({item['source_url']})")
-                    snippet = (item.get("article_text") or "")[:500]
-                    if snippet:
-                        st.text_area("Article Preview", value=snippet + "...", height=120, disabled=True, key=f"preview_{idx}")
-                with col_right:
-                    st.metric("Confidence", conf_pct)
-                    st.markdown(f"**Flagged**: {item['reason_flagged']}")
-
-                st.markdown("**Extracted Data:**")
-                d1, d2 = st.columns(2)
-                with d1:
-                    st.markdown(f"- **Company**: {ext.get('company_name', 'N/A')}")
-                    st.markdown(f"- **Sector**: {ext.get('sector', 'N/A')}")
-                    st.markdown(f"- **City**: {ext.get('city', 'N/A')}")
-                    st.markdown(f"- **Sub-sector**: {ext.get('sub_sector', 'N/A')}")
-                with d2:
-                    st.markdown(f"- **Event**: {ext.get('event_type', 'N/A')}")
-                    amt = ext.get("investment_amount_mad")
-                    st.markdown(f"- **Investment (MAD)**: {f'{amt:,.0f}' if amt else 'N/A'}")
-                    partners = ext.get("partner_companies", [])
-                    st.markdown(f"- **Partners**: {', '.join(partners) if partners else 'None'}")
-                    st.markdown(f"- **Summary**: {ext.get('source_summary', ext.get('article_summary', 'N/A'))}")
-
-                a1, a2, a3 = st.columns(3)
-                with a1:
-                    if st.button("✅ Approve", key=f"approve_{item['id']}"):
-                        if approve_item(sb, item["id"]):
-                            st.success(f"Approved! {company} added to database.")
-                            st.rerun()
-                        else:
-                            st.error("Failed to approve. Check logs.")
-                with a2:
-                    reject_notes = st.text_input("Rejection reason", key=f"reject_notes_{item['id']}", placeholder="Optional...")
-                    if st.button("❌ Reject", key=f"reject_{item['id']}"):
-                        if reject_item(sb, item["id"], notes=reject_notes):
-                            st.info(f"Rejected: {company}")
-                            st.rerun()
-                        else:
-                            st.error("Failed to reject.")
-                with a3:
-                    st.markdown("*Edit & Approve coming soon*")
+            _review_card(item, expanded=(idx == 0))
 
     if p_stats["recent_runs"]:
         st.divider()
         st.markdown("#### 🤖 Recent Scraper Runs")
-        runs_df = pd.DataFrame(p_stats["recent_runs"])
-        if not runs_df.empty:
-            display_cols = [c for c in ["source_name", "run_date", "articles_found", "articles_new", "articles_duplicate", "status"] if c in runs_df.columns]
-            st.dataframe(runs_df[display_cols], use_container_width=True, hide_index=True)
+        if not review_dashboard["runs_df"].empty:
+            # A handful of rows: a static table, not the interactive grid
+            st.table(review_dashboard["runs_df"])
+
+
+with tab_review:
+    render_review_tab()
 
 
 # ── Footer ───────────────────────────────────────────────
+FOOTER_HTML = f"""
+<div style="text-align:center; padding:1rem 0; color:{NAVY};">
+    <b>MIIM</b> — Morocco Industry Intelligence Monitor<br>
+    <span style="font-size:0.85rem; color:#888;">
+        Open-source &middot; Data-driven &middot; Transparent<br>
+        Built with Streamlit, Supabase, and vis.js
+    </span>
+</div>
+"""
+
 st.markdown("---")
-st.markdown(
-    f"""
-    <div style="text-align:center; padding:1rem 0; color:{NAVY};">
-        <b>MIIM</b> — Morocco Industry Intelligence Monitor<br>
-        <span style="font-size:0.85rem; color:#888;">
-            Open-source &middot; Data-driven &middot; Transparent<br>
-            Built with Streamlit, Supabase, and vis.js
-        </span>
-    </div>
-    """,
-    unsafe_allow_html=True,
-)
+# Static HTML: st.html sends it as-is, no markdown pass
+st.html(FOOTER_HTML)
@@ -10,42 +10,84 @@ from typing import Optional
 
 logger = logging.getLogger("miim.review")
 
+# Scraper-run columns the review tab's recent-runs table shows, in display order
+RECENT_RUN_COLUMNS = ("source_name", "run_date", "articles_found", "articles_new", "articles_duplicate", "status")
 
-def load_review_items(supabase_client, status: str = "pending", limit: int = 50) -> list[dict]:
-    """Load review queue items with article details."""
+
+def load_review_items(supabase_client, status: str = "pending", limit: int = 50, offset: int = 0) -> list[dict]:
+    """Load review queue items with article details, newest first (offset for paging)."""
     try:
         response = (
             supabase_client.table("review_queue")
             .select("*, articles!review_queue_article_id_fkey(title, source_url, source_name, article_text, published_date)")
             .eq("status", status)
             .order("created_at", desc=True)
-            .limit(limit)
+            .range(offset, offset + limit - 1)
             .execute()
         )
-        items = []
-        for row in response.data or []:
-            article = row.get("articles", {}) or {}
-            items.append({
-                "id": row["id"],
-                "article_id": row["article_id"],
-                "extraction_result_id": row.get("extraction_result_id"),
-                "extracted_data": row["extracted_data"],
-                "confidence_score": row["confidence_score"],
-                "reason_flagged": row.get("reason_flagged", "low_confidence"),
-                "status": row["status"],
-                "created_at": row["created_at"],
-                "article_title": article.get("title", "Unknown"),
-                "source_url": article.get("source_url", ""),
-                "source_name": article.get("source_name", "unknown"),
-                "article_text": article.get("article_text", ""),
-                "published_date": article.get("published_date", ""),
-            })
-        return items
+        return [_review_item_from_row(row) for row in response.data or []]
     except Exception as e:
         logger.error(f"Failed to load review items: {e}")
         return []
 
 
+def _review_item_from_row(row: dict) -> dict:
+    """Flatten a review_queue row and its embedded article."""
+    article = row.get("articles", {}) or {}
+    return {
+        "id": row["id"],
+        "article_id": row["article_id"],
+        "extraction_result_id": row.get("extraction_result_id"),
+        "extracted_data": row["extracted_data"],
+        "confidence_score": row["confidence_score"],
+        "reason_flagged": row.get("reason_flagged", "low_confidence"),
+        "status": row["status"],
+        "created_at": row["created_at"],
+        "article_title": article.get("title", "Unknown"),
+        "source_url": article.get("source_url", ""),
+        "source_name": article.get("source_name", "unknown"),
+        "article_text": article.get("article_text", ""),
+        "published_date": article.get("published_date", ""),
+    }
+
+
+def get_review_dashboard(supabase_client, days: int = 7, limit: int = 20) -> dict:
+    """Pipeline stats, review stats and pending items for the review tab in one call.
+
+    Uses the review_dashboard_bootstrap RPC (supabase/migrations) and falls
+    back to get_pipeline_stats / get_review_stats / load_review_items.
+    """
+    try:
+        data = supabase_client.rpc(
+            "review_dashboard_bootstrap", {"days": days, "limit_n": limit}
+        ).execute().data or {}
+        p_stats = data.get("pipeline_stats") or {}
+        r_stats = data.get("review_stats") or {}
+        return {
+            "pipeline_stats": {
+                "total_articles": int(p_stats.get("total_articles") or 0),
+                "pending_extraction": int(p_stats.get("pending_extraction") or 0),
+                "extracted": int(p_stats.get("extracted") or 0),
+                "total_cost_usd": round(float(p_stats.get("total_cost_usd") or 0), 4),
+                "recent_runs": p_stats.get("recent_runs") or [],
+            },
+            "review_stats": {
+                "pending": int(r_stats.get("pending") or 0),
+                "approved_7d": int(r_stats.get("approved_7d") or 0),
+                "rejected_7d": int(r_stats.get("rejected_7d") or 0),
+                "avg_confidence": float(r_stats.get("avg_confidence") or 0.0),
+            },
+            "items": [_review_item_from_row(row) for row in data.get("items") or []],
+        }
+    except Exception as e:
+        logger.warning(f"review_dashboard_bootstrap RPC failed, querying separately: {e}")
+    return {
+        "pipeline_stats": get_pipeline_stats(supabase_client),
+        "review_stats": get_review_stats(supabase_client, days=days),
+        "items": load_review_items(supabase_client, status="pending", limit=limit),
+    }
+
+
 def get_review_stats(supabase_client, days: int = 7) -> dict:
     """Get review queue statistics."""
     try:
@@ -208,6 +250,31 @@ def reject_item(supabase_client, review_id: str, notes: str = "") -> bool:
         return False
 
 
+def apply_review_actions(supabase_client, actions: list[dict]) -> list[str]:
+    """Apply queued review actions and return the ids that failed.
+
+    Each action is {"action": "approve" | "reject", "id": ..., "notes": ...}.
+    Uses the batch_review_actions RPC (supabase/migrations) for a single
+    round-trip and falls back to approve_item / reject_item per action.
+    """
+    if not actions:
+        return []
+    try:
+        result = supabase_client.rpc("batch_review_actions", {"actions": actions}).execute().data or {}
+        return [str(review_id) for review_id in result.get("failed") or []]
+    except Exception as e:
+        logger.warning(f"batch_review_actions RPC failed, applying one by one: {e}")
+    failed = []
+    for action in actions:
+        if action["action"] == "approve":
+            ok = approve_item(supabase_client, action["id"])
+        else:
+            ok = reject_item(supabase_client, action["id"], notes=action.get("notes", ""))
+        if not ok:
+            failed.append(str(action["id"]))
+    return failed
+
+
 def get_pipeline_stats(supabase_client) -> dict:
     """Get overall pipeline statistics for the dashboard."""
     try:
@@ -220,7 +287,7 @@ def get_pipeline_stats(supabase_client) -> dict:
 
         runs = (
             supabase_client.table("scraper_runs")
-            .select("*")
+            .select(", ".join(RECENT_RUN_COLUMNS))
             .order("run_date", desc=True)
             .limit(5)
             .execute()
@@ -0,0 +1,44 @@
+-- ══════════════════════════════════════════════════════════
+-- Admin dashboard summary RPCs
+-- Aggregate server-side so PostgREST returns a single row instead of
+-- shipping every pipeline_costs row to the client.
+-- ══════════════════════════════════════════════════════════
+
+create or replace function public.get_cost_summary()
+returns table (
+    total_cost_usd numeric,
+    total_input_tokens bigint,
+    total_output_tokens bigint,
+    total_calls bigint
+)
+language sql
+stable
+as $$
+    select
+        coalesce(sum(cost_usd), 0),
+        coalesce(sum(input_tokens), 0)::bigint,
+        coalesce(sum(output_tokens), 0)::bigint,
+        count(*)
+    from public.pipeline_costs;
+$$;
+
+-- All four Overview tab counters in one round-trip
+create or replace function public.get_overview_stats()
+returns table (
+    total_companies bigint,
+    total_articles bigint,
+    pending_reviews bigint,
+    total_cost_usd numeric
+)
+language sql
+stable
+as $$
+    select
+        (select count(*) from public.companies),
+        (select count(*) from public.articles),
+        (select count(*) from public.review_queue where status = 'pending'),
+        (select coalesce(sum(cost_usd), 0) from public.pipeline_costs);
+$$;
+
+grant execute on function public.get_cost_summary() to anon, authenticated;
+grant execute on function public.get_overview_stats() to anon, authenticated;
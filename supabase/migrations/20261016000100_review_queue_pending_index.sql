@@ -0,0 +1,4 @@
+-- Partial index for the admin "pending reviews" count and review queue listing
+create index if not exists review_queue_pending_idx
+    on public.review_queue (status)
+    where status = 'pending';
@@ -0,0 +1,16 @@
+-- Distinct article sources for the admin Articles filter dropdown
+create index if not exists articles_source_name_idx
+    on public.articles (source_name);
+
+create or replace function public.list_article_sources()
+returns table (source_name text)
+language sql
+stable
+as $$
+    select distinct a.source_name
+    from public.articles a
+    where a.source_name is not null
+    order by 1;
+$$;
+
+grant execute on function public.list_article_sources() to anon, authenticated;
@@ -0,0 +1,11 @@
+-- Admin Articles list: newest first with keyset pagination on (scraped_date, id)
+create index if not exists articles_scraped_desc_idx
+    on public.articles (scraped_date desc, id desc)
+    include (source_name, processing_status, title, published_date, language, source_url);
+
+-- Same ordering when filtered by processing status or source
+create index if not exists articles_status_scraped_idx
+    on public.articles (processing_status, scraped_date desc, id desc);
+
+create index if not exists articles_source_scraped_idx
+    on public.articles (source_name, scraped_date desc, id desc);
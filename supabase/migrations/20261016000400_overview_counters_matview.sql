@@ -0,0 +1,66 @@
+-- ══════════════════════════════════════════════════════════
+-- Overview counters as a materialized view
+-- count(*) on articles scans the whole table; the admin Overview reads
+-- these numbers on every load, so keep them precomputed and refresh the
+-- view after writes (once per statement, so batch inserts refresh once).
+-- ══════════════════════════════════════════════════════════
+
+create materialized view if not exists public.overview_counters as
+select
+    1 as id,
+    (select count(*) from public.companies) as total_companies,
+    (select count(*) from public.articles) as total_articles,
+    (select count(*) from public.review_queue where status = 'pending') as pending_reviews,
+    (select coalesce(sum(cost_usd), 0) from public.pipeline_costs) as total_cost_usd;
+
+-- REFRESH ... CONCURRENTLY needs a unique index
+create unique index if not exists overview_counters_id_idx on public.overview_counters (id);
+
+create or replace function public.refresh_overview_counters()
+returns trigger
+language plpgsql
+security definer
+set search_path = public
+as $$
+begin
+    refresh materialized view concurrently public.overview_counters;
+    return null;
+end;
+$$;
+
+drop trigger if exists companies_refresh_overview on public.companies;
+create trigger companies_refresh_overview
+    after insert or delete on public.companies
+    for each statement execute function public.refresh_overview_counters();
+
+drop trigger if exists articles_refresh_overview on public.articles;
+create trigger articles_refresh_overview
+    after insert or delete on public.articles
+    for each statement execute function public.refresh_overview_counters();
+
+drop trigger if exists review_queue_refresh_overview on public.review_queue;
+create trigger review_queue_refresh_overview
+    after insert or delete or update of status on public.review_queue
+    for each statement execute function public.refresh_overview_counters();
+
+drop trigger if exists pipeline_costs_refresh_overview on public.pipeline_costs;
+create trigger pipeline_costs_refresh_overview
+    after insert or delete or update of cost_usd on public.pipeline_costs
+    for each statement execute function public.refresh_overview_counters();
+
+grant select on public.overview_counters to anon, authenticated;
+
+-- The Overview RPC now reads the precomputed row
+create or replace function public.get_overview_stats()
+returns table (
+    total_companies bigint,
+    total_articles bigint,
+    pending_reviews bigint,
+    total_cost_usd numeric
+)
+language sql
+stable
+as $$
+    select total_companies, total_articles, pending_reviews, total_cost_usd
+    from public.overview_counters;
+$$;
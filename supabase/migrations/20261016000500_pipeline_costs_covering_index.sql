@@ -0,0 +1,10 @@
+-- Covering index for the admin Pipeline Costs tab: the newest-first listing
+-- walks it in order, and the cost summary can sum it with an index-only scan
+-- instead of reading the heap.
+--
+-- Verify with:
+--   explain analyze select * from pipeline_costs order by logged_at desc limit 100;
+--   explain analyze select sum(cost_usd), sum(input_tokens), sum(output_tokens), count(*) from pipeline_costs;
+create index if not exists pipeline_costs_logged_at_idx
+    on public.pipeline_costs (logged_at desc)
+    include (cost_usd, input_tokens, output_tokens);
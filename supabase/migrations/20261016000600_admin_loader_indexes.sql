@@ -0,0 +1,47 @@
+-- ══════════════════════════════════════════════════════════
+-- Indexes for the admin loaders' filters, sort orders and embeds
+-- (articles, review_queue pending and pipeline_costs are covered by the
+-- earlier migrations). Verify each with EXPLAIN ANALYZE on the matching
+-- PostgREST query, e.g.:
+--   explain analyze select * from review_queue
+--       where status = 'pending' order by created_at desc limit 100;
+-- ══════════════════════════════════════════════════════════
+
+-- Companies: ordered by name, filtered by sector / ownership / tier
+create index if not exists companies_name_idx on public.companies (company_name);
+create index if not exists companies_sector_idx on public.companies (sector_id, company_name);
+create index if not exists companies_ownership_idx on public.companies (ownership_type, company_name);
+create index if not exists companies_tier_idx on public.companies (tier_level, company_name);
+
+-- Sectors: ordered by name
+create index if not exists sectors_name_idx on public.sectors (sector_name);
+
+-- Relationships: newest first, plus both company foreign keys used by the embeds
+create index if not exists company_relationships_created_desc_idx
+    on public.company_relationships (created_at desc);
+create index if not exists company_relationships_source_idx
+    on public.company_relationships (source_company_id);
+create index if not exists company_relationships_target_idx
+    on public.company_relationships (target_company_id);
+
+-- People: filtered by company, ordered by name
+create index if not exists company_people_company_name_idx
+    on public.company_people (company_id, person_name);
+
+-- Events: newest first, joined to companies
+create index if not exists events_date_desc_idx on public.events (event_date desc);
+create index if not exists events_company_idx on public.events (company_id);
+
+-- Extraction results: newest first, joined to articles
+create index if not exists extraction_results_created_desc_idx
+    on public.extraction_results (created_at desc);
+create index if not exists extraction_results_article_idx
+    on public.extraction_results (article_id);
+
+-- Review queue: any status, newest first
+create index if not exists review_queue_status_created_idx
+    on public.review_queue (status, created_at desc);
+create index if not exists review_queue_article_idx on public.review_queue (article_id);
+
+-- Scraper runs: newest first
+create index if not exists scraper_runs_run_date_desc_idx on public.scraper_runs (run_date desc);
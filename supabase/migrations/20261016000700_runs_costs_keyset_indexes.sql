@@ -0,0 +1,10 @@
+-- Keyset pagination for the admin Scraper Runs and Pipeline Costs tabs:
+-- (sort column desc, id desc) matches the ORDER BY and the cursor filter,
+-- and INCLUDE carries the listed columns so pages come from the index alone.
+create index if not exists scraper_runs_run_date_id_idx
+    on public.scraper_runs (run_date desc, id desc)
+    include (source_name, articles_found, articles_new, articles_duplicate, processing_time_seconds, status);
+
+create index if not exists pipeline_costs_logged_at_id_idx
+    on public.pipeline_costs (logged_at desc, id desc)
+    include (model, input_tokens, output_tokens, cost_usd, article_id, extraction_result_id);
@@ -0,0 +1,72 @@
+-- ══════════════════════════════════════════════════════════
+-- One RPC per admin tab
+-- Each returns a jsonb object holding every result set the tab renders,
+-- so the tab costs a single PostgREST round-trip.
+-- ══════════════════════════════════════════════════════════
+
+-- Pipeline Costs: summary totals + first page of rows (logged_at desc, id desc)
+create or replace function public.costs_tab(limit_n int default 100)
+returns jsonb
+language sql
+stable
+as $$
+    select jsonb_build_object(
+        'summary', (
+            select jsonb_build_object(
+                'total_cost_usd', coalesce(sum(cost_usd), 0),
+                'total_input_tokens', coalesce(sum(input_tokens), 0),
+                'total_output_tokens', coalesce(sum(output_tokens), 0),
+                'total_calls', count(*)
+            )
+            from public.pipeline_costs
+        ),
+        'rows', coalesce((
+            select jsonb_agg(t order by t.logged_at desc, t.id desc)
+            from (
+                select id, logged_at, model, input_tokens, output_tokens, cost_usd, article_id, extraction_result_id
+                from public.pipeline_costs
+                order by logged_at desc, id desc
+                limit limit_n
+            ) t
+        ), '[]'::jsonb)
+    );
+$$;
+
+-- Overview: counters + most recent scraper runs and articles
+create or replace function public.overview_tab(limit_n int default 10)
+returns jsonb
+language sql
+stable
+as $$
+    select jsonb_build_object(
+        'stats', (
+            select to_jsonb(c)
+            from (
+                select total_companies, total_articles, pending_reviews, total_cost_usd
+                from public.overview_counters
+            ) c
+        ),
+        'runs', coalesce((
+            select jsonb_agg(t order by t.run_date desc, t.id desc)
+            from (
+                select id, source_name, run_date, articles_found, articles_new, articles_duplicate,
+                       processing_time_seconds, status, error_message
+                from public.scraper_runs
+                order by run_date desc, id desc
+                limit limit_n
+            ) t
+        ), '[]'::jsonb),
+        'articles', coalesce((
+            select jsonb_agg(t order by t.scraped_date desc, t.id desc)
+            from (
+                select id, source_name, source_url, title, published_date, language, processing_status, scraped_date
+                from public.articles
+                order by scraped_date desc, id desc
+                limit limit_n
+            ) t
+        ), '[]'::jsonb)
+    );
+$$;
+
+grant execute on function public.costs_tab(int) to anon, authenticated;
+grant execute on function public.overview_tab(int) to anon, authenticated;
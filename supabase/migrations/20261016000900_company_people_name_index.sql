@@ -0,0 +1,14 @@
+-- People tab: load_people_admin orders by person_name, unfiltered or per company.
+-- PostgREST's ORDER BY uses the column's (database default) collation, so the
+-- index is built in that collation; an index under another collation such as
+-- "und-x-icu" could not serve the sort. INCLUDE covers PEOPLE_COLUMNS so the
+-- listing is an index-only scan.
+create index if not exists company_people_person_name_idx
+    on public.company_people (person_name)
+    include (id, company_id, role_title, role_type);
+
+-- Per-company filter: replace the bare (company_id, person_name) index with a covering one
+create index if not exists company_people_company_name_cov_idx
+    on public.company_people (company_id, person_name)
+    include (id, role_title, role_type);
+drop index if exists public.company_people_company_name_idx;
@@ -0,0 +1,64 @@
+-- Dashboard bootstrap: ship only the company columns app.py reads
+-- (COMPANY_COLUMNS in app.py) instead of to_jsonb(c) of the whole row.
+create or replace function public.load_dashboard_bootstrap()
+returns jsonb
+language sql
+stable
+as $$
+    select jsonb_build_object(
+        'companies', coalesce((
+            select jsonb_agg(
+                jsonb_build_object(
+                    'id', c.id,
+                    'company_id', c.company_id,
+                    'company_name', c.company_name,
+                    'sector_id', c.sector_id,
+                    'sub_sector', c.sub_sector,
+                    'headquarters_city', c.headquarters_city,
+                    'ownership_type', c.ownership_type,
+                    'tier_level', c.tier_level,
+                    'employee_count', c.employee_count,
+                    'revenue_mad', c.revenue_mad,
+                    'capital_mad', c.capital_mad,
+                    'investment_amount_mad', c.investment_amount_mad,
+                    'local_integration_pct', c.local_integration_pct,
+                    'website_url', c.website_url,
+                    'parent_company', c.parent_company,
+                    'description', c.description,
+                    'activities', c.activities,
+                    'sector_name', coalesce(s.sector_name, 'Unknown'),
+                    'sector_target_pct', s.target_integration_pct,
+                    'sector_current_pct', s.current_integration_pct,
+                    'sector_source_url', s.source_url,
+                    'sector_source_name', s.source_name_detail,
+                    'sector_strategy', s.government_strategy
+                )
+                order by c.company_name
+            )
+            from public.companies c
+            left join public.sectors s on s.sector_id = c.sector_id
+        ), '[]'::jsonb),
+        'partnerships', coalesce((
+            select jsonb_agg(
+                to_jsonb(p) || jsonb_build_object(
+                    'company_a_name', coalesce(a.company_name, '?'),
+                    'company_a_tier', case when a.company_id is null then 'Unknown' else a.tier_level end,
+                    'company_b_name', coalesce(b.company_name, '?'),
+                    'company_b_tier', case when b.company_id is null then 'Unknown' else b.tier_level end
+                )
+            )
+            from public.partnerships p
+            left join public.companies a on a.company_id = p.company_a_id
+            left join public.companies b on b.company_id = p.company_b_id
+            where p.status = 'Active'
+        ), '[]'::jsonb),
+        'events', coalesce((
+            select jsonb_agg(
+                to_jsonb(e) || jsonb_build_object('company_name', coalesce(c.company_name, '?'))
+                order by e.event_date desc nulls first
+            )
+            from public.events e
+            left join public.companies c on c.company_id = e.company_id
+        ), '[]'::jsonb)
+    );
+$$;
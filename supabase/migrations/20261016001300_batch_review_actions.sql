@@ -0,0 +1,112 @@
+-- ══════════════════════════════════════════════════════════
+-- Batched review actions
+-- The review tab queues approve/reject clicks client-side and applies
+-- them here in one round-trip. Mirrors review_helpers.approve_item /
+-- reject_item; each action runs in its own subtransaction, so a failing
+-- item is rolled back and reported without undoing the others.
+--
+--   actions: [{"action": "approve" | "reject", "id": <review_queue.id>, "notes": "..."}]
+--   returns: {"applied": <n>, "failed": [<id>, ...]}
+-- ══════════════════════════════════════════════════════════
+
+create or replace function public.batch_review_actions(actions jsonb)
+returns jsonb
+language plpgsql
+as $$
+declare
+    act jsonb;
+    rq public.review_queue%rowtype;
+    data jsonb;
+    v_company_id public.companies.company_id%type;
+    v_sector_id public.sectors.sector_id%type;
+    v_event_id public.events.event_id%type;
+    applied int := 0;
+    failed jsonb := '[]'::jsonb;
+begin
+    for act in select * from jsonb_array_elements(coalesce(actions, '[]'::jsonb)) loop
+        begin
+            -- Cast the id through the table's row type so this works whatever the key type is
+            select * into rq
+            from public.review_queue
+            where id = (jsonb_populate_record(null::public.review_queue, jsonb_build_object('id', act->'id'))).id;
+            if not found then
+                raise exception 'review item % not found', act->>'id';
+            end if;
+
+            if act->>'action' = 'reject' then
+                update public.review_queue
+                set status = 'rejected', reviewer_notes = coalesce(act->>'notes', ''), reviewed_at = now()
+                where id = rq.id;
+                update public.articles set processing_status = 'skipped' where id = rq.article_id;
+
+            elsif act->>'action' = 'approve' then
+                data := rq.extracted_data;
+                if coalesce(data->>'company_name', '') = '' then
+                    raise exception 'no company_name in review item %', rq.id;
+                end if;
+
+                v_company_id := null;
+                v_event_id := null;
+                select company_id into v_company_id
+                from public.companies
+                where company_name ilike '%' || (data->>'company_name') || '%'
+                limit 1;
+
+                if v_company_id is null then
+                    v_sector_id := null;
+                    if coalesce(data->>'sector', '') <> '' then
+                        select sector_id into v_sector_id
+                        from public.sectors
+                        where sector_name ilike '%' || (data->>'sector') || '%'
+                        limit 1;
+                    end if;
+                    insert into public.companies
+                        (company_name, sector_id, sub_sector, headquarters_city, ownership_type, tier_level, data_confidence)
+                    values
+                        (data->>'company_name', v_sector_id, data->>'sub_sector', data->>'city', 'Unknown', 'Unknown', rq.confidence_score)
+                    returning company_id into v_company_id;
+                end if;
+
+                insert into public.events
+                    (company_id, event_type, title, description, city, investment_amount_mad, source_summary, confidence_score)
+                values (
+                    v_company_id,
+                    case coalesce(data->>'event_type', 'other')
+                        when 'new_factory' then 'New Factory'
+                        when 'partnership' then 'Partnership'
+                        when 'investment' then 'Investment'
+                        when 'acquisition' then 'Acquisition'
+                        when 'export_milestone' then 'Export Milestone'
+                        else 'Other'
+                    end,
+                    left(coalesce(data->>'source_summary', 'Event: ' || (data->>'company_name')), 200),
+                    data->>'source_summary',
+                    data->>'city',
+                    (data->>'investment_amount_mad')::numeric,
+                    data->>'source_summary',
+                    rq.confidence_score
+                )
+                returning event_id into v_event_id;
+
+                update public.review_queue
+                set status = 'approved', reviewed_at = now(),
+                    linked_company_id = v_company_id, linked_event_id = v_event_id
+                where id = rq.id;
+                update public.articles set processing_status = 'reviewed' where id = rq.article_id;
+
+            else
+                raise exception 'unknown review action %', act->>'action';
+            end if;
+
+            applied := applied + 1;
+        exception when others then
+            raise warning 'batch_review_actions: % failed: %', act->>'id', sqlerrm;
+            failed := failed || jsonb_build_array(act->'id');
+        end;
+    end loop;
+
+    return jsonb_build_object('applied', applied, 'failed', failed);
+end;
+$$;
+
+grant execute on function public.batch_review_actions(jsonb) to anon, authenticated;
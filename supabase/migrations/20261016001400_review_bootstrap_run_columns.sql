@@ -0,0 +1,61 @@
+-- Review tab bootstrap: recent_runs carries only the columns the runs table
+-- shows (RECENT_RUN_COLUMNS in review_ui/review_helpers.py), not whole rows.
+create or replace function public.review_dashboard_bootstrap(days int default 7, limit_n int default 20)
+returns jsonb
+language sql
+stable
+as $$
+    select jsonb_build_object(
+        'pipeline_stats', jsonb_build_object(
+            'total_articles', (select count(*) from public.articles),
+            'pending_extraction', (select count(*) from public.articles where processing_status = 'pending'),
+            'extracted', (select count(*) from public.articles where processing_status = 'extracted'),
+            'total_cost_usd', (select coalesce(sum(cost_usd), 0) from public.pipeline_costs),
+            'recent_runs', coalesce((
+                select jsonb_agg(to_jsonb(r) order by r.run_date desc)
+                from (
+                    select source_name, run_date, articles_found, articles_new, articles_duplicate, status
+                    from public.scraper_runs
+                    order by run_date desc
+                    limit 5
+                ) r
+            ), '[]'::jsonb)
+        ),
+        'review_stats', jsonb_build_object(
+            'pending', (select count(*) from public.review_queue where status = 'pending'),
+            'approved_7d', (
+                select count(*) from public.review_queue
+                where status = 'approved' and reviewed_at >= now() - make_interval(days => days)
+            ),
+            'rejected_7d', (
+                select count(*) from public.review_queue
+                where status = 'rejected' and reviewed_at >= now() - make_interval(days => days)
+            ),
+            'avg_confidence', (
+                select coalesce(avg(confidence_score), 0) from public.review_queue
+                where status = 'pending' and confidence_score <> 0
+            )
+        ),
+        'items', coalesce((
+            select jsonb_agg(
+                to_jsonb(q) || jsonb_build_object('articles', (
+                    select jsonb_build_object(
+                        'title', a.title, 'source_url', a.source_url, 'source_name', a.source_name,
+                        'article_text', a.article_text, 'published_date', a.published_date
+                    )
+                    from public.articles a
+                    where a.id = q.article_id
+                ))
+                order by q.created_at desc
+            )
+            from (
+                select * from public.review_queue
+                where status = 'pending'
+                order by created_at desc
+                limit limit_n
+            ) q
+        ), '[]'::jsonb)
+    );
+$$;
+
+grant execute on function public.review_dashboard_bootstrap(int, int) to anon, authenticated;
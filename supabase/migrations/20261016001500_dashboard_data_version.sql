@@ -0,0 +1,61 @@
+-- ══════════════════════════════════════════════════════════
+-- Dashboard data version
+-- A counter bumped by every write to the tables the dashboard loads.
+-- app.py keys its day-long loader caches on dashboard_data_version(), so
+-- unchanged data is never refetched and a write is picked up on the next
+-- version check (once a minute) instead of after a fixed TTL.
+-- ══════════════════════════════════════════════════════════
+
+create table if not exists public.dashboard_version (
+    id int primary key default 1 check (id = 1),
+    version bigint not null default 0
+);
+
+insert into public.dashboard_version (id, version) values (1, 0)
+on conflict (id) do nothing;
+
+alter table public.dashboard_version enable row level security;
+
+create or replace function public.bump_dashboard_data_version()
+returns trigger
+language plpgsql
+security definer
+set search_path = public
+as $$
+begin
+    update public.dashboard_version set version = version + 1 where id = 1;
+    return null;
+end;
+$$;
+
+create or replace function public.dashboard_data_version()
+returns bigint
+language sql
+stable
+security definer
+set search_path = public
+as $$
+    select version from public.dashboard_version where id = 1;
+$$;
+
+grant execute on function public.dashboard_data_version() to anon, authenticated;
+
+-- One statement-level trigger per table: a bulk upsert bumps the version once
+do $$
+declare
+    t text;
+begin
+    foreach t in array array[
+        'companies', 'sectors', 'partnerships', 'events',
+        'company_relationships', 'company_people', 'company_articles', 'articles'
+    ] loop
+        execute format('drop trigger if exists bump_dashboard_data_version on public.%I', t);
+        execute format(
+            'create trigger bump_dashboard_data_version
+             after insert or update or delete or truncate on public.%I
+             for each statement execute function public.bump_dashboard_data_version()',
+            t
+        );
+    end loop;
+end;
+$$;
@@ -0,0 +1,96 @@
+-- ══════════════════════════════════════════════════════════
+-- Overview counters: throttled refresh on read
+-- The per-statement refresh triggers made every single-row article and
+-- pipeline_costs insert recount all four tables inside the writer's
+-- transaction. Writers no longer touch the view; instead the Overview
+-- RPCs refresh it when the last refresh is older than a minute, and at
+-- most one caller refreshes at a time (the rest read the current row).
+-- ══════════════════════════════════════════════════════════
+
+drop trigger if exists companies_refresh_overview on public.companies;
+drop trigger if exists articles_refresh_overview on public.articles;
+drop trigger if exists review_queue_refresh_overview on public.review_queue;
+drop trigger if exists pipeline_costs_refresh_overview on public.pipeline_costs;
+drop function if exists public.refresh_overview_counters();
+
+create table if not exists public.overview_counters_refresh (
+    id int primary key default 1 check (id = 1),
+    refreshed_at timestamptz not null default now()
+);
+
+insert into public.overview_counters_refresh (id) values (1)
+on conflict (id) do nothing;
+
+alter table public.overview_counters_refresh enable row level security;
+
+create or replace function public.refresh_overview_counters_if_stale(max_age interval default interval '60 seconds')
+returns void
+language plpgsql
+security definer
+set search_path = public
+as $$
+begin
+    if exists (select 1 from public.overview_counters_refresh where refreshed_at > now() - max_age) then
+        return;
+    end if;
+    -- Another caller is already refreshing: serve the current row rather than queue behind it
+    if not pg_try_advisory_xact_lock(hashtext('public.overview_counters')) then
+        return;
+    end if;
+    refresh materialized view concurrently public.overview_counters;
+    update public.overview_counters_refresh set refreshed_at = now() where id = 1;
+end;
+$$;
+
+-- Both readers become volatile: PostgREST runs stable functions read-only,
+-- and each statement of a volatile SQL function sees the refreshed view
+create or replace function public.get_overview_stats()
+returns table (
+    total_companies bigint,
+    total_articles bigint,
+    pending_reviews bigint,
+    total_cost_usd numeric
+)
+language sql
+volatile
+as $$
+    select public.refresh_overview_counters_if_stale();
+    select total_companies, total_articles, pending_reviews, total_cost_usd
+    from public.overview_counters;
+$$;
+
+create or replace function public.overview_tab(limit_n int default 10)
+returns jsonb
+language sql
+volatile
+as $$
+    select public.refresh_overview_counters_if_stale();
+    select jsonb_build_object(
+        'stats', (
+            select to_jsonb(c)
+            from (
+                select total_companies, total_articles, pending_reviews, total_cost_usd
+                from public.overview_counters
+            ) c
+        ),
+        'runs', coalesce((
+            select jsonb_agg(t order by t.run_date desc, t.id desc)
+            from (
+                select id, source_name, run_date, articles_found, articles_new, articles_duplicate,
+                       processing_time_seconds, status, error_message
+                from public.scraper_runs
+                order by run_date desc, id desc
+                limit limit_n
+            ) t
+        ), '[]'::jsonb),
+        'articles', coalesce((
+            select jsonb_agg(t order by t.scraped_date desc, t.id desc)
+            from (
+                select id, source_name, source_url, title, published_date, language, processing_status, scraped_date
+                from public.articles
+                order by scraped_date desc, id desc
+                limit limit_n
+            ) t
+        ), '[]'::jsonb)
+    );
+$$;
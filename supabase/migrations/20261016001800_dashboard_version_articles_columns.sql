@@ -0,0 +1,13 @@
+-- ══════════════════════════════════════════════════════════
+-- Dashboard data version: narrow the articles trigger
+-- The pipeline updates articles.processing_status once per article, which
+-- bumped the version (and refetched every dashboard cache) throughout a
+-- run. The dashboard only shows an article's title, link, source and date,
+-- so only those columns (plus inserts and deletes) bump it now.
+-- ══════════════════════════════════════════════════════════
+
+drop trigger if exists bump_dashboard_data_version on public.articles;
+create trigger bump_dashboard_data_version
+    after insert or delete or truncate or update of title, source_url, source_name, published_date
+    on public.articles
+    for each statement execute function public.bump_dashboard_data_version();
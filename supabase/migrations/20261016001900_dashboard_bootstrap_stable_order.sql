@@ -0,0 +1,103 @@
+-- Dashboard bootstrap: ship companies (name, then id), relationships, people
+-- and article mentions in a fixed order. The dashboard caches row positions
+-- and filter codes for these frames per data version, so every fetch of one
+-- version must return the rows in the same order.
+create or replace function public.load_dashboard_bootstrap()
+returns jsonb
+language sql
+stable
+as $$
+    select jsonb_build_object(
+        'companies', coalesce((
+            select jsonb_agg(
+                jsonb_build_object(
+                    'id', c.id,
+                    'company_id', c.company_id,
+                    'company_name', c.company_name,
+                    'sector_id', c.sector_id,
+                    'sub_sector', c.sub_sector,
+                    'headquarters_city', c.headquarters_city,
+                    'ownership_type', c.ownership_type,
+                    'tier_level', c.tier_level,
+                    'employee_count', c.employee_count,
+                    'revenue_mad', c.revenue_mad,
+                    'capital_mad', c.capital_mad,
+                    'investment_amount_mad', c.investment_amount_mad,
+                    'local_integration_pct', c.local_integration_pct,
+                    'website_url', c.website_url,
+                    'parent_company', c.parent_company,
+                    'description', c.description,
+                    'activities', c.activities,
+                    'sector_name', coalesce(s.sector_name, 'Unknown'),
+                    'sector_target_pct', s.target_integration_pct,
+                    'sector_current_pct', s.current_integration_pct,
+                    'sector_source_url', s.source_url,
+                    'sector_source_name', s.source_name_detail,
+                    'sector_strategy', s.government_strategy
+                )
+                order by c.company_name, c.id
+            )
+            from public.companies c
+            left join public.sectors s on s.sector_id = c.sector_id
+        ), '[]'::jsonb),
+        'partnerships', coalesce((
+            select jsonb_agg(
+                to_jsonb(p) || jsonb_build_object(
+                    'company_a_name', coalesce(a.company_name, '?'),
+                    'company_a_tier', case when a.company_id is null then 'Unknown' else a.tier_level end,
+                    'company_b_name', coalesce(b.company_name, '?'),
+                    'company_b_tier', case when b.company_id is null then 'Unknown' else b.tier_level end
+                )
+            )
+            from public.partnerships p
+            left join public.companies a on a.company_id = p.company_a_id
+            left join public.companies b on b.company_id = p.company_b_id
+            where p.status = 'Active'
+        ), '[]'::jsonb),
+        'events', coalesce((
+            select jsonb_agg(
+                to_jsonb(e) || jsonb_build_object('company_name', coalesce(c.company_name, '?'))
+                order by e.event_date desc nulls first
+            )
+            from public.events e
+            left join public.companies c on c.company_id = e.company_id
+        ), '[]'::jsonb),
+        'relationships', coalesce((
+            select jsonb_agg(
+                to_jsonb(r) || jsonb_build_object(
+                    'source_name', coalesce(src.company_name, '?'),
+                    'source_city', src.headquarters_city,
+                    'target_name', coalesce(tgt.company_name, '?'),
+                    'target_city', tgt.headquarters_city
+                )
+                order by r.id
+            )
+            from public.company_relationships r
+            left join public.companies src on src.id = r.source_company_id
+            left join public.companies tgt on tgt.id = r.target_company_id
+        ), '[]'::jsonb),
+        'people', coalesce((
+            select jsonb_agg(
+                to_jsonb(p) || jsonb_build_object('company_name', coalesce(c.company_name, '?'))
+                order by p.id
+            )
+            from public.company_people p
+            left join public.companies c on c.id = p.company_id
+        ), '[]'::jsonb),
+        'articles', coalesce((
+            select jsonb_agg(
+                to_jsonb(ca) || jsonb_build_object(
+                    'company_name', coalesce(c.company_name, '?'),
+                    'article_title', coalesce(a.title, '?'),
+                    'article_url', coalesce(a.source_url, ''),
+                    'article_source', coalesce(a.source_name, ''),
+                    'article_date', coalesce(to_jsonb(a.published_date), '""'::jsonb)
+                )
+                order by ca.id
+            )
+            from public.company_articles ca
+            left join public.companies c on c.id = ca.company_id
+            left join public.articles a on a.id = ca.article_id
+        ), '[]'::jsonb)
+    );
+$$;